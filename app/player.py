@@ -1,4 +1,15 @@
+import heapq
+import itertools
+import operator
 import random
+import sys
+import weakref
+from array import array
+
+try:
+    import numpy as np # Optional, used to hash batches of UIDs
+except ImportError:
+    np = None
 
 
 class Player:
@@ -9,6 +20,8 @@ class Player:
     unique_id (str): a unique identifier for the player.
     player_name (str): the name of the player.
     """
+    __slots__ = ("_unique_id", "_player_name", "_score", "_score_listeners") # No per-instance __dict__
+
     def __init__(self, unique_id: str, player_name: str):
         """
         Initialises the player object with a unique id and a player name.
@@ -16,22 +29,182 @@ class Player:
         self._unique_id: str = unique_id
         self._player_name: str = player_name
         self._score: int = 0
+        self._score_listeners = None # Callables told about score changes, e.g. by a PlayerLeaderboard
     
     _pearson_table = list(range(256))
     random.seed(42)
     random.shuffle(_pearson_table)
+    _pearson_bytes = bytes(_pearson_table) # The same table, for bytes.translate
 
     @staticmethod
     def pearson_hash(key: str) -> int:
-        """Hashes the player UID string and returns an int which will be the index for that player (node). """
+        """Hashes the player UID string and returns an int which will be the index for that player (node).
+
+        The UID is hashed as UTF-8 bytes, so any character can be used (ASCII UIDs hash exactly as before).
+        """
         hash_ = 0
-        for char in key:
-            hash_ = Player._pearson_table[hash_ ^ ord(char)]
+        for byte in key.encode("utf-8"):
+            hash_ = Player._pearson_table[hash_ ^ byte]
+        return hash_
+
+    @staticmethod
+    def pearson_hash_wide(key: str, bits: int = 32) -> int:
+        """Hashes the player UID string into a 16, 32 or 64 bit int using the Pearson table.
+
+        Each byte of the result is a Pearson hash of the UID with the first byte offset by the byte's position,
+        so the first byte is the same as pearson_hash and the others are independent of it.
+
+        Args:
+            key (str): The player's UID.
+            bits (int): The width of the hash, one of 16, 32 or 64.
+
+        Returns:
+            int: The hash value, between 0 and 2 ** bits - 1.
+        """
+        if bits not in (16, 32, 64):
+            raise ValueError("Bits must be 16, 32 or 64.")
+        table = Player._pearson_table
+        data = key.encode("utf-8")
+        result = 0
+        for offset in range(bits // 8):
+            hash_ = table[(data[0] + offset) % 256] if data else table[offset]
+            for byte in data[1:]:
+                hash_ = table[hash_ ^ byte]
+            result = (result << 8) | hash_
+        return result
+
+    @staticmethod
+    def fnv1a_hash(key: str, bits: int = 64) -> int:
+        """Hashes the player UID string using the 32 or 64 bit FNV-1a hash.
+
+        Args:
+            key (str): The player's UID.
+            bits (int): The width of the hash, either 32 or 64.
+
+        Returns:
+            int: The hash value, between 0 and 2 ** bits - 1.
+        """
+        if bits == 32:
+            hash_, prime, mask = 0x811C9DC5, 0x01000193, 0xFFFFFFFF
+        elif bits == 64:
+            hash_, prime, mask = 0xCBF29CE484222325, 0x100000001B3, 0xFFFFFFFFFFFFFFFF
+        else:
+            raise ValueError("Bits must be 32 or 64.")
+        for byte in key.encode("utf-8"):
+            hash_ = ((hash_ ^ byte) * prime) & mask
         return hash_
 
+    @staticmethod
+    def pearson_hash_many(keys, bits: int = 8) -> list:
+        """Hashes many player UIDs at once, giving the same values as pearson_hash or pearson_hash_wide.
+
+        With NumPy installed, the UIDs are encoded into one byte matrix (a row per UID, padded to the longest)
+        and each column is hashed for every UID at once with table lookups, so the per-byte work runs in C and
+        the Python loop only runs once per column. Without NumPy the UIDs are grouped by length and each group is
+        hashed a column at a time in the same way, with bytes operations (see _pearson_hash_columns).
+
+        Args:
+            keys (iterable): The player UIDs.
+            bits (int): The width of the hashes: 8 (pearson_hash), 16, 32 or 64 (pearson_hash_wide).
+
+        Returns:
+            list: The hash of each UID, in the same order.
+        """
+        if bits not in (8, 16, 32, 64):
+            raise ValueError("Bits must be 8, 16, 32 or 64.")
+        keys = keys if isinstance(keys, (list, tuple)) else list(keys)
+        if not keys:
+            return []
+        encoded = [key.encode("utf-8") for key in keys]
+        if np is None:
+            lengths = set(map(len, encoded))
+            if len(lengths) == 1:
+                return Player._pearson_hash_columns(encoded, lengths.pop(), bits)
+            hashes = [0] * len(encoded)
+            positions_by_length = {}
+            for position, data in enumerate(encoded):
+                positions_by_length.setdefault(len(data), []).append(position)
+            for length, positions in positions_by_length.items():
+                group = Player._pearson_hash_columns([encoded[position] for position in positions], length, bits)
+                for position, hash_ in zip(positions, group):
+                    hashes[position] = hash_
+            return hashes
+        lengths = np.fromiter((len(data) for data in encoded), dtype=np.int64, count=len(encoded))
+        width = int(lengths.max())
+        joined = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        if width and int(lengths.min()) == width:
+            matrix = joined.reshape(len(encoded), width) # All UIDs the same length, no padding needed
+        else:
+            matrix = np.zeros((len(encoded), max(width, 1)), dtype=np.uint8)
+            if width:
+                # Scatter the concatenated bytes into their rows, left aligned
+                rows = np.repeat(np.arange(len(encoded)), lengths)
+                columns = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+                matrix[rows, columns] = joined
+        table = np.array(Player._pearson_table, dtype=np.uint8)
+        if bits == 8:
+            hashes = np.zeros(len(encoded), dtype=np.uint8)
+            for column in range(width):
+                hashed = table[hashes ^ matrix[:, column]]
+                hashes = np.where(lengths > column, hashed, hashes) # Rows of shorter UIDs keep their hash
+            return hashes.astype(np.int64).tolist()
+        result = np.zeros(len(encoded), dtype=np.uint64)
+        for offset in range(bits // 8):
+            # Same per-byte seeding as pearson_hash_wide, with table[offset] for empty UIDs
+            first = (matrix[:, 0].astype(np.int64) + offset) % 256
+            hashes = np.where(lengths > 0, table[first], table[offset])
+            for column in range(1, width):
+                hashed = table[hashes ^ matrix[:, column]]
+                hashes = np.where(lengths > column, hashed, hashes)
+            result = (result << np.uint64(8)) | hashes.astype(np.uint64)
+        return [int(value) for value in result.tolist()]
+
+    @staticmethod
+    def _pearson_hash_columns(encoded: list, length: int, bits: int) -> list:
+        """Hashes UIDs of the same encoded length a column of bytes at a time, without NumPy.
+
+        The hashes of every UID are kept in one bytes object. For each column, the column's bytes (a strided
+        slice of the joined UIDs) are XORed in as one big int, and bytes.translate looks up the Pearson table for
+        every UID at once, so the per-byte work runs in C.
+
+        Args:
+            encoded (list): The UTF-8 encoded UIDs, all of the given length.
+            length (int): The length of every encoded UID.
+            bits (int): The width of the hashes: 8, 16, 32 or 64.
+
+        Returns:
+            list: The hash of each UID, in the same order.
+        """
+        count = len(encoded)
+        table = Player._pearson_bytes
+        width = max(bits // 8, 1)
+        if length == 0:
+            # pearson_hash gives 0, and each byte of pearson_hash_wide is table[offset]
+            lanes = [bytes(count) if bits == 8 else bytes([table[offset]]) * count for offset in range(width)]
+        else:
+            joined = b"".join(encoded)
+            lanes = []
+            for offset in range(width):
+                # The first byte indexes the table offset by the lane, as in pearson_hash_wide
+                hashes = joined[0::length].translate(table[offset:] + table[:offset])
+                for column in range(1, length):
+                    mixed = int.from_bytes(hashes, "big") ^ int.from_bytes(joined[column::length], "big")
+                    hashes = mixed.to_bytes(count, "big").translate(table)
+                lanes.append(hashes)
+        if width == 1:
+            return list(lanes[0])
+        # Interleave the lanes into big endian words, first lane most significant
+        words = bytearray(count * width)
+        for offset, hashes in enumerate(lanes):
+            words[offset::width] = hashes
+        values = array(next(code for code in "HILQ" if array(code).itemsize == width), words)
+        if sys.byteorder == "little":
+            values.byteswap()
+        return values.tolist()
+
     def __hash__(self):
         """Returns the hash of the player's UID."""
-        return self.pearson_hash(self.uid)
+        return self.pearson_hash(self._unique_id)
 
     @property
     def uid(self) -> str:
@@ -72,7 +245,67 @@ class Player:
         """
         if not isinstance(new_score, int) or new_score < 0:
             raise ValueError("Score must be a positive integer.")
+        self._set_score_unchecked(new_score)
+
+    def _set_score_unchecked(self, new_score: int) -> None:
+        """Sets a score the caller has already validated, notifying any score listeners if it changed.
+
+        Args:
+            new_score (int): The new score of the player, a non-negative int.
+        """
+        old_score = self._score
         self._score = new_score
+        if self._score_listeners and new_score != old_score:
+            for listener in self._score_listeners:
+                listener(self, old_score)
+
+    def add_score_listener(self, listener) -> None:
+        """Registers a callable to be called as listener(player, old_score) after the score changes.
+
+        Args:
+            listener (callable): The callable to register.
+        """
+        if self._score_listeners is None:
+            self._score_listeners = []
+        self._score_listeners.append(listener)
+
+    def remove_score_listener(self, listener) -> None:
+        """Unregisters a callable registered with add_score_listener.
+
+        The listeners are copied rather than changed in place, so a listener can unregister itself while the
+        listeners are being notified.
+
+        Args:
+            listener (callable): The callable to unregister.
+        """
+        listeners = list(self._score_listeners)
+        listeners.remove(listener)
+        self._score_listeners = listeners or None
+
+    @staticmethod
+    def weak_score_listener(method):
+        """Returns a score listener that calls a bound method without keeping the method's object alive.
+
+        Structures that follow scores (e.g. PlayerLeaderboard) register one such listener on each of their players,
+        so a structure that is dropped without being cleared can still be garbage collected. Once it has been, the
+        listener unregisters itself from each player the next time that player's score changes.
+
+        Args:
+            method (callable): A bound method, called as method(player, old_score).
+
+        Returns:
+            callable: The listener to pass to add_score_listener and remove_score_listener.
+        """
+        method_ref = weakref.WeakMethod(method)
+
+        def listener(player, old_score):
+            bound_method = method_ref()
+            if bound_method is None:
+                player.remove_score_listener(listener)
+            else:
+                bound_method(player, old_score)
+
+        return listener
 
     def __str__(self) -> str:
         """Returns a human-readable string representation of the player object."""
@@ -114,23 +347,144 @@ class Player:
             return NotImplemented
         return self.score >= other.score
 
+    _TIE_BREAKS = ("name", "uid")
+
     @staticmethod
-    def sort_players(players: list) -> list:
-        """Sorts a list of Player objects in descending order based on their scores using selection sort.
+    def _sort_key(tie_break: str | None):
+        """Returns the key used to order players by descending score, with an optional ascending tie-break.
+
+        Without a tie-break the key is the score itself (sorted in reverse); with one it is a tuple of the negated
+        score and the tie-break (sorted ascending). Only the score, name and uid attributes are read, so
+        Player-like objects such as PlayerView are ordered in the same way.
+
+        Args:
+            tie_break (str | None): None, "name" or "uid".
+        """
+        if tie_break is None:
+            return operator.attrgetter("score")
+        if tie_break == "name":
+            return lambda player: (-player.score, player.name)
+        if tie_break == "uid":
+            return lambda player: (-player.score, player.uid)
+        raise ValueError(f"Tie-break must be one of {Player._TIE_BREAKS} or None.")
+
+    SORT_METHODS = ("auto", "comparison", "counting", "radix")
+    COUNTING_SORT_MIN_PLAYERS: int = 10_000 # Below this, "auto" always uses the comparison sort
+    COUNTING_SORT_MAX_RANGE_RATIO: float = 0.01 # "auto" counts when the score range is at most this fraction of n
+    COUNTING_SORT_MAX_RANGE_FACTOR: int = 64 # "counting" uses the radix sort when the range is over this times n
+    RADIX_BITS: int = 8 # Bits of the score sorted per radix sort pass
+
+    @staticmethod
+    def sort_players(players: list, tie_break: str | None = None, method: str = "auto") -> list:
+        """Sorts a list of Player (or Player-like) objects in place in descending order based on their scores.
+
+        The comparison sort is Python's built-in sort (Timsort), which is O(n log n) and stable: players with
+        equal scores keep their original order unless a tie-break is given. As scores are non-negative ints, they
+        can also be sorted without comparisons, in O(n + range) with a counting sort or O(n * digits) with a
+        radix sort, both stable and working on the scores extracted once. Being pure Python they only beat the
+        built-in sort for large lists with few distinct scores, which is when "auto" picks the counting sort.
 
         Args:
             players (list): The list of Player objects to sort.
+            tie_break (str | None): Orders players with equal scores by "name" or "uid" (ascending). Tie-breaks
+                always use the comparison sort.
+            method (str): "auto", "comparison", "counting" or "radix". "counting" allocates a bucket per score
+                in the range, so when the range is more than COUNTING_SORT_MAX_RANGE_FACTOR times the number of
+                players it uses the radix sort instead, which gives the same stable order.
 
         Returns:
-            list: The sorted list of Player objects.
-        """
-        n = len(players)
-        for i in range(n):
-            # Assume the max is the first element
-            max_idx = i
-            for j in range(i + 1, n):
-                if players[j].score > players[max_idx].score:
-                    max_idx = j
-            # Swap the found maximum element with the first element
-            players[i], players[max_idx] = players[max_idx], players[i]
+            list: The same list, now sorted.
+        """
+        if method not in Player.SORT_METHODS:
+            raise ValueError(f"Sort method must be one of {Player.SORT_METHODS}.")
+        if method == "auto" and len(players) < Player.COUNTING_SORT_MIN_PLAYERS:
+            method = "comparison"
+        if tie_break is None and method != "comparison" and len(players) > 1:
+            scores = [player.score for player in players]
+            low, high = min(scores), max(scores)
+            if method == "auto" and high - low + 1 <= len(players) * Player.COUNTING_SORT_MAX_RANGE_RATIO:
+                method = "counting"
+            elif method == "counting" and high - low + 1 > len(players) * Player.COUNTING_SORT_MAX_RANGE_FACTOR:
+                method = "radix" # Too many buckets for the number of players
+            if method == "counting":
+                players[:] = Player._counting_sort(players, scores, low, high)
+                return players
+            if method == "radix":
+                players[:] = Player._radix_sort(players, scores, high)
+                return players
+        key = Player._sort_key(tie_break)
+        players.sort(key=key, reverse=tie_break is None)
         return players
+
+    @staticmethod
+    def _counting_sort(players: list, scores: list, low: int, high: int) -> list:
+        """Returns the players in descending order of score using a stable counting sort.
+
+        Args:
+            players (list): The players to sort.
+            scores (list): The score of each player.
+            low (int): The lowest score.
+            high (int): The highest score.
+        """
+        buckets = [[] for _ in range(high - low + 1)]
+        for player, score in zip(players, scores):
+            buckets[high - score].append(player) # Highest score in the first bucket
+        return list(itertools.chain.from_iterable(buckets))
+
+    @staticmethod
+    def _radix_sort(players: list, scores: list, high: int) -> list:
+        """Returns the players in descending order of score using a stable least significant digit radix sort.
+
+        Sorting the keys (high - score) in ascending order puts the highest scores first.
+
+        Args:
+            players (list): The players to sort.
+            scores (list): The score of each player.
+            high (int): The highest score.
+        """
+        bits = Player.RADIX_BITS
+        mask = (1 << bits) - 1
+        items = [(high - score, player) for player, score in zip(players, scores)]
+        largest_key = max(item[0] for item in items)
+        shift = 0
+        while largest_key >> shift:
+            buckets = [[] for _ in range(mask + 1)]
+            for item in items:
+                buckets[(item[0] >> shift) & mask].append(item)
+            items = list(itertools.chain.from_iterable(buckets))
+            shift += bits
+        return [player for _, player in items]
+
+    @staticmethod
+    def sorted_players(players, tie_break: str | None = None, method: str = "auto") -> list:
+        """Returns a new list of the players in descending order of score, leaving the input unchanged.
+
+        Args:
+            players (iterable): The Player objects to sort.
+            tie_break (str | None): Orders players with equal scores by "name" or "uid" (ascending).
+            method (str): "auto", "comparison", "counting" or "radix" (see sort_players).
+
+        Returns:
+            list: The sorted players.
+        """
+        return Player.sort_players(list(players), tie_break=tie_break, method=method)
+
+    @staticmethod
+    def top_k(players, k: int, tie_break: str | None = None) -> list:
+        """Returns the k players with the highest scores, in descending order of score.
+
+        Uses a heap of at most k players, so it costs O(n log k) rather than sorting every player. The result is
+        the same as the first k players of sorted_players.
+
+        Args:
+            players (iterable): The Player objects to choose from.
+            k (int): The number of players to return.
+            tie_break (str | None): Orders players with equal scores by "name" or "uid" (ascending).
+
+        Returns:
+            list: The top k players.
+        """
+        key = Player._sort_key(tie_break)
+        if tie_break is None:
+            return heapq.nlargest(k, players, key=key)
+        return heapq.nsmallest(k, players, key=key)
@@ -0,0 +1,58 @@
+import math
+
+
+class PlayerBloomFilter:
+    """A Bloom filter of player UIDs, used to answer "definitely not present" without searching a hash map.
+
+    A UID that was added is always reported as possibly present. A UID that was never added is reported as
+    absent, except for a small false positive rate that depends on how many UIDs were added compared to the
+    `expected_items` the filter was sized for. UIDs cannot be removed; the filter is rebuilt instead.
+    """
+
+    def __init__(self, expected_items: int, error_rate: float = 0.01):
+        """Initialises an empty filter sized for the expected number of UIDs.
+
+        Args:
+            expected_items (int): The number of UIDs the filter is sized for.
+            error_rate (float): The false positive rate once expected_items UIDs have been added.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1.")
+        expected_items = max(1, expected_items)
+        self.expected_items = expected_items
+        self.error_rate = error_rate
+        # Optimal number of bits and hash functions for the expected items and error rate
+        self._size = max(8, math.ceil(-expected_items * math.log(error_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._size / expected_items * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, key: str):
+        """Yields the bit positions for a UID using double hashing of the built-in string hash.
+
+        The built-in hash is computed in C and cached on the string, so checking the filter is cheaper than
+        searching a bucket. It is randomised per Python process, which is fine as the filter is never saved.
+        """
+        hash_ = hash(key) & 0xFFFFFFFFFFFFFFFF
+        first = hash_ & 0xFFFFFFFF
+        second = (hash_ >> 32) | 1 # Odd, so the positions don't repeat early
+        size = self._size
+        for i in range(self._hash_count):
+            yield (first + i * second) % size
+
+    def add(self, key: str) -> None:
+        """Adds a UID to the filter.
+
+        Args:
+            key (str): The player's UID.
+        """
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        """Returns False if the UID was definitely never added, True if it may have been."""
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
@@ -2,6 +2,7 @@ from app.player import Player
 
 class PlayerBNode:
     """A class that represents a node in the BST, containing a Player object. """
+    __slots__ = ("_player", "_left", "_right", "_height")
 
     def __init__(self, player: Player):
         """Initialises a node with the given Player object.
@@ -12,6 +13,7 @@ class PlayerBNode:
         self._player = player
         self._left = None # Left child
         self._right = None # Right child
+        self._height = 1 # Height of the subtree rooted here, kept up to date by a balanced PlayerBST
 
     @property
     def player(self) -> Player:
@@ -53,4 +55,38 @@ class PlayerBNode:
         Args:
             node (PlayerBNode): The node to be set as the right child.
         """
-        self._right = node
\ No newline at end of file
+        self._right = node
+
+    @property
+    def height(self) -> int:
+        """Returns the height of the subtree rooted at this node, as last recorded by a balanced PlayerBST. """
+        return self._height
+
+    @height.setter
+    def height(self, height: int):
+        """Sets the recorded height of the subtree rooted at this node.
+
+        Args:
+            height (int): The height, 1 for a leaf.
+        """
+        self._height = height
+
+
+class LeanPlayerBNode:
+    """A BST node with the same interface as PlayerBNode, storing the player and children as plain attributes.
+
+    Skipping the property calls of PlayerBNode makes descending the tree faster. Used by passing
+    node_type=LeanPlayerBNode to PlayerBST.
+    """
+    __slots__ = ("player", "left", "right", "height")
+
+    def __init__(self, player: Player):
+        """Initialises a node with the given Player object.
+
+        Args:
+            player (Player): The Player object to be stored in this node.
+        """
+        self.player = player
+        self.left = None # Left child
+        self.right = None # Right child
+        self.height = 1 # Height of the subtree rooted here, kept up to date by a balanced PlayerBST
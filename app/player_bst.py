@@ -1,13 +1,37 @@
 from app.player import Player
 from app.player_bnode import PlayerBNode
+from app.player_dump import dump_players
+
+
+def _height(node) -> int:
+    """Returns the recorded height of a subtree, 0 for an empty one."""
+    return node.height if node is not None else 0
 
 
 class PlayerBST:
-    """A class that represents a Binary Search Tree (BST) for Player objects. """
+    """A class that represents a Binary Search Tree (BST) for Player objects.
+
+    By default the tree is not rebalanced on insert, so its shape depends on the order the players were inserted
+    in (inserting them in name order makes it a linked list). A balanced tree is an AVL tree: every node records
+    its height, and each insert rotates the nodes on its path so the two subtrees of any node differ in height by
+    at most one, keeping the height O(log n).
+    """
 
-    def __init__(self):
-        """Initialises the BST with a root node set to None. """
+    def __init__(self, node_type: type = PlayerBNode, balanced: bool = False):
+        """Initialises the BST with a root node set to None.
+
+        Args:
+            node_type (type): The class used for new nodes, PlayerBNode or LeanPlayerBNode.
+            balanced (bool): If True, rebalance the tree (AVL) on every insert.
+        """
         self._root = None
+        self._node_type = node_type
+        self._balanced = balanced
+
+    @property
+    def balanced(self) -> bool:
+        """Returns True if the tree rebalances itself on insert. """
+        return self._balanced
 
     @property
     def root(self):
@@ -20,32 +44,98 @@ class PlayerBST:
         self._root = node
 
     def insert(self, player : Player):
-        """Inserts a Player object into the BST using the player's name as the key. """
+        """Inserts a Player object into the BST using the player's name as the key.
+
+        Walks down the tree in a loop rather than recursing, so a deep unbalanced tree can't reach Python's
+        recursion limit. A player with the same name as an existing one replaces it.
+        """
         if self._root is None:
-            self._root = PlayerBNode(player)
-        else:
-            self._insert_recursive(self.root, player)
+            self._root = self._node_type(player)
+            return
+        name = player.name
+        path = [] # Nodes passed on the way down, only needed to rebalance
+        current_node = self._root
+        while True:
+            current_name = current_node.player.name
+            if name < current_name: # This compares by alphabetical order
+                if current_node.left is None:
+                    current_node.left = self._node_type(player)
+                    break
+                child = current_node.left
+            elif name > current_name:
+                if current_node.right is None:
+                    current_node.right = self._node_type(player)
+                    break
+                child = current_node.right
+            else:
+                # If there is a duplicate key, it updates the existing node's player
+                current_node.player = player
+                return
+            if self._balanced:
+                path.append(current_node)
+            current_node = child
+        if self._balanced:
+            path.append(current_node)
+            self._rebalance_path(path)
 
-    def _insert_recursive(self, current_node: PlayerBNode, player: Player):
-        """Recursively inserts a Player into the BST.
+    def _rebalance_path(self, path: list) -> None:
+        """Updates the heights along an insert's path from the bottom up, rotating any unbalanced node.
 
         Args:
-            current_node (PlayerBNode): The current node being compared.
-            player (Player): The Player object to insert.
+            path (list): The nodes from the root down to the parent of the inserted node.
         """
-        if player.name < current_node.player.name: # This compares by alphabetical order
-            if current_node.left is None:
-                current_node.left = PlayerBNode(player)
-            else:
-                self._insert_recursive(current_node.left, player)
-        elif player.name > current_node.player.name:
-            if current_node.right is None:
-                current_node.right = PlayerBNode(player)
-            else:
-                self._insert_recursive(current_node.right, player)
-        else:
-            # If there is a duplicate key, it updates the existing node's player
-            current_node.player = player
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            old_height = node.height
+            new_node = self._rebalance(node)
+            if new_node is not node:
+                # Reattach the rotated subtree to the node above it
+                if depth == 0:
+                    self._root = new_node
+                elif path[depth - 1].left is node:
+                    path[depth - 1].left = new_node
+                else:
+                    path[depth - 1].right = new_node
+            if new_node.height == old_height:
+                return # Heights above are unchanged, so nothing above needs rebalancing
+
+    def _rebalance(self, node: PlayerBNode) -> PlayerBNode:
+        """Updates a node's height and rotates it if its subtrees differ in height by more than one.
+
+        Returns:
+            PlayerBNode: The root of the subtree after any rotation.
+        """
+        balance = _height(node.left) - _height(node.right)
+        if balance > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        node.height = max(_height(node.left), _height(node.right)) + 1
+        return node
+
+    @staticmethod
+    def _rotate_left(node: PlayerBNode) -> PlayerBNode:
+        """Rotates a subtree left, making the node's right child its root, and updates both heights."""
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        node.height = max(_height(node.left), _height(node.right)) + 1
+        pivot.height = max(node.height, _height(pivot.right)) + 1
+        return pivot
+
+    @staticmethod
+    def _rotate_right(node: PlayerBNode) -> PlayerBNode:
+        """Rotates a subtree right, making the node's left child its root, and updates both heights."""
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        node.height = max(_height(node.left), _height(node.right)) + 1
+        pivot.height = max(_height(pivot.left), node.height) + 1
+        return pivot
 
     def in_order_traversal(self) -> list:
         """Performs an in-order traversal of the BST and returns a list of Player objects.
@@ -53,21 +143,139 @@ class PlayerBST:
         Returns:
             list: A list of Player objects in in-order traversal.
         """
-        players = []
-        self._in_order_recursive(self.root, players)
-        return players
+        return [node.player for node in self._iter_nodes()]
+
+    def _iter_nodes(self, lo: str | None = None, hi: str | None = None, reverse: bool = False):
+        """Yields the nodes with names from lo to hi (inclusive) in order of name, using an explicit stack.
+
+        Subtrees entirely outside the range are never visited, and the stack holds at most the tree's height.
+
+        Args:
+            lo (str | None): The lowest name to yield, or None for no lower bound.
+            hi (str | None): The highest name to yield, or None for no upper bound.
+            reverse (bool): If True, yield from the highest name to the lowest.
+        """
+        # Walking in reverse is the same walk with the children swapped and the bounds exchanged
+        first, last = (hi, lo) if reverse else (lo, hi)
+
+        def before_first(name):
+            return first is not None and (name > first if reverse else name < first)
+
+        def after_last(name):
+            return last is not None and (name < last if reverse else name > last)
+
+        stack = []
+        current_node = self._root
+        while True:
+            while current_node is not None:
+                if before_first(current_node.player.name):
+                    # This node and its near subtree come before the range
+                    current_node = current_node.left if reverse else current_node.right
+                else:
+                    stack.append(current_node)
+                    current_node = current_node.right if reverse else current_node.left
+            if not stack:
+                return
+            current_node = stack.pop()
+            if after_last(current_node.player.name):
+                return # Every node still to come is past the range
+            yield current_node
+            current_node = current_node.left if reverse else current_node.right
+
+    def iter_players(self, lo: str | None = None, hi: str | None = None, reverse: bool = False):
+        """Yields the players with names from lo to hi (inclusive) in order of name, lazily.
+
+        Costs O(log n + k) for k players (on a balanced tree), without building a list.
+
+        Args:
+            lo (str | None): The lowest name to yield, or None for no lower bound.
+            hi (str | None): The highest name to yield, or None for no upper bound.
+            reverse (bool): If True, yield from the highest name to the lowest.
+        """
+        for node in self._iter_nodes(lo, hi, reverse):
+            yield node.player
+
+    def count_range(self, lo: str | None = None, hi: str | None = None) -> int:
+        """Returns the number of players with names from lo to hi (inclusive).
+
+        Nodes don't record their subtree sizes, so this walks the k players in the range: O(log n + k).
+        """
+        return sum(1 for _ in self._iter_nodes(lo, hi))
+
+    def floor(self, name: str) -> Player | None:
+        """Returns the player with the greatest name less than or equal to name, or None if there isn't one."""
+        best = None
+        current_node = self._root
+        while current_node is not None:
+            current_name = current_node.player.name
+            if current_name == name:
+                return current_node.player
+            if current_name < name:
+                best = current_node
+                current_node = current_node.right
+            else:
+                current_node = current_node.left
+        return None if best is None else best.player
+
+    def ceiling(self, name: str) -> Player | None:
+        """Returns the player with the smallest name greater than or equal to name, or None if there isn't one."""
+        best = None
+        current_node = self._root
+        while current_node is not None:
+            current_name = current_node.player.name
+            if current_name == name:
+                return current_node.player
+            if current_name > name:
+                best = current_node
+                current_node = current_node.left
+            else:
+                current_node = current_node.right
+        return None if best is None else best.player
+
+    def successor(self, name: str) -> Player | None:
+        """Returns the player with the smallest name strictly greater than name, or None if there isn't one.
+
+        The name doesn't have to be in the tree, so a page of results can continue from the last name shown.
+        """
+        best = None
+        current_node = self._root
+        while current_node is not None:
+            if current_node.player.name > name:
+                best = current_node
+                current_node = current_node.left
+            else:
+                current_node = current_node.right
+        return None if best is None else best.player
+
+    def min(self) -> Player | None:
+        """Returns the player with the smallest name, or None if the tree is empty."""
+        current_node = self._root
+        if current_node is None:
+            return None
+        while current_node.left is not None:
+            current_node = current_node.left
+        return current_node.player
+
+    def max(self) -> Player | None:
+        """Returns the player with the greatest name, or None if the tree is empty."""
+        current_node = self._root
+        if current_node is None:
+            return None
+        while current_node.right is not None:
+            current_node = current_node.right
+        return current_node.player
 
-    def _in_order_recursive(self, current_node: PlayerBNode, players: list):
-        """Helper method to help test for in-order traversal.
+    def dump(self, stream, fmt: str = "text") -> int:
+        """Writes the players to a text stream in order of name, in memory proportional to the tree's height.
 
         Args:
-            current_node (PlayerBNode): The current node being traversed.
-            players (list): The list to append the Player objects to.
+            stream: A file-like object opened for writing text.
+            fmt (str): "text", "csv" or "jsonl" (see dump_players).
+
+        Returns:
+            int: The number of players written.
         """
-        if current_node is not None:
-            self._in_order_recursive(current_node.left, players)
-            players.append(current_node.player)
-            self._in_order_recursive(current_node.right, players)
+        return dump_players((node.player for node in self._iter_nodes()), stream, fmt)
 
     def search(self, name : str) -> Player:
         """Searches for a Player in the BST by name.
@@ -78,53 +286,156 @@ class PlayerBST:
         Returns:
             Player: The Player object if found, else None.
         """
-        return self._search_recursive(self.root, name)
+        # 'Remember that the name is the key for each node in the BST'.
+        current_node = self._root
+        while current_node is not None:
+            current_name = current_node.player.name
+            if name == current_name:
+                return current_node.player
+            current_node = current_node.left if name < current_name else current_node.right
+        return None
 
-    def _search_recursive(self, current_node: PlayerBNode, name: str) -> Player | None:
-        """Recursively searches for a Player in the BST.
+    @classmethod
+    def from_players(cls, players, presorted: bool = False, node_type: type = PlayerBNode, balanced: bool = False):
+        """Creates a perfectly balanced BST of many players in one pass, instead of inserting them one by one.
 
-        'Remember that the name is the key for each node in the BST'.
+        Players with the same name are deduplicated the way insert does it: the last one wins.
 
         Args:
-            current_node (PlayerBNode): The current node being examined.
-            name (str): The name of the Player to search for.
+            players (iterable): The players to add.
+            presorted (bool): If True, the players are trusted to already be in name order and aren't sorted.
+            node_type (type): The class used for new nodes, PlayerBNode or LeanPlayerBNode.
+            balanced (bool): If True, later inserts keep the tree balanced (see PlayerBST).
 
         Returns:
-            Player: The Player object if found, else None.
+            PlayerBST: The new tree.
         """
-        if current_node is None:
-            return None
-        if name == current_node.player.name:
-            return current_node.player
-        elif name < current_node.player.name:
-            return self._search_recursive(current_node.left, name)
-        else:
-            return self._search_recursive(current_node.right, name)
+        bst = cls(node_type=node_type, balanced=balanced)
+        if not presorted:
+            players = sorted(players, key=lambda player: player.name) # Stable, so equal names keep their order
+        unique = []
+        for player in players:
+            if unique and unique[-1].name == player.name:
+                unique[-1] = player
+            else:
+                unique.append(player)
+        players_iter = iter(unique)
+        bst._root = bst._build_balanced_bst(lambda: node_type(next(players_iter)), len(unique))
+        return bst
+
+    def merge(self, other: "PlayerBST") -> None:
+        """Moves every player of another BST into this one, leaving the other tree empty, in O(n + m) time.
+
+        Both trees are flattened into vines and the two vines are merged like sorted lists, relinking the
+        existing nodes, before the result is rebuilt as a balanced tree. Where both trees have a player with the
+        same name, the other tree's player replaces this one's, as if it had been inserted.
+
+        Args:
+            other (PlayerBST): The tree whose players are moved into this one.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a tree into itself.")
+        mine, my_count = self._to_vine()
+        theirs, their_count = other._to_vine()
+        other._root = None
+        head = tail = None
+        count = 0
+        while mine is not None or theirs is not None:
+            if theirs is None or (mine is not None and mine.player.name < theirs.player.name):
+                node, mine = mine, mine.right
+            elif mine is None or theirs.player.name < mine.player.name:
+                node, theirs = theirs, theirs.right
+            else:
+                # Same name: keep this tree's node, holding the other tree's player
+                mine.player = theirs.player
+                node, mine, theirs = mine, mine.right, theirs.right
+            if tail is None:
+                head = node
+            else:
+                tail.right = node
+            tail = node
+            count += 1
+        self._root = self._build_from_vine(head, count)
 
     def balance(self):
-        """Balances the BST by creating a new Balanced BST from the sorted list of players."""
-        # Step a: Get the sorted list of players
-        players_list = self.in_order_traversal()
-        # Step b and c: Build the balanced BST
-        self._root = self._build_balanced_bst(players_list)
+        """Balances the BST in O(n) time, relinking the existing nodes instead of copying the players.
+
+        Step a: Rotate the tree into a "vine", a chain of right children in name order, which needs no extra memory.
+        Step b and c: Rebuild the tree from the vine, making the middle node of each range its root. The nodes
+        are taken from the vine in order, so the only extra memory is the O(log n) depth of the rebuild.
+        """
+        # Step a: Flatten the tree into a vine
+        vine, count = self._to_vine()
+        # Step b and c: Build the balanced BST from the vine's nodes
+        self._root = self._build_from_vine(vine, count)
+
+    def _to_vine(self) -> tuple:
+        """Rotates the tree into a chain of right children in name order, without any extra memory.
+
+        Returns:
+            tuple: The first node of the vine (None for an empty tree) and the number of nodes.
+        """
+        count = 0
+        vine_head = None
+        vine_tail = None
+        current_node = self._root
+        while current_node is not None:
+            left = current_node.left
+            if left is not None:
+                # Rotate right, lifting the left child above the current node
+                current_node.left = left.right
+                left.right = current_node
+                current_node = left
+            else:
+                if vine_tail is None:
+                    vine_head = current_node
+                else:
+                    vine_tail.right = current_node
+                vine_tail = current_node
+                count += 1
+                current_node = current_node.right
+        return vine_head, count
+
+    def _build_from_vine(self, vine_head: PlayerBNode | None, count: int) -> PlayerBNode | None:
+        """Builds a balanced BST from the nodes of a vine, relinking them.
+
+        Args:
+            vine_head (PlayerBNode | None): The first node of the vine.
+            count (int): The number of nodes in the vine.
+
+        Returns:
+            PlayerBNode: The root node of the balanced BST.
+        """
+        cursor = vine_head
+
+        def next_node():
+            nonlocal cursor
+            node = cursor
+            cursor = node.right
+            return node
+
+        return self._build_balanced_bst(next_node, count)
 
-    def _build_balanced_bst(self, players_list: list) -> PlayerBNode | None:
-        """Recursively builds a balanced BST from the sorted list of players.
+    def _build_balanced_bst(self, next_node, count: int) -> PlayerBNode | None:
+        """Recursively builds a balanced BST from nodes supplied in name order.
 
         Args:
-            players_list (list): The sorted list of Player objects.
+            next_node (callable): Returns the next node in name order. Its children are overwritten.
+            count (int): The number of nodes to take.
 
         Returns:
             PlayerBNode: The root node of the balanced BST.
         """
-        if not players_list:
+        if count == 0:
             return None
-        # Step b: Pick the middle element as the root
-        mid = len(players_list) // 2
-        root = PlayerBNode(players_list[mid])
+        # Step b: The middle node is the root, so the first count // 2 nodes go to the left
+        mid = count // 2
         # Step c1: Recursively builds the tree - makes it the left child of the root
-        root.left = self._build_balanced_bst(players_list[:mid])
+        left = self._build_balanced_bst(next_node, mid)
+        root = next_node()
+        root.left = left
         # Step c2: Recursively builds the tree - makes it the right child of the root
-        root.right = self._build_balanced_bst(players_list[mid + 1:])
+        root.right = self._build_balanced_bst(next_node, count - mid - 1)
+        root.height = max(_height(root.left), _height(root.right)) + 1
         return root
 
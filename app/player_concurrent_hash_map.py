@@ -0,0 +1,213 @@
+import math
+import threading
+from contextlib import contextmanager
+from app.player import Player
+from app.player_hash_map import PlayerHashMap
+from app.player_list import PlayerList
+
+
+class PlayerConcurrentHashMap(PlayerHashMap):
+    """A thread-safe PlayerHashMap that can be shared by many threads without a global lock.
+
+    Writers lock only the stripe their bucket belongs to (bucket index modulo the number of stripes), so writes to
+    different stripes run in parallel. Reads take no lock at all: a resize builds a complete new list of buckets
+    from new PlayerNodes and swaps it in with a single assignment, so a reader only ever walks a bucket list that
+    is either fully old or fully new. Resizing takes every stripe lock, waiting for in-flight writes to finish.
+
+    Scores aren't protected by the stripe locks, so concurrent updates to the same player's score (including
+    through apply_score_deltas) may race.
+
+    Incremental rehashing is not supported, as the lock-free reads rely on old buckets never being modified, and
+    neither is the Bloom filter, whose bits can't be set safely by writers holding different locks.
+    """
+    STRIPES: int = 16 # Default number of stripe locks
+
+    def __init__(self, capacity: int = PlayerHashMap.SIZE, load_factor: float = PlayerHashMap.LOAD_FACTOR,
+                 min_load_factor: float = 0.0, hash_function="auto", stripes: int = STRIPES):
+        """Initialises a hash map with a list of player instances and a lock per stripe.
+
+        Args:
+            capacity (int): The initial number of buckets.
+            load_factor (float): The load factor above which the number of buckets is doubled.
+            min_load_factor (float): The load factor below which the number of buckets is halved. 0 disables it.
+            hash_function (str | callable): "auto", a name from HASH_FUNCTIONS, or a callable taking a UID.
+            stripes (int): The number of locks the buckets are shared between.
+        """
+        if stripes < 1:
+            raise ValueError("Stripes must be at least 1.")
+        super().__init__(capacity, load_factor, min_load_factor, hash_function=hash_function)
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._stripe_counts = [0] * stripes # Players added minus removed under each stripe lock; only the sum is exact
+        self._resize_lock = threading.Lock()
+        self._table = (self.hashmap, self._hash) # Swapped as one reference so readers never mix the two
+
+    @contextmanager
+    def _all_locks(self):
+        """Holds every stripe lock, always acquired in the same order to avoid deadlocks."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _locked_list(self, key: str):
+        """Locks the stripe of the key's bucket and returns the bucket and its stripe.
+
+        The caller must release self._locks[stripe]. If a resize swaps the buckets while waiting for the lock,
+        the lock is released and the bucket is looked up again.
+
+        Args:
+            key (str): The uid of the player.
+
+        Returns:
+            tuple: The PlayerList for the key and the index of its stripe lock.
+        """
+        while True:
+            table = self._table
+            hashmap, hash_ = table
+            index = hash_(key) % len(hashmap)
+            stripe = index % len(self._locks)
+            self._locks[stripe].acquire()
+            if self._table is table: # No resize can start while the stripe lock is held
+                return hashmap[index], stripe
+            self._locks[stripe].release()
+
+    def __setitem__(self, key: str, name: str) -> None:
+        """Adds a new player or updates an existing player's name in the hash map.
+
+        Args:
+            key (str): The uid of the player.
+            name (str): The player's name.
+        """
+        player_list, stripe = self._locked_list(key)
+        try:
+            added = player_list.add_or_update_player(Player(key, name))
+            if added:
+                self._stripe_counts[stripe] += 1
+        finally:
+            self._locks[stripe].release()
+        capacity = len(self._table[0])
+        if added and len(self) > capacity * self.load_factor:
+            self._resize_from(capacity, capacity * 2)
+
+    def __getitem__(self, key: str) -> Player:
+        """Gets a player based off it's key, without taking a lock.
+        Args:
+            key (str): The uid of the player.
+
+        Returns: The player
+        """
+        hashmap, hash_ = self._table
+        return hashmap[hash_(key) % len(hashmap)].get_player_by_uid(key)
+
+    def get(self, key: str, default=None) -> Player | None:
+        """Gets a player based off it's key without taking a lock, returning a default if they are missing.
+
+        Args:
+            key (str): The uid of the player.
+            default: The value to return if there is no player with this key.
+
+        Returns: The player, or the default
+        """
+        hashmap, hash_ = self._table
+        player = hashmap[hash_(key) % len(hashmap)].find_player_by_uid(key)
+        return default if player is None else player
+
+    def get_many(self, keys, default=None) -> list:
+        """Gets the players for many keys at once, each without taking a lock.
+
+        Args:
+            keys (iterable): The uids of the players.
+            default: The value used for keys without a player.
+
+        Returns:
+            list: The player (or default) for each key, in the same order as the keys.
+        """
+        get = self.get
+        return [get(key, default) for key in keys]
+
+    def __delitem__(self, key: str) -> None:
+        """Deletes a player based off it's key."""
+        player_list, stripe = self._locked_list(key)
+        try:
+            player_list.delete_player_by_uid(key)
+            self._stripe_counts[stripe] -= 1
+        except ValueError:
+            raise KeyError(f"Player with UID '{key}' not found.")
+        finally:
+            self._locks[stripe].release()
+        capacity = len(self._table[0])
+        if capacity > self._initial_capacity and len(self) < capacity * self.min_load_factor:
+            self._resize_from(capacity, max(self._initial_capacity, capacity // 2))
+
+    def __len__(self) -> int:
+        """Returns the total number of players in the hash map."""
+        return sum(self._stripe_counts)
+
+    def update(self, pairs, assume_unique: bool = False) -> None:
+        """Adds or updates many players, resizing once up front. Each player is added under its stripe lock.
+
+        Args:
+            pairs (iterable | dict): (uid, name) pairs, or a dict of names by uid.
+            assume_unique (bool): Accepted for compatibility; duplicates are always checked for.
+        """
+        if isinstance(pairs, dict):
+            pairs = list(pairs.items())
+        elif not isinstance(pairs, (list, tuple)):
+            pairs = list(pairs)
+        capacity = len(self._table[0])
+        needed = math.ceil((len(self) + len(pairs)) / self.load_factor)
+        if needed > capacity:
+            new_capacity = capacity
+            while new_capacity < needed:
+                new_capacity *= 2
+            self._resize_from(capacity, new_capacity)
+        for key, name in pairs:
+            self[key] = name
+
+    def _resize_from(self, expected_capacity: int, new_capacity: int) -> None:
+        """Resizes the hash map, unless another thread already resized it.
+
+        Args:
+            expected_capacity (int): The capacity the caller saw when deciding to resize.
+            new_capacity (int): The number of buckets after resizing.
+        """
+        with self._resize_lock:
+            if len(self._table[0]) != expected_capacity:
+                return
+            with self._all_locks():
+                self._resize(new_capacity)
+
+    def _resize(self, new_capacity: int) -> None:
+        """Copies every player into new buckets and swaps them in. The caller must hold every stripe lock.
+
+        New PlayerNodes are created, so readers still walking the old buckets are unaffected.
+
+        Args:
+            new_capacity (int): The number of buckets after resizing.
+        """
+        new_hash = self._select_hash(new_capacity)
+        new_hashmap = [PlayerList() for _ in range(new_capacity)]
+        for player_list in self._table[0]:
+            for player in player_list:
+                new_hashmap[new_hash(player.uid) % new_capacity].append_node_to_tail(player)
+        self.hashmap = new_hashmap
+        self._hash = new_hash
+        self._table = (new_hashmap, new_hash)
+
+    def stats(self) -> dict:
+        """Returns the bucket statistics of PlayerHashMap.stats, measured while holding every stripe lock."""
+        with self._all_locks():
+            return super().stats()
+
+    def display(self) -> None:
+        """Displays the content of each bucket while holding every stripe lock."""
+        with self._all_locks():
+            super().display()
+
+    def dump(self, stream, fmt: str = "text") -> int:
+        """Writes every player to a text stream while holding every stripe lock, so the dump is consistent."""
+        with self._all_locks():
+            return super().dump(stream, fmt)
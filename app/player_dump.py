@@ -0,0 +1,66 @@
+import csv
+import json
+
+DUMP_FORMATS = ("text", "csv", "jsonl") # Formats accepted by dump_players
+DUMP_BUFFER_LINES = 1000 # Default number of lines collected before each write to the stream
+
+
+class _LineBuffer:
+    """Collects lines and writes them to a stream in batches, so a dump makes few, large writes."""
+
+    def __init__(self, stream, buffer_lines: int):
+        self._stream = stream
+        self._lines = []
+        self._buffer_lines = buffer_lines
+
+    def write(self, line: str) -> None:
+        """Adds a line, writing the batch to the stream once it is full."""
+        self._lines.append(line)
+        if len(self._lines) >= self._buffer_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes any collected lines to the stream."""
+        if self._lines:
+            self._stream.write("".join(self._lines))
+            self._lines.clear()
+
+
+def dump_players(players, stream, fmt: str = "text", buffer_lines: int = DUMP_BUFFER_LINES) -> int:
+    """Writes players to a text stream one line at a time, in constant memory.
+
+    Formats:
+        text: str(player) and the score, e.g. "Player: uid=1, name=Greg, score=10".
+        csv: a "uid,name,score" header, then one row per player.
+        jsonl: one JSON object per line with the uid, name and score.
+
+    Args:
+        players (iterable): The players to write, consumed lazily.
+        stream: A file-like object opened for writing text, e.g. open(path, "w", newline="") or sys.stdout.
+        fmt (str): One of DUMP_FORMATS.
+        buffer_lines (int): The number of lines collected before each write to the stream.
+
+    Returns:
+        int: The number of players written.
+    """
+    if fmt not in DUMP_FORMATS:
+        raise ValueError(f"Unknown dump format '{fmt}'.")
+    buffer = _LineBuffer(stream, buffer_lines)
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(("uid", "name", "score"))
+        for player in players:
+            writer.writerow((player.uid, player.name, player.score))
+            count += 1
+    elif fmt == "jsonl":
+        quote = json.dumps # Quotes each string, without building a dict per player
+        for player in players:
+            buffer.write(f'{{"uid": {quote(player.uid)}, "name": {quote(player.name)}, "score": {player.score}}}\n')
+            count += 1
+    else:
+        for player in players:
+            buffer.write(f"{player}, score={player.score}\n")
+            count += 1
+    buffer.flush()
+    return count
@@ -1,13 +1,137 @@
+import math
 from app.player_list import PlayerList
 from app.player import Player
+from app.player_bloom_filter import PlayerBloomFilter
+from app.player_dump import dump_players
+
+
+class ScoreUpdateResult:
+    """The outcome of applying a batch of score deltas with PlayerHashMap.apply_score_deltas.
+
+    Attributes:
+    updated (int): the number of players whose score was changed.
+    missing (list): the uids with no player in the hash map.
+    invalid (list): the uids whose delta was not an int, or would have made the score negative (left unchanged).
+    """
+    __slots__ = ("updated", "missing", "invalid")
+
+    def __init__(self, updated: int = 0, missing: list | None = None, invalid: list | None = None):
+        """Initialises a result, empty by default.
+
+        Args:
+            updated (int): The number of players whose score was changed.
+            missing (list | None): The uids with no player in the hash map.
+            invalid (list | None): The uids whose delta was invalid.
+        """
+        self.updated = updated
+        self.missing = [] if missing is None else missing
+        self.invalid = [] if invalid is None else invalid
+
+    @property
+    def ok(self) -> bool:
+        """Returns True if every delta was applied."""
+        return not self.missing and not self.invalid
+
+    def __repr__(self) -> str:
+        return f"ScoreUpdateResult(updated={self.updated}, missing={self.missing}, invalid={self.invalid})"
+
 
 class PlayerHashMap:
-    """A hash map that stores player data, using PlayerList to handle collisions."""
-    SIZE: int = 10
+    """A hash map that stores player data, using PlayerList to handle collisions.
+
+    The number of buckets grows (doubles) when the load factor (players per bucket) goes above
+    `load_factor`, and optionally shrinks (halves) when it drops below `min_load_factor`, so chains stay
+    short and lookups stay O(1) on average at any roster size.
+
+    In incremental mode a resize does not rehash every player at once. The old and new bucket lists are both
+    kept while migrating, and each operation moves at most `rehash_step` old buckets into the new ones, so the
+    cost of a resize is spread over many operations instead of stalling a single one.
+
+    The hash function used to pick a bucket can be chosen by name (see HASH_FUNCTIONS) or given as any callable
+    taking a UID and returning a non-negative int. The default, "auto", uses the 8 bit Pearson hash while there
+    are at most 256 buckets and the 32 bit Pearson hash beyond that, so every bucket can be used.
 
-    def __init__(self):
-        """Initialises a hash map with a list of player instances."""
-        self.hashmap = [PlayerList() for _ in range(self.SIZE)]
+    PlayerOpenHashMap has the same API but stores the players in flat lists of slots rather than chains of
+    PlayerNodes; make_player_map (app.player_map) creates either by engine name.
+
+    With bloom_filter=True every UID added is also recorded in a PlayerBloomFilter, so lookups of UIDs that were
+    never added (the common case for sign-up checks) usually return without searching a bucket. The filter is
+    rebuilt while resizing, and after deletes once it holds more deleted UIDs than players.
+    """
+    SIZE: int = 10 # Default initial number of buckets
+    LOAD_FACTOR: float = 1.0 # Default maximum number of players per bucket before growing
+    REHASH_STEP: int = 4 # Default number of old buckets migrated per operation in incremental mode
+    HASH_FUNCTIONS: dict = {
+        "pearson8": Player.pearson_hash,
+        "pearson_wide": Player.pearson_hash_wide,
+        "fnv1a": Player.fnv1a_hash,
+        "builtin": hash, # Fastest, but randomised per Python process
+    }
+
+    def __init__(self, capacity: int = SIZE, load_factor: float = LOAD_FACTOR, min_load_factor: float = 0.0,
+                 incremental: bool = False, rehash_step: int = REHASH_STEP, hash_function="auto",
+                 bloom_filter: bool = False):
+        """Initialises a hash map with a list of player instances.
+
+        Args:
+            capacity (int): The initial number of buckets (a hint for the expected number of players).
+            load_factor (float): The load factor above which the number of buckets is doubled.
+            min_load_factor (float): The load factor below which the number of buckets is halved
+                (never below the initial capacity). 0 disables shrinking.
+            incremental (bool): If True, resizes migrate buckets a few at a time instead of all at once.
+            rehash_step (int): The number of old buckets migrated per operation in incremental mode.
+            hash_function (str | callable): "auto", a name from HASH_FUNCTIONS, or a callable taking a UID.
+            bloom_filter (bool): If True, keep a Bloom filter of the UIDs to skip searching for missing ones.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        if load_factor <= 0:
+            raise ValueError("Load factor must be greater than 0.")
+        if not 0 <= min_load_factor < load_factor / 2:
+            # Shrinking halves the buckets (doubling the load), so it must not immediately trigger a grow.
+            raise ValueError("Minimum load factor must be between 0 and half the load factor.")
+        if rehash_step < 1:
+            raise ValueError("Rehash step must be at least 1.")
+        if not callable(hash_function) and hash_function != "auto" and hash_function not in self.HASH_FUNCTIONS:
+            raise ValueError(f"Unknown hash function '{hash_function}'.")
+        self._initial_capacity = capacity
+        self.load_factor = load_factor
+        self.min_load_factor = min_load_factor
+        self._count = 0 # Number of players, kept up to date to decide when to resize
+        self.hash_function = hash_function
+        self._hash = self._select_hash(capacity)
+        self.hashmap = [PlayerList() for _ in range(capacity)]
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        self._old_hashmap = None # The buckets being migrated from, or None when no migration is in progress
+        self._old_hash = None # The hash function used by the old buckets
+        self._migrate_index = 0 # The next old bucket to migrate
+        self._bloom = self._new_bloom(capacity) if bloom_filter else None
+        self._next_bloom = None # The filter being filled for the new buckets while resizing
+        self._bloom_stale = 0 # Number of deleted UIDs still in the filter
+
+    @property
+    def capacity(self) -> int:
+        """Returns the current number of buckets."""
+        return len(self.hashmap)
+
+    @property
+    def is_rehashing(self) -> bool:
+        """Returns True while an incremental resize is migrating buckets."""
+        return self._old_hashmap is not None
+
+    def _select_hash(self, capacity: int):
+        """Returns the hash function to use for a given number of buckets.
+
+        Args:
+            capacity (int): The number of buckets.
+        """
+        if callable(self.hash_function):
+            return self.hash_function
+        if self.hash_function == "auto":
+            # A single Pearson byte can only address 256 buckets
+            return Player.pearson_hash if capacity <= 256 else Player.pearson_hash_wide
+        return self.HASH_FUNCTIONS[self.hash_function]
 
     def get_index(self, key: str) -> int:
         """Returns player's index in the hash map.
@@ -18,7 +142,34 @@ class PlayerHashMap:
         Returns:
             int: The index in the hash map.
         """
-        return Player.pearson_hash(key) % self.SIZE
+        return self._hash(key) % len(self.hashmap)
+
+    def _hash_many(self, keys: list) -> list:
+        """Returns the full hash of every key, hashing Pearson batches at once with Player.pearson_hash_many.
+
+        Args:
+            keys (list): The players' UIDs.
+        """
+        if self._hash is Player.pearson_hash:
+            return Player.pearson_hash_many(keys)
+        if self._hash is Player.pearson_hash_wide:
+            return Player.pearson_hash_many(keys, bits=32)
+        hash_ = self._hash
+        return [hash_(key) for key in keys]
+
+    def _find_list(self, key: str) -> PlayerList:
+        """Returns the PlayerList that holds the key, or the one it should be added to.
+
+        While migrating, a key whose old bucket has not been migrated yet is still in the old bucket list.
+
+        Args:
+            key (str): The uid of the player.
+        """
+        if self._old_hashmap is not None:
+            old_list = self._old_hashmap[self._old_hash(key) % len(self._old_hashmap)]
+            if old_list.find_player_by_uid(key) is not None:
+                return old_list
+        return self.hashmap[self.get_index(key)]
 
     def __setitem__(self, key: str, name: str) -> None:
         """Adds a new player or updates an existing player's name in the hash map.
@@ -27,10 +178,14 @@ class PlayerHashMap:
             key (str): The uid of the player.
             name (str): The player's name.
         """
-        index = self.get_index(key)
-        player_list = self.hashmap[index]
+        self._migrate_step()
+        player_list = self._find_list(key)
         new_player = Player(key, name)
-        player_list.add_or_update_player(new_player)
+        if player_list.add_or_update_player(new_player):
+            self._count += 1
+            self._bloom_add(key)
+            if self._count > len(self.hashmap) * self.load_factor:
+                self._start_resize(len(self.hashmap) * 2)
 
     def __getitem__(self, key: str) -> Player:
         """Gets a player based off it's key.
@@ -39,33 +194,340 @@ class PlayerHashMap:
 
         Returns: The player
         """
-        index = self.get_index(key)
-        player_list = self.hashmap[index]
+        self._migrate_step()
+        player_list = self._find_list(key)
         return player_list.get_player_by_uid(key)
 
+    def get(self, key: str, default=None) -> Player | None:
+        """Gets a player based off it's key, returning a default instead of raising if they are missing.
+
+        Args:
+            key (str): The uid of the player.
+            default: The value to return if there is no player with this key.
+
+        Returns: The player, or the default
+        """
+        if self._bloom is not None and key not in self._bloom:
+            return default # Definitely never added, no bucket needs searching
+        self._migrate_step()
+        player = self._find_list(key).find_player_by_uid(key)
+        return default if player is None else player
+
+    def __contains__(self, key: str) -> bool:
+        """Returns True if there is a player with this key."""
+        return self.get(key) is not None
+
+    def get_many(self, keys, default=None) -> list:
+        """Gets the players for many keys at once.
+
+        Args:
+            keys (iterable): The uids of the players.
+            default: The value used for keys without a player.
+
+        Returns:
+            list: The player (or default) for each key, in the same order as the keys.
+        """
+        keys = keys if isinstance(keys, (list, tuple)) else list(keys)
+        if self._old_hashmap is not None:
+            # Some keys may still be in old buckets, so look them up one by one
+            get = self.get
+            return [get(key, default) for key in keys]
+        buckets = self.hashmap
+        capacity = len(buckets)
+        bloom = self._bloom
+        players = []
+        for key, hash_ in zip(keys, self._hash_many(keys)):
+            if bloom is not None and key not in bloom:
+                players.append(default)
+                continue
+            player = buckets[hash_ % capacity].find_player_by_uid(key)
+            players.append(default if player is None else player)
+        return players
+
     def __delitem__(self, key: str) -> None:
         """Deleted a player based off it's key."""
-        index = self.get_index(key)
-        player_list = self.hashmap[index]
+        self._migrate_step()
+        player_list = self._find_list(key)
         try:
             player_list.delete_player_by_uid(key)
         except ValueError:
             raise KeyError(f"Player with UID '{key}' not found.")
+        self._count -= 1
+        capacity = len(self.hashmap)
+        if capacity > self._initial_capacity and self._count < capacity * self.min_load_factor:
+            self._start_resize(max(self._initial_capacity, capacity // 2))
+        elif self._bloom is not None:
+            self._bloom_stale += 1
+            if self._bloom_stale > self._count and self._old_hashmap is None:
+                self._rebuild_bloom()
+
+    def _new_bloom(self, capacity: int) -> PlayerBloomFilter:
+        """Returns an empty Bloom filter sized for the most players the buckets hold before growing.
+
+        Args:
+            capacity (int): The number of buckets.
+        """
+        return PlayerBloomFilter(math.ceil(capacity * self.load_factor))
+
+    def _bloom_add(self, key: str) -> None:
+        """Records a new key in the Bloom filter, and in the filter being filled during a resize."""
+        if self._bloom is not None:
+            self._bloom.add(key)
+            if self._next_bloom is not None:
+                self._next_bloom.add(key)
+
+    def _rebuild_bloom(self) -> None:
+        """Replaces the Bloom filter with one holding only the current keys, dropping deleted ones."""
+        self._bloom = self._new_bloom(len(self.hashmap))
+        self._bloom_stale = 0
+        for player_list in self.hashmap:
+            for player in player_list:
+                self._bloom.add(player.uid)
+
+    def update(self, pairs, assume_unique: bool = False) -> None:
+        """Adds or updates many players at once.
+
+        The hash map is resized once up front for the final number of players, rather than growing step by step
+        while the players are added.
+
+        Args:
+            pairs (iterable | dict): (uid, name) pairs, or a dict of names by uid.
+            assume_unique (bool): If True, the caller guarantees that no uid is repeated in pairs or already in the
+                hash map, so players are linked into their buckets without checking for an existing player.
+        """
+        if isinstance(pairs, dict):
+            pairs = list(pairs.items())
+        elif not isinstance(pairs, (list, tuple)):
+            pairs = list(pairs)
+        if not pairs:
+            return
+        self._finish_rehash()
+        needed = math.ceil((self._count + len(pairs)) / self.load_factor)
+        capacity = len(self.hashmap)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        buckets = self.hashmap
+        # Hash every key in a single batch before touching the buckets
+        indexes = [hash_ % capacity for hash_ in self._hash_many([key for key, _ in pairs])]
+        if assume_unique:
+            for index, (key, name) in zip(indexes, pairs):
+                buckets[index].append_node_to_tail(Player(key, name))
+            self._count += len(pairs)
+        else:
+            for index, (key, name) in zip(indexes, pairs):
+                if buckets[index].add_or_update_player(Player(key, name)):
+                    self._count += 1
+        if self._bloom is not None:
+            for key, _ in pairs:
+                self._bloom.add(key)
+
+    @classmethod
+    def from_pairs(cls, pairs, assume_unique: bool = False, **kwargs):
+        """Creates a hash map sized for and filled with the given players.
+
+        Args:
+            pairs (iterable | dict): (uid, name) pairs, or a dict of names by uid.
+            assume_unique (bool): If True, the caller guarantees that no uid is repeated in pairs.
+            **kwargs: Passed on to the constructor, e.g. load_factor. The hash map is presized by update.
+
+        Returns:
+            The new hash map.
+        """
+        hash_map = cls(**kwargs)
+        hash_map.update(pairs, assume_unique=assume_unique)
+        return hash_map
+
+    def apply_score_deltas(self, deltas) -> ScoreUpdateResult:
+        """Adds a delta to the score of many players in one pass over the deltas.
+
+        Each distinct uid is resolved to its player once, with get_many (which hashes the whole batch at once).
+        The deltas are then checked and added up as they are reached, keeping only each player's pending score,
+        and the pending scores are set at the end, skipping any uid with an invalid delta or a negative total.
+        Problems don't stop the batch: missing uids and invalid deltas are reported in the result, and every
+        other delta is applied.
+
+        Args:
+            deltas (dict | iterable): Score deltas by uid, or (uid, delta) pairs. Deltas for the same uid add up.
+
+        Returns:
+            ScoreUpdateResult: The number of players updated, and the missing and invalid uids.
+        """
+        if isinstance(deltas, dict):
+            pairs = deltas.items()
+            uids = list(deltas)
+        else:
+            pairs = deltas if isinstance(deltas, (list, tuple)) else list(deltas)
+            uids = list(dict.fromkeys([uid for uid, _ in pairs]))
+        players = dict(zip(uids, self.get_many(uids)))
+        pending = {} # New score of each player reached so far, by uid (ints, so the GC doesn't track them)
+        invalid = {} # Uids with an invalid delta, in the order they were reached
+        for uid, delta in pairs:
+            new_score = pending.get(uid)
+            if new_score is not None:
+                if isinstance(delta, int):
+                    pending[uid] = new_score + delta
+                else:
+                    del pending[uid] # Its earlier deltas are dropped with it
+                    invalid[uid] = None
+            elif uid in invalid:
+                continue
+            elif not isinstance(delta, int):
+                invalid[uid] = None
+            else:
+                player = players[uid]
+                if player is not None:
+                    pending[uid] = player.score + delta
+        updated = 0
+        for uid, new_score in pending.items():
+            if new_score < 0:
+                invalid[uid] = None
+            else:
+                players[uid]._set_score_unchecked(new_score)
+                updated += 1
+        missing = [uid for uid, player in players.items() if player is None and uid not in invalid]
+        return ScoreUpdateResult(updated, missing, list(invalid))
+
+    def _start_resize(self, new_capacity: int) -> None:
+        """Resizes the hash map, either all at once or by starting an incremental migration.
+
+        Args:
+            new_capacity (int): The number of buckets in the new hash map.
+        """
+        if not self.incremental:
+            self._resize(new_capacity)
+            return
+        self._finish_rehash() # Only one migration can be in progress at a time
+        self._old_hashmap = self.hashmap
+        self._old_hash = self._hash
+        self._migrate_index = 0
+        self._hash = self._select_hash(new_capacity)
+        self.hashmap = [PlayerList() for _ in range(new_capacity)]
+        if self._bloom is not None:
+            self._next_bloom = self._new_bloom(new_capacity)
+
+    def _migrate_step(self) -> None:
+        """Migrates up to `rehash_step` old buckets into the new buckets."""
+        if self._old_hashmap is None:
+            return
+        stop = min(self._migrate_index + self.rehash_step, len(self._old_hashmap))
+        for index in range(self._migrate_index, stop):
+            self._migrate_bucket(self._old_hashmap[index])
+        self._migrate_index = stop
+        if stop == len(self._old_hashmap):
+            self._end_migration()
+
+    def _finish_rehash(self) -> None:
+        """Migrates every remaining old bucket, completing any incremental resize in progress."""
+        if self._old_hashmap is None:
+            return
+        for index in range(self._migrate_index, len(self._old_hashmap)):
+            self._migrate_bucket(self._old_hashmap[index])
+        self._end_migration()
+
+    def _end_migration(self) -> None:
+        """Drops the old buckets and switches to the Bloom filter filled while migrating."""
+        self._old_hashmap = None
+        if self._next_bloom is not None:
+            self._bloom = self._next_bloom
+            self._next_bloom = None
+            self._bloom_stale = 0
+
+    def _migrate_bucket(self, player_list: PlayerList) -> None:
+        """Relinks every node of a bucket into the current buckets, leaving the bucket empty.
+
+        Args:
+            player_list (PlayerList): The bucket to migrate.
+        """
+        next_bloom = self._next_bloom
+        buckets = self.hashmap
+        capacity = len(buckets)
+        hash_function = self._hash
+        current_node = player_list.head
+        while current_node:
+            next_node = current_node.next_node # Save the next node before the pointers are rewritten
+            buckets[hash_function(current_node.key) % capacity].link_node_to_tail(current_node)
+            if next_bloom is not None:
+                next_bloom.add(current_node.key)
+            current_node = next_node
+        player_list.clear()
+
+    def _resize(self, new_capacity: int) -> None:
+        """Rehashes every player into a new list of buckets.
+
+        The existing PlayerNodes are relinked into the new buckets rather than recreated.
+
+        Args:
+            new_capacity (int): The number of buckets in the new hash map.
+        """
+        self._finish_rehash()
+        old_hashmap = self.hashmap
+        self._hash = self._select_hash(new_capacity)
+        self.hashmap = [PlayerList() for _ in range(new_capacity)]
+        if self._bloom is not None:
+            self._next_bloom = self._new_bloom(new_capacity)
+        for player_list in old_hashmap:
+            self._migrate_bucket(player_list)
+        self._end_migration()
 
     def __len__(self) -> int:
-        """Returns the total number of players in the hash map."""
-        total = 0
+        """Returns the total number of players in the hash map, including buckets still being migrated."""
+        return self._count
+
+    def players(self):
+        """Yields every player in the hash map, including those in buckets still being migrated."""
+        buckets = self.hashmap if self._old_hashmap is None else self._old_hashmap + self.hashmap
+        for player_list in buckets:
+            yield from player_list
+
+    def stats(self) -> dict:
+        """Returns statistics about how evenly the players are spread over the buckets.
+
+        While an incremental resize is in progress, only the current buckets are measured.
+
+        Returns:
+            dict: The number of buckets and players, the load factor, the min/max/mean/standard deviation of the
+            chain lengths, the number of empty buckets and a histogram of the number of buckets per chain length.
+        """
+        histogram = {}
         for player_list in self.hashmap:
-            current_node = player_list.head
-            while current_node:
-                total += 1
-                current_node = current_node.next_node
-        return total
+            length = len(player_list)
+            histogram[length] = histogram.get(length, 0) + 1
+        capacity = len(self.hashmap)
+        size = len(self)
+        mean = sum(length * buckets for length, buckets in histogram.items()) / capacity
+        variance = sum(buckets * (length - mean) ** 2 for length, buckets in histogram.items()) / capacity
+        return {
+            "capacity": capacity,
+            "size": size,
+            "load_factor": size / capacity,
+            "min_chain": min(histogram),
+            "max_chain": max(histogram),
+            "mean_chain": mean,
+            "stddev_chain": math.sqrt(variance),
+            "empty_buckets": histogram.get(0, 0),
+            "histogram": dict(sorted(histogram.items())),
+            "rehashing": self._old_hashmap is not None,
+        }
 
     def display(self) -> None:
         """Displays the content of each PlayerList with one or more players. Prints the index of the PlayerList"""
+        self._finish_rehash() # Indexes are only meaningful once every player is in the current buckets
         for index, player_list in enumerate(self.hashmap):
-            if player_list: # Change to: if not player_list.is_empty(): To view only indexes with players in them.
-                print(f"Index {index}:")
-                player_list.display()
-                print("-" * 20)
\ No newline at end of file
+            # Every bucket is shown. Add: if not player_list.is_empty(): To view only indexes with players in them.
+            print(f"Index {index}:")
+            player_list.display()
+            print("-" * 20)
+
+    def dump(self, stream, fmt: str = "text") -> int:
+        """Writes every player to a text stream as they are reached, in constant memory.
+
+        Args:
+            stream: A file-like object opened for writing text.
+            fmt (str): "text", "csv" or "jsonl" (see dump_players).
+
+        Returns:
+            int: The number of players written.
+        """
+        return dump_players(self.players(), stream, fmt)
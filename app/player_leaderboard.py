@@ -0,0 +1,247 @@
+import random
+from app.player import Player
+
+
+class _LeaderboardNode:
+    """A node of the leaderboard treap, holding a player and the size of its subtree."""
+    __slots__ = ("key", "player", "priority", "left", "right", "size")
+
+    def __init__(self, player: Player, priority: float):
+        """Initialises a leaf node for the player.
+
+        Args:
+            player (Player): The player stored in this node.
+            priority (float): The random heap priority that keeps the treap balanced.
+        """
+        self.key = (-player.score, player.uid) # Highest score first, equal scores ordered by uid
+        self.player = player
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+def _size(node: _LeaderboardNode | None) -> int:
+    """Returns the number of nodes in a subtree."""
+    return node.size if node is not None else 0
+
+
+class PlayerLeaderboard:
+    """A live ranking of players by score, kept up to date as scores change.
+
+    The players are kept in an order statistic tree: a treap (a BST whose nodes also form a heap on random
+    priorities, which keeps its expected height O(log n)) in which every node records the size of its subtree.
+    Ranks are 1-based: rank 1 is the highest score, and players with equal scores are ranked by uid.
+
+    Adding a player registers a score listener on it, so setting player.score moves the player to its new rank
+    in O(log n) without re-sorting anything. remove and clear unregister the listener; it only holds a weak
+    reference to the leaderboard, so a leaderboard that is dropped without being cleared is still collected.
+    """
+
+    def __init__(self, players=()):
+        """Initialises a leaderboard, optionally with some players.
+
+        Args:
+            players (iterable): The players to add.
+        """
+        self._root = None
+        self._nodes = {} # Node of each player by uid
+        self._random = random.Random()
+        self._listener = Player.weak_score_listener(self._on_score_change)
+        for player in players:
+            self.add(player)
+
+    def __len__(self) -> int:
+        """Returns the number of players on the leaderboard."""
+        return len(self._nodes)
+
+    def __contains__(self, uid: str) -> bool:
+        """Returns True if the player with this uid is on the leaderboard."""
+        return uid in self._nodes
+
+    def add(self, player: Player) -> None:
+        """Adds a player to the leaderboard, replacing any player with the same uid.
+
+        Args:
+            player (Player): The player to add.
+        """
+        if player.uid in self._nodes:
+            self.remove(player.uid)
+        node = _LeaderboardNode(player, self._random.random())
+        self._nodes[player.uid] = node
+        self._insert(node)
+        player.add_score_listener(self._listener)
+
+    def remove(self, uid: str) -> None:
+        """Removes a player from the leaderboard.
+
+        Args:
+            uid (str): The uid of the player to remove.
+        """
+        node = self._nodes.pop(uid, None)
+        if node is None:
+            raise KeyError(f"Player with UID '{uid}' not found.")
+        self._root = self._delete(self._root, node.key)
+        node.player.remove_score_listener(self._listener)
+
+    def clear(self) -> None:
+        """Removes every player from the leaderboard, unregistering its score listener from each of them."""
+        for node in self._nodes.values():
+            node.player.remove_score_listener(self._listener)
+        self._nodes = {}
+        self._root = None
+
+    def _on_score_change(self, player: Player, old_score: int) -> None:
+        """Moves a player to the position for their new score.
+
+        Args:
+            player (Player): The player whose score changed.
+            old_score (int): The score before the change.
+        """
+        node = self._nodes[player.uid]
+        self._root = self._delete(self._root, node.key)
+        node.key = (-player.score, player.uid)
+        node.left = node.right = None
+        node.size = 1
+        self._insert(node)
+
+    def _insert(self, node: _LeaderboardNode) -> None:
+        """Inserts a leaf node, splitting the tree around its key and merging it back together."""
+        less, greater = self._split(self._root, node.key)
+        self._root = self._merge(self._merge(less, node), greater)
+
+    def _split(self, node: _LeaderboardNode | None, key: tuple) -> tuple:
+        """Splits a subtree into the nodes with keys less than key, and those greater than or equal to it.
+
+        Returns:
+            tuple: The roots of the two subtrees.
+        """
+        if node is None:
+            return None, None
+        if node.key < key:
+            less, greater = self._split(node.right, key)
+            node.right = less
+            node.size = _size(node.left) + _size(less) + 1
+            return node, greater
+        less, greater = self._split(node.left, key)
+        node.left = greater
+        node.size = _size(greater) + _size(node.right) + 1
+        return less, node
+
+    def _merge(self, left: _LeaderboardNode | None, right: _LeaderboardNode | None) -> _LeaderboardNode | None:
+        """Merges two subtrees where every key in left is less than every key in right.
+
+        Returns:
+            _LeaderboardNode: The root of the merged subtree.
+        """
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = self._merge(left.right, right)
+            left.size = _size(left.left) + _size(left.right) + 1
+            return left
+        right.left = self._merge(left, right.left)
+        right.size = _size(right.left) + _size(right.right) + 1
+        return right
+
+    def _delete(self, node: _LeaderboardNode, key: tuple) -> _LeaderboardNode | None:
+        """Removes the node with key from a subtree that contains it.
+
+        Returns:
+            _LeaderboardNode: The root of the subtree without the node.
+        """
+        if key == node.key:
+            return self._merge(node.left, node.right)
+        if key < node.key:
+            node.left = self._delete(node.left, key)
+        else:
+            node.right = self._delete(node.right, key)
+        node.size -= 1
+        return node
+
+    def rank_of(self, uid: str) -> int:
+        """Returns the rank of a player, 1 being the highest score.
+
+        Args:
+            uid (str): The uid of the player.
+        """
+        target = self._nodes.get(uid)
+        if target is None:
+            raise KeyError(f"Player with UID '{uid}' not found.")
+        key = target.key
+        rank = 0
+        node = self._root
+        while node is not target:
+            if key < node.key:
+                node = node.left
+            else:
+                rank += _size(node.left) + 1 # Every node in the left subtree, and this one, ranks higher
+                node = node.right
+        return rank + _size(node.left) + 1
+
+    def player_at(self, rank: int) -> Player:
+        """Returns the player at a rank, 1 being the highest score.
+
+        Args:
+            rank (int): The rank, from 1 to the number of players.
+        """
+        if not 1 <= rank <= len(self._nodes):
+            raise IndexError(f"Rank {rank} is out of range.")
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if rank <= left_size:
+                node = node.left
+            elif rank == left_size + 1:
+                return node.player
+            else:
+                rank -= left_size + 1
+                node = node.right
+
+    def range(self, rank_a: int, rank_b: int) -> list:
+        """Returns the players ranked from rank_a to rank_b (inclusive), in rank order.
+
+        Finds rank_a in O(log n) and then walks the tree in order, so it costs O(log n + k) for k players.
+
+        Args:
+            rank_a (int): The first rank, from 1.
+            rank_b (int): The last rank. Ranks past the last player are ignored.
+        """
+        rank_a = max(rank_a, 1)
+        count = min(rank_b, len(self._nodes)) - rank_a + 1
+        if count <= 0:
+            return []
+        # Descend to rank_a, stacking the nodes that come after it in order
+        stack = []
+        node = self._root
+        skip = rank_a - 1
+        while node is not None:
+            left_size = _size(node.left)
+            if skip < left_size:
+                stack.append(node)
+                node = node.left
+            elif skip == left_size:
+                stack.append(node)
+                break
+            else:
+                skip -= left_size + 1
+                node = node.right
+        players = []
+        while len(players) < count:
+            node = stack.pop()
+            players.append(node.player)
+            child = node.right
+            while child is not None:
+                stack.append(child)
+                child = child.left
+        return players
+
+    def top(self, k: int) -> list:
+        """Returns the k highest ranked players, in rank order.
+
+        Args:
+            k (int): The number of players.
+        """
+        return self.range(1, k)
@@ -1,14 +1,67 @@
 from app.player_node import PlayerNode
 from app.player import Player
+from app.player_dump import dump_players
 
 class PlayerList:
-    """A class to represents a list of players"""
+    """A class to represents a list of players
+
+    An indexed list also keeps a dict from uid to node, so finding, updating and deleting a player by uid is O(1)
+    instead of a walk along the list. The uids in an indexed list must be unique.
+    """
     _head = PlayerNode | None # The head is of type Player Node or None (if list is empty)
     _tail = PlayerNode | None # If list is empty both the head and tail are None
 
-    def __init__(self, node: PlayerNode | None = None):
+    def __init__(self, node: PlayerNode | None = None, node_type: type = PlayerNode, indexed: bool = False):
+        """Initialises an empty list.
+
+        Args:
+            node_type (type): The class used for new nodes, PlayerNode or LeanPlayerNode.
+            indexed (bool): If True, keep a uid to node index for O(1) lookups and deletes by uid.
+        """
         self._head = None # Initialise the head of the list to None
         self._tail = None # Initialise the tail of the list to None
+        self._node_type = node_type
+        self._index = {} if indexed else None # Node of each player by uid, or None if not indexed
+        self._size = 0 # Number of nodes, kept up to date so len() doesn't walk the list
+
+    def __len__(self) -> int:
+        """Returns the number of players in the list."""
+        return self._size
+
+    def __iter__(self):
+        """Yields the players from head to tail."""
+        current_node = self._head
+        while current_node is not None:
+            yield current_node.player
+            current_node = current_node.next_node
+
+    def __reversed__(self):
+        """Yields the players from tail to head."""
+        current_node = self._tail
+        while current_node is not None:
+            yield current_node.player
+            current_node = current_node.previous_node
+
+    @property
+    def indexed(self) -> bool:
+        """Returns True if the list keeps a uid to node index."""
+        return self._index is not None
+
+    @property
+    def index(self) -> dict | None:
+        """Returns the node of each player by uid, or None if the list isn't indexed.
+
+        The dict is the list's own index, kept up to date by every change to the list (clear empties it rather than
+        replacing it), so callers can keep it for fast lookups. It must not be changed by callers.
+        """
+        return self._index
+
+    def _add_to_index(self, node: PlayerNode) -> None:
+        """Records a node in the uid index, refusing duplicate uids."""
+        if self._index is not None:
+            if node.key in self._index:
+                raise ValueError(f"Player with UID '{node.key}' is already in the list.")
+            self._index[node.key] = node
 
     @property
     def head(self) -> PlayerNode | None:
@@ -31,7 +84,8 @@ class PlayerList:
         self._tail = _player_node
 
     def append_node_to_head(self, value: any) -> None:
-        new_node = PlayerNode(value)  # Creates a new node with the value passed in
+        new_node = self._node_type(value)  # Creates a new node with the value passed in
+        self._add_to_index(new_node)
         if self.is_empty():
             """Inserts a node at the head of the list.
             
@@ -44,6 +98,7 @@ class PlayerList:
             new_node.next_node = self.head  # Set the new node's next_node to the current head
             self.head.previous_node = new_node  # Set the current head's previous_node to the new node
             self.head = new_node  # Update the head to the new node
+        self._size += 1
 
     def append_node_to_tail(self, value: any) -> None:
         """Insert a node at the tail of the list
@@ -52,7 +107,8 @@ class PlayerList:
         instead of having to traverse the entire list like in a singly linked list O(n) (linear time).
         p.s Thanks for the in class explanation and graphs!
         """
-        new_node = PlayerNode(value)
+        new_node = self._node_type(value)
+        self._add_to_index(new_node)
         if self.is_empty():
             # If the list is empty, the new node becomes both the head and the tail node"""
             self.head = new_node
@@ -61,6 +117,7 @@ class PlayerList:
             self.tail.next_node = new_node # Update the current tail to point to the new node
             new_node.previous_node = self.tail # Update the new node's previous pointer to point to the old tail
             self.tail = new_node # Update the tail to the new node
+        self._size += 1
 
     def delete_head(self) -> None:
         """
@@ -68,6 +125,8 @@ class PlayerList:
         """
         if self.is_empty():
             raise IndexError("Cannot delete from an empty list.")
+        if self._index is not None:
+            del self._index[self.head.key]
         if self.head == self.tail:
             # Only one node in the list
             self.head = None
@@ -77,6 +136,7 @@ class PlayerList:
             self.head = self.head.next_node
             if self.head:
                 self.head.previous_node = None
+        self._size -= 1
 
     def delete_tail(self) -> None:
         """
@@ -84,6 +144,8 @@ class PlayerList:
         """
         if self.is_empty():
             raise IndexError("Cannot delete from an empty list.")
+        if self._index is not None:
+            del self._index[self.tail.key]
         if self.head == self.tail:
             # Only one node in the list
             self.head = None
@@ -93,38 +155,59 @@ class PlayerList:
             self.tail = self.tail.previous_node
             if self.tail:
                 self.tail.next_node = None
+        self._size -= 1
 
     def delete_by_key(self, key: str) -> None:
         """ Deletes a node by it's key"""
+        if self._index is not None:
+            # Indexed lists find the node directly instead of walking the list
+            current_node = self._index.pop(key, None)
+            if current_node is None:
+                raise ValueError(f"Node with key {key} not found.")
+            self._unlink_node(current_node)
+            self._size -= 1
+            return
+
         current_node = self.head
 
         while current_node is not None:
             """Traverses the list and removes the node by key, 
             also taking into account if the node is the head or tail node."""
             if current_node.key == key:
-                if current_node == self.head: # If the node is the head
-                    self.head = current_node.next_node
-                    if self.head:
-                        self.head.previous_node = None
-                    else:
-                        self.tail = None  # If the list is now empty, reset the tail
-
-                # If the node is the tail
-                elif current_node == self.tail:
-                    self.tail = current_node.previous_node
-                    if self.tail:
-                        self.tail.next_node = None
-
-                # If the node isn't the head or tail then update the references to remove it.
-                else:
-                    current_node.previous_node.next_node = current_node.next_node
-                    current_node.next_node.previous_node = current_node.previous_node
+                self._unlink_node(current_node)
+                self._size -= 1
                 return
 
             current_node = current_node.next_node  # Move to the next node
 
         raise ValueError(f"Node with key {key} not found.")
 
+    def _unlink_node(self, node: PlayerNode) -> None:
+        """Removes a node that is in this list by rewriting its neighbours' references, in O(1).
+
+        The uid index is not changed; callers that remove the player from the list also remove it from the index.
+
+        Args:
+            node (PlayerNode): The node to remove.
+        """
+        if node == self.head: # If the node is the head
+            self.head = node.next_node
+            if self.head:
+                self.head.previous_node = None
+            else:
+                self.tail = None  # If the list is now empty, reset the tail
+
+        # If the node is the tail
+        elif node == self.tail:
+            self.tail = node.previous_node
+            if self.tail:
+                self.tail.next_node = None
+
+        # If the node isn't the head or tail then update the references to remove it.
+        else:
+            node.previous_node.next_node = node.next_node
+            node.next_node.previous_node = node.previous_node
+
     def is_empty(self) -> bool:
         """
         Check if the list is empty.
@@ -134,15 +217,154 @@ class PlayerList:
         """
         return self._head is None and self._tail is None
 
-    def add_or_update_player(self, player: Player) -> None:
-        """Adds a new player to the list or updates the player's name if they already exist."""
+    def clear(self) -> None:
+        """Empties the list in O(1) by dropping its references to the nodes and clearing any uid index.
+
+        The nodes' own pointers are left as they were, so a caller can still walk them, e.g. to relink each node
+        into another list with link_node_to_tail.
+        """
+        self._head = self._tail = None
+        self._size = 0
+        if self._index is not None:
+            self._index.clear()
+
+    def link_node_to_tail(self, node: PlayerNode) -> None:
+        """Links an existing node at the tail of the list without creating a new node.
+
+        Used when nodes are moved between lists (e.g. when a hash map rehashes its buckets), so the
+        node's player is kept and only the node's pointers are rewritten.
+
+        Args:
+            node (PlayerNode): The node to link at the tail.
+        """
+        self._add_to_index(node)
+        node.next_node = None
+        node.previous_node = self.tail
+        if self.is_empty():
+            self.head = node
+        else:
+            self.tail.next_node = node
+        self.tail = node
+        self._size += 1
+
+    def extend(self, players) -> None:
+        """Adds players at the tail of the list.
+
+        When given another PlayerList, its nodes are relinked onto this list's tail in O(1) (plus merging the
+        uid index if this list is indexed), and the other list is left empty. Otherwise each player is appended.
+
+        Args:
+            players (PlayerList | iterable): The list whose nodes are moved, or the players to append.
+        """
+        if isinstance(players, PlayerList):
+            self.splice(players, after=self._tail)
+            return
+        for player in players:
+            self.append_node_to_tail(player)
+
+    def splice(self, other: "PlayerList", after: PlayerNode | None = None) -> None:
+        """Moves every node of another list into this one, after a given node, leaving the other list empty.
+
+        Only the pointers at the two ends of the other list are rewritten, so this is O(1) for unindexed lists.
+        If this list is indexed, the other list's nodes are added to its index first, which is O(len(other)),
+        and no nodes are moved if any of their uids are already in this list.
+
+        Args:
+            other (PlayerList): The list whose nodes are moved.
+            after (PlayerNode | None): The node of this list to insert after, or None to insert at the head.
+        """
+        if other is self:
+            raise ValueError("Cannot splice a list into itself.")
+        if other.is_empty():
+            return
+        if self._index is not None:
+            nodes = other._index if other._index is not None else {node.key: node for node in other._nodes()}
+            if len(nodes) != len(other):
+                raise ValueError("Cannot splice a list with repeated UIDs into an indexed list.")
+            duplicates = self._index.keys() & nodes.keys()
+            if duplicates:
+                raise ValueError(f"Players with UIDs {sorted(duplicates)} are already in the list.")
+            self._index.update(nodes)
+        first, last = other._head, other._tail
+        following = self._head if after is None else after.next_node
+        first.previous_node = after
+        last.next_node = following
+        if after is None:
+            self._head = first
+        else:
+            after.next_node = first
+        if following is None:
+            self._tail = last
+        else:
+            following.previous_node = last
+        self._size += other._size
+        other.clear()
+
+    def _nodes(self):
+        """Yields the nodes from head to tail."""
+        current_node = self._head
+        while current_node is not None:
+            yield current_node
+            current_node = current_node.next_node
+
+    def get_node(self, uid: str) -> PlayerNode | None:
+        """Returns the node holding a player, or None if there isn't one. O(1) in an indexed list.
+
+        Args:
+            uid (str): The UID of the player.
+        """
+        if self._index is not None:
+            return self._index.get(uid)
+        current_node = self._head
+        while current_node is not None:
+            if current_node.key == uid:
+                return current_node
+            current_node = current_node.next_node
+        return None
+
+    def move_node_to_head(self, node: PlayerNode) -> None:
+        """Moves a node that is already in this list to the head, in O(1). The uid index is unchanged.
+
+        Args:
+            node (PlayerNode): The node to move.
+        """
+        head = self._head
+        if node is head:
+            return
+        # The node isn't the head, so it has a previous node
+        previous_node = node.previous_node
+        next_node = node.next_node
+        previous_node.next_node = next_node
+        if next_node is None:
+            self._tail = previous_node
+        else:
+            next_node.previous_node = previous_node
+        node.previous_node = None
+        node.next_node = head
+        head.previous_node = node
+        self._head = node
+
+    def add_or_update_player(self, player: Player) -> bool:
+        """Adds a new player to the list or updates the player's name if they already exist.
+
+        Returns:
+            bool: True if a new player was added, False if an existing player was updated.
+        """
+        if self._index is not None:
+            node = self._index.get(player.uid)
+            if node is not None:
+                node.player._player_name = player.name
+                return False
+            self.append_node_to_tail(player)
+            return True
         current_node = self.head
         while current_node:
             if current_node.player.uid == player.uid:
                 current_node.player._player_name = player.name
-                return
+                return False
             current_node = current_node.next_node
         self.append_node_to_tail(player)
+        return True
 
     def get_player_by_uid(self, uid: str) -> Player:
         """Retrieves a player from the list based on their UID.
@@ -153,12 +375,29 @@ class PlayerList:
         Returns:
             The player with the matching UID.
         """
+        player = self.find_player_by_uid(uid)
+        if player is None:
+            raise KeyError(f"Player with UID '{uid}' not found.")
+        return player
+
+    def find_player_by_uid(self, uid: str) -> Player | None:
+        """Retrieves a player from the list based on their UID, without raising if they are missing.
+
+        Args:
+            uid (str): The UID of the player.
+
+        Returns:
+            The player with the matching UID, or None if there isn't one.
+        """
+        if self._index is not None:
+            node = self._index.get(uid)
+            return None if node is None else node.player
         current_node = self.head
         while current_node:
             if current_node.player.uid == uid:
                 return current_node.player
             current_node = current_node.next_node
-        raise KeyError(f"Player with UID '{uid}' not found.")
+        return None
 
     def delete_player_by_uid(self, uid: str) -> None:
         """Deletes a player from the list based on their UID.
@@ -178,16 +417,24 @@ class PlayerList:
             print("  (No players)")
             return
 
-        players = []
-        if forward:
-            current_node = self.head
-            while current_node:
-                players.append(str(current_node))
-                current_node = current_node.next_node
-        else:
-            current_node = self.tail
-            while current_node:
-                players.append(str(current_node))
-                current_node = current_node.previous_node
+        # Each node is printed as it is reached, rather than joining the whole list into one string first
+        separator = "  "
+        current_node = self.head if forward else self.tail
+        while current_node:
+            print(separator + str(current_node), end="")
+            separator = "   (linked node-->)   "
+            current_node = current_node.next_node if forward else current_node.previous_node
+        print()
 
-        print("  " + "   (linked node-->)   ".join(players))
\ No newline at end of file
+    def dump(self, stream, fmt: str = "text", forward: bool = True) -> int:
+        """Writes the players to a text stream as they are reached, in constant memory.
+
+        Args:
+            stream: A file-like object opened for writing text.
+            fmt (str): "text", "csv" or "jsonl" (see dump_players).
+            forward (bool): True writes head to tail, False tail to head.
+
+        Returns:
+            int: The number of players written.
+        """
+        return dump_players(iter(self) if forward else reversed(self), stream, fmt)
\ No newline at end of file
@@ -0,0 +1,162 @@
+import sys
+import time
+from app.player import Player
+from app.player_list import PlayerList
+from app.player_node import LeanPlayerNode
+
+
+class PlayerLRUCache:
+    """A least recently used cache of players, for reads in front of a slower player store.
+
+    The players are kept in an indexed PlayerList of lean nodes, most recently used at the head. The list's uid
+    index finds a player's node in O(1), so a hit moves the node to the head and an eviction deletes the tail
+    without searching the list.
+
+    The cache is bounded by a number of players and, optionally, by an approximate number of bytes (the size of
+    each Player and its uid and name strings). Entries can also expire after a time to live.
+
+    It is not faster than an LRU cache built on collections.OrderedDict, whose move_to_end runs in C (see
+    benchmarks/bench_lru_cache.py); what it adds is the byte limit, the TTL and the counters.
+    """
+    CAPACITY: int = 128 # Default maximum number of players
+
+    def __init__(self, capacity: int = CAPACITY, max_bytes: int | None = None, ttl: float | None = None,
+                 clock=time.monotonic):
+        """Initialises an empty cache.
+
+        Args:
+            capacity (int): The maximum number of players held.
+            max_bytes (int | None): The maximum approximate size of the players held, or None for no limit.
+            ttl (float | None): Seconds after a put that a player expires, or None if players never expire.
+            clock (callable): Returns the current time in seconds; replaceable for testing.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Max bytes must be at least 1.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be positive.")
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._list = PlayerList(node_type=LeanPlayerNode, indexed=True)
+        self._nodes = self._list.index # Node of each player by uid, the list's own index
+        self._expires = {} # Expiry time of each player by uid, only used with a TTL
+        self._sizes = {} # Approximate size of each player by uid, only used with max_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def size_of(player: Player) -> int:
+        """Returns the approximate number of bytes used by a player and its uid and name strings."""
+        return sys.getsizeof(player) + sys.getsizeof(player.uid) + sys.getsizeof(player.name)
+
+    def __len__(self) -> int:
+        """Returns the number of players in the cache, including any that have expired but not been removed."""
+        return len(self._nodes)
+
+    def __contains__(self, uid: str) -> bool:
+        """Returns True if an unexpired player with this uid is cached. Doesn't count as a use of the player."""
+        if uid not in self._nodes:
+            return False
+        return self.ttl is None or self._expires[uid] > self._clock()
+
+    @property
+    def bytes(self) -> int:
+        """Returns the approximate size of the cached players, or 0 if the cache has no byte limit."""
+        return self._bytes
+
+    def get(self, uid: str, default=None) -> Player | None:
+        """Returns a cached player and marks it as the most recently used.
+
+        Args:
+            uid (str): The uid of the player.
+            default: The value returned on a miss.
+
+        Returns: The player, or the default if it isn't cached or has expired
+        """
+        node = self._nodes.get(uid)
+        if node is None:
+            self.misses += 1
+            return default
+        if self.ttl is not None and self._expires[uid] <= self._clock():
+            self._remove(uid)
+            self.misses += 1
+            return default
+        self._list.move_node_to_head(node)
+        self.hits += 1
+        return node.player
+
+    def put(self, player: Player) -> None:
+        """Caches a player as the most recently used, replacing any cached player with the same uid.
+
+        Least recently used players are then evicted until the cache is within its limits. A player bigger than
+        max_bytes on its own is not kept.
+
+        Args:
+            player (Player): The player to cache.
+        """
+        uid = player.uid
+        node = self._nodes.get(uid)
+        if node is None:
+            self._list.append_node_to_head(player)
+        else:
+            # Reuse the cached player's node for its replacement
+            node.player = player
+            self._list.move_node_to_head(node)
+        if self.ttl is not None:
+            self._expires[uid] = self._clock() + self.ttl
+        if self.max_bytes is not None:
+            size = self.size_of(player)
+            self._bytes += size - self._sizes.get(uid, 0)
+            self._sizes[uid] = size
+            while self._bytes > self.max_bytes:
+                self._remove(self._list.tail.key)
+                self.evictions += 1
+        if len(self._nodes) > self.capacity:
+            self._remove(self._list.tail.key)
+            self.evictions += 1
+
+    def __delitem__(self, uid: str) -> None:
+        """Removes a player from the cache.
+
+        Args:
+            uid (str): The uid of the player.
+        """
+        if uid not in self._nodes:
+            raise KeyError(f"Player with UID '{uid}' not found.")
+        self._remove(uid)
+
+    def _remove(self, uid: str) -> None:
+        """Removes a cached player and its expiry time and size."""
+        self._list.delete_by_key(uid)
+        if self.ttl is not None:
+            del self._expires[uid]
+        if self.max_bytes is not None:
+            self._bytes -= self._sizes.pop(uid)
+
+    def clear(self) -> None:
+        """Removes every player, keeping the counters."""
+        self._list.clear()
+        self._expires.clear()
+        self._sizes.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """Returns the size of the cache and its hit, miss and eviction counters.
+
+        Returns:
+            dict: size, bytes, hits, misses, evictions and hit_rate (hits over lookups, 0 before any lookup).
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,36 @@
+from app.player_hash_map import PlayerHashMap
+from app.player_open_hash_map import PlayerOpenHashMap
+
+ENGINES: dict = {
+    "chaining": PlayerHashMap,
+    "open_addressing": PlayerOpenHashMap,
+} # Hash map class of each storage engine
+_CHAINING_ONLY = ("incremental", "rehash_step", "bloom_filter") # Options the open addressing engine doesn't have
+
+
+def make_player_map(engine: str = "chaining", pairs=(), assume_unique: bool = False, **options):
+    """Creates a player hash map with the chosen storage engine, optionally filled with players.
+
+    Both engines offer the same API: PlayerHashMap chains PlayerNodes in buckets, PlayerOpenHashMap stores the
+    players in flat lists of slots.
+
+    Args:
+        engine (str): "chaining" for a PlayerHashMap, "open_addressing" for a PlayerOpenHashMap.
+        pairs (iterable | dict): (uid, name) pairs, or a dict of names by uid, to add with update.
+        assume_unique (bool): If True, the caller guarantees that no uid is repeated in pairs.
+        **options: Passed on to the engine's constructor by keyword, e.g. capacity or load_factor.
+
+    Returns:
+        PlayerHashMap | PlayerOpenHashMap: The new hash map.
+    """
+    map_class = ENGINES.get(engine)
+    if map_class is None:
+        raise ValueError(f"Unknown engine '{engine}'.")
+    if map_class is PlayerOpenHashMap:
+        unsupported = sorted(option for option in _CHAINING_ONLY if option in options)
+        if unsupported:
+            raise ValueError(f"The open addressing engine doesn't support {', '.join(unsupported)}.")
+    hash_map = map_class(**options)
+    if pairs:
+        hash_map.update(pairs, assume_unique=assume_unique)
+    return hash_map
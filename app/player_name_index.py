@@ -0,0 +1,247 @@
+import bisect
+from app.player import Player
+
+
+def _top_key(player: Player) -> tuple:
+    """Returns the order of the cached top players: highest score first, equal scores by name."""
+    return -player.score, player.name
+
+
+class _NameIndexNode:
+    """A node of the name trie: one character of a name, the player whose name ends here and the children."""
+    __slots__ = ("children", "player", "top")
+
+    def __init__(self):
+        self.children = {} # Child node by next character
+        self.player = None # The player whose name ends at this node, if any
+        self.top = () # The highest scoring players in this subtree, when the index caches them
+
+
+class PlayerNameIndex:
+    """A trie of players keyed by name, for exact and prefix (autocomplete) lookups.
+
+    Like PlayerBST, the name is the key: inserting a player with a name already in the index replaces that
+    player. prefix() walks only the subtree under the prefix, in name order, and stops after the limit, so it
+    costs O(len(prefix) + visited nodes) rather than a scan of every player.
+
+    With top_k set, every node also caches its subtree's top_k highest scoring players (equal scores ordered by
+    name), so top() answers from the prefix's node without visiting its subtree. The caches are kept up to date
+    by a score listener on each indexed player. A new player or a higher score is placed into the caches on the
+    name's path in O(len(name) * top_k); a lower score or a removal recomputes those caches from each node's own
+    player and its children's caches. A player's name must not change while it is in the index. The listener
+    only holds a weak reference to the index, so an index that is dropped without being cleared is still
+    collected.
+    """
+
+    def __init__(self, players=(), top_k: int = 0):
+        """Initialises an index, optionally with some players.
+
+        Args:
+            players (iterable): The players to add.
+            top_k (int): The number of highest scoring players cached at every node. 0 disables the caches.
+        """
+        if top_k < 0:
+            raise ValueError("Top k must not be negative.")
+        self.top_k = top_k
+        self._root = _NameIndexNode()
+        self._count = 0
+        self._listener = Player.weak_score_listener(self._on_score_change) if top_k else None
+        for player in players:
+            self.insert(player)
+
+    def __len__(self) -> int:
+        """Returns the number of players in the index."""
+        return self._count
+
+    def __contains__(self, name: str) -> bool:
+        """Returns True if a player with this name is in the index."""
+        return self.exact(name) is not None
+
+    def _path(self, name: str) -> list | None:
+        """Returns the nodes from the root to the node for a name, or None if there is no such node."""
+        path = [self._root]
+        node = self._root
+        for character in name:
+            node = node.children.get(character)
+            if node is None:
+                return None
+            path.append(node)
+        return path
+
+    def insert(self, player: Player) -> None:
+        """Adds a player by name, replacing any player with the same name.
+
+        Args:
+            player (Player): The player to add.
+        """
+        path = [self._root]
+        node = self._root
+        for character in player.name:
+            child = node.children.get(character)
+            if child is None:
+                child = node.children[character] = _NameIndexNode()
+            node = child
+            path.append(node)
+        replaced = node.player
+        if replaced is None:
+            self._count += 1
+        elif self.top_k:
+            replaced.remove_score_listener(self._listener)
+        node.player = player
+        if self.top_k:
+            player.add_score_listener(self._listener)
+            if replaced is None:
+                self._add_to_top(path, player)
+            else:
+                self._refresh_top(path) # The replaced player may have to make room in the caches
+
+    def delete(self, name: str) -> None:
+        """Removes the player with a name, and any nodes left without players below them.
+
+        Args:
+            name (str): The name of the player to remove.
+        """
+        path = self._path(name)
+        if path is None or path[-1].player is None:
+            raise KeyError(f"Player with name '{name}' not found.")
+        node = path[-1]
+        if self.top_k:
+            node.player.remove_score_listener(self._listener)
+        node.player = None
+        self._count -= 1
+        # Prune the nodes that no longer lead to any player, from the bottom up
+        depth = len(path) - 1
+        while depth > 0 and path[depth].player is None and not path[depth].children:
+            del path[depth - 1].children[name[depth - 1]]
+            depth -= 1
+        if self.top_k:
+            self._refresh_top(path[:depth + 1])
+
+    def clear(self) -> None:
+        """Removes every player from the index, unregistering its score listener from each of them."""
+        if self.top_k:
+            for player in self.prefix(""):
+                player.remove_score_listener(self._listener)
+        self._root = _NameIndexNode()
+        self._count = 0
+
+    def exact(self, name: str) -> Player | None:
+        """Returns the player with exactly this name, or None if there isn't one.
+
+        Args:
+            name (str): The name of the player.
+        """
+        node = self._root
+        for character in name:
+            node = node.children.get(character)
+            if node is None:
+                return None
+        return node.player
+
+    def _find(self, prefix: str) -> _NameIndexNode | None:
+        """Returns the node for a prefix, or None if no name starts with it."""
+        node = self._root
+        for character in prefix:
+            node = node.children.get(character)
+            if node is None:
+                return None
+        return node
+
+    def prefix(self, prefix: str, limit: int | None = None) -> list:
+        """Returns the players whose names start with a prefix, in name order.
+
+        Args:
+            prefix (str): The start of the names. An empty prefix matches every player.
+            limit (int | None): The maximum number of players to return, or None for all of them.
+        """
+        node = self._find(prefix)
+        players = []
+        if node is None or limit == 0:
+            return players
+        # Depth first with an explicit stack; children are pushed in reverse so the smallest is visited first
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.player is not None:
+                players.append(node.player)
+                if len(players) == limit:
+                    break
+            children = node.children
+            if children:
+                stack.extend(children[character] for character in sorted(children, reverse=True))
+        return players
+
+    def top(self, prefix: str, k: int | None = None) -> list:
+        """Returns the highest scoring players whose names start with a prefix, highest first.
+
+        Answered from the prefix node's cache when the index caches top players, otherwise by a heap over the
+        prefix's subtree.
+
+        Args:
+            prefix (str): The start of the names.
+            k (int | None): The number of players; defaults to, and is at most, top_k when caching.
+        """
+        if self.top_k:
+            if k is None:
+                k = self.top_k
+            elif k > self.top_k:
+                raise ValueError(f"Only the top {self.top_k} players are cached.")
+            node = self._find(prefix)
+            return [] if node is None else list(node.top[:k])
+        if k is None:
+            raise ValueError("k is required when the index doesn't cache top players.")
+        return Player.top_k(self.prefix(prefix), k, tie_break="name")
+
+    def _on_score_change(self, player: Player, old_score: int) -> None:
+        """Recomputes the top player caches on the path of a player whose score changed.
+
+        Args:
+            player (Player): The player whose score changed.
+            old_score (int): The score before the change.
+        """
+        path = self._path(player.name)
+        if path is None or path[-1].player is not player:
+            return
+        if player.score > old_score:
+            self._add_to_top(path, player)
+        else:
+            self._refresh_top(path)
+
+    def _add_to_top(self, path: list, player: Player) -> None:
+        """Places a new or improved player into the cached top players on a path, from the deepest node up.
+
+        A player that doesn't make a node's top players can't make those of the nodes above it, as their caches
+        hold the best of a larger subtree, so the walk stops there.
+
+        Args:
+            path (list): Nodes from the root down to the player's node.
+            player (Player): The player to place.
+        """
+        key = (-player.score, player.name)
+        sort_key = _top_key
+        top_k = self.top_k
+        for node in reversed(path):
+            top = list(node.top)
+            for position, cached in enumerate(top):
+                if cached is player:
+                    del top[position] # Its score went up, so it is placed again below
+                    break
+            position = bisect.bisect_left(top, key, key=sort_key)
+            if position >= top_k:
+                return
+            top.insert(position, player)
+            del top[top_k:]
+            node.top = top
+
+    def _refresh_top(self, path: list) -> None:
+        """Recomputes the cached top players of each node on a path, from the deepest node up.
+
+        Args:
+            path (list): Nodes from the root down, each the parent of the next.
+        """
+        top_k = self.top_k
+        for node in reversed(path):
+            candidates = [node.player] if node.player is not None else []
+            for child in node.children.values():
+                candidates.extend(child.top)
+            node.top = Player.top_k(candidates, top_k, tie_break="name")
@@ -5,6 +5,7 @@ class PlayerNode:
     """
     A class that represents a player node in a doubly linked list of players.
     """
+    __slots__ = ("_player", "_next_node", "_previous_node")
 
     def __init__(self, player: Player):
         """
@@ -56,3 +57,32 @@ class PlayerNode:
         prev_uid = self._previous_node.key if self._previous_node else "None"
         next_uid = self._next_node.key if self._next_node else "None"
         return f"Node: player={self._player}, previous_node uid={prev_uid}, next_node uid={next_uid}"
+
+
+class LeanPlayerNode:
+    """
+    A player node with the same interface as PlayerNode, but storing the player and pointers as plain attributes.
+
+    Reading and writing plain slot attributes skips the property calls of PlayerNode, which makes traversing and
+    relinking long lists faster. Used by passing node_type=LeanPlayerNode to PlayerList.
+    """
+    __slots__ = ("player", "next_node", "previous_node")
+
+    def __init__(self, player: Player):
+        """
+        Initialise a player node with pointers to the next_node and previous_node.
+
+        :param player: Represents a player object.
+        """
+        self.player = player
+        self.next_node = None  # A pointer to the next node
+        self.previous_node = None  # A pointer to the previous node
+
+    @property
+    def key(self) -> str:
+        return self.player.uid
+
+    def __str__(self) -> str:
+        prev_uid = self.previous_node.key if self.previous_node else "None"
+        next_uid = self.next_node.key if self.next_node else "None"
+        return f"Node: player={self.player}, previous_node uid={prev_uid}, next_node uid={next_uid}"
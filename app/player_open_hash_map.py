@@ -0,0 +1,299 @@
+import math
+from app.player import Player
+from app.player_dump import dump_players
+from app.player_hash_map import PlayerHashMap
+
+_DELETED = object() # Tombstone left in a slot whose player was deleted, so probing continues past it
+
+
+class PlayerOpenHashMap:
+    """A hash map that stores player data using open addressing with linear probing.
+
+    Instead of a PlayerList per bucket, the players are kept in three flat parallel lists of slots: the full hash
+    of each key, the key itself and the Player. A collision moves on to the next slot until an empty one is found.
+    Deleting a player leaves a tombstone so later players in the same probe sequence can still be found; the
+    tombstones are cleared the next time the slots are rehashed.
+
+    Offers the same API as PlayerHashMap; make_player_map(engine="open_addressing") creates one by engine name.
+    """
+    SIZE: int = 10 # Default initial number of slots
+    LOAD_FACTOR: float = 0.7 # Default maximum fraction of used slots (players and tombstones) before rehashing
+
+    def __init__(self, capacity: int = SIZE, load_factor: float = LOAD_FACTOR, min_load_factor: float = 0.0,
+                 hash_function="auto"):
+        """Initialises a hash map with empty slots.
+
+        Args:
+            capacity (int): The initial number of slots.
+            load_factor (float): The fraction of used slots above which the slots are rehashed. Must be below 1
+                so probing always reaches an empty slot.
+            min_load_factor (float): The load factor below which the number of slots is halved
+                (never below the initial capacity). 0 disables shrinking.
+            hash_function (str | callable): "auto", a name from PlayerHashMap.HASH_FUNCTIONS, or a callable
+                taking a UID.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        if not 0 < load_factor < 1:
+            raise ValueError("Load factor must be between 0 and 1 for open addressing.")
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise ValueError("Minimum load factor must be between 0 and half the load factor.")
+        if (not callable(hash_function) and hash_function != "auto"
+                and hash_function not in PlayerHashMap.HASH_FUNCTIONS):
+            raise ValueError(f"Unknown hash function '{hash_function}'.")
+        self._initial_capacity = capacity
+        self.load_factor = load_factor
+        self.min_load_factor = min_load_factor
+        self.hash_function = hash_function
+        self._hash = self._select_hash(capacity)
+        self._count = 0 # Number of players
+        self._deleted = 0 # Number of tombstones
+        self._hashes = [0] * capacity
+        self._keys = [None] * capacity # None marks an empty slot, _DELETED a tombstone
+        self._players = [None] * capacity
+
+    @property
+    def capacity(self) -> int:
+        """Returns the current number of slots."""
+        return len(self._keys)
+
+    def _select_hash(self, capacity: int):
+        """Returns the hash function to use for a given number of slots.
+
+        Args:
+            capacity (int): The number of slots.
+        """
+        if callable(self.hash_function):
+            return self.hash_function
+        if self.hash_function == "auto":
+            return Player.pearson_hash if capacity <= 256 else Player.pearson_hash_wide
+        return PlayerHashMap.HASH_FUNCTIONS[self.hash_function]
+
+    def get_index(self, key: str) -> int:
+        """Returns the first slot probed for the player's key.
+
+        Args:
+            key (str): The player's UID.
+
+        Returns:
+            int: The home slot in the hash map.
+        """
+        return self._hash(key) % len(self._keys)
+
+    def _find_slot(self, key: str, hash_: int) -> int:
+        """Returns the slot holding the key, or -1 if the key is not in the hash map.
+
+        Args:
+            key (str): The player's UID.
+            hash_ (int): The full hash of the key.
+        """
+        keys = self._keys
+        hashes = self._hashes
+        capacity = len(keys)
+        index = hash_ % capacity
+        while True:
+            slot_key = keys[index]
+            if slot_key is None:
+                return -1
+            # Comparing the stored hashes first avoids most string comparisons
+            if hashes[index] == hash_ and slot_key is not _DELETED and slot_key == key:
+                return index
+            index += 1
+            if index == capacity:
+                index = 0
+
+    def __setitem__(self, key: str, name: str) -> None:
+        """Adds a new player or updates an existing player's name in the hash map.
+
+        Args:
+            key (str): The uid of the player.
+            name (str): The player's name.
+        """
+        hash_ = self._hash(key)
+        keys = self._keys
+        capacity = len(keys)
+        index = hash_ % capacity
+        free_index = -1 # The first tombstone passed, reused for a new player
+        while True:
+            slot_key = keys[index]
+            if slot_key is None:
+                break
+            if slot_key is _DELETED:
+                if free_index == -1:
+                    free_index = index
+            elif self._hashes[index] == hash_ and slot_key == key:
+                self._players[index]._player_name = name
+                return
+            index += 1
+            if index == capacity:
+                index = 0
+        if free_index != -1:
+            index = free_index
+            self._deleted -= 1
+        self._hashes[index] = hash_
+        keys[index] = key
+        self._players[index] = Player(key, name)
+        self._count += 1
+        if self._count + self._deleted > capacity * self.load_factor:
+            # Grow if the players fill the slots, otherwise rehashing at the same size clears the tombstones
+            grow = self._count > capacity * self.load_factor / 2
+            self._resize(capacity * 2 if grow else capacity)
+
+    def __getitem__(self, key: str) -> Player:
+        """Gets a player based off it's key.
+        Args:
+            key (str): The uid of the player.
+
+        Returns: The player
+        """
+        index = self._find_slot(key, self._hash(key))
+        if index == -1:
+            raise KeyError(f"Player with UID '{key}' not found.")
+        return self._players[index]
+
+    def get(self, key: str, default=None) -> Player | None:
+        """Gets a player based off it's key, returning a default instead of raising if they are missing.
+
+        Args:
+            key (str): The uid of the player.
+            default: The value to return if there is no player with this key.
+
+        Returns: The player, or the default
+        """
+        index = self._find_slot(key, self._hash(key))
+        return default if index == -1 else self._players[index]
+
+    def __contains__(self, key: str) -> bool:
+        """Returns True if there is a player with this key."""
+        return self._find_slot(key, self._hash(key)) != -1
+
+    def get_many(self, keys, default=None) -> list:
+        """Gets the players for many keys at once. The keys are hashed in one batch, as in PlayerHashMap.get_many.
+
+        Args:
+            keys (iterable): The uids of the players.
+            default: The value used for keys without a player.
+
+        Returns:
+            list: The player (or default) for each key, in the same order as the keys.
+        """
+        keys = keys if isinstance(keys, (list, tuple)) else list(keys)
+        find_slot = self._find_slot
+        slot_players = self._players
+        players = []
+        for key, hash_ in zip(keys, self._hash_many(keys)):
+            index = find_slot(key, hash_)
+            players.append(default if index == -1 else slot_players[index])
+        return players
+
+    # The same batch hashing and batch update as the chaining engine, which only use _hash and get_many
+    _hash_many = PlayerHashMap._hash_many
+    apply_score_deltas = PlayerHashMap.apply_score_deltas
+
+    def __delitem__(self, key: str) -> None:
+        """Deletes a player based off it's key, leaving a tombstone in its slot."""
+        index = self._find_slot(key, self._hash(key))
+        if index == -1:
+            raise KeyError(f"Player with UID '{key}' not found.")
+        self._keys[index] = _DELETED
+        self._players[index] = None
+        self._count -= 1
+        self._deleted += 1
+        capacity = len(self._keys)
+        if capacity > self._initial_capacity and self._count < capacity * self.min_load_factor:
+            self._resize(max(self._initial_capacity, capacity // 2))
+
+    def update(self, pairs, assume_unique: bool = False) -> None:
+        """Adds or updates many players at once, resizing the slots once up front.
+
+        Args:
+            pairs (iterable | dict): (uid, name) pairs, or a dict of names by uid.
+            assume_unique (bool): If True, the caller guarantees that no uid is repeated in pairs or already in the
+                hash map, so each player is placed in the first free slot without comparing keys.
+        """
+        if isinstance(pairs, dict):
+            pairs = list(pairs.items())
+        elif not isinstance(pairs, (list, tuple)):
+            pairs = list(pairs)
+        if not pairs:
+            return
+        needed = math.ceil((self._count + len(pairs)) / self.load_factor) + 1
+        capacity = len(self._keys)
+        if needed > capacity or self._deleted:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        if not assume_unique:
+            for key, name in pairs:
+                self[key] = name
+            return
+        hash_ = self._hash
+        hashes, keys, players = self._hashes, self._keys, self._players
+        for key, name in pairs:
+            full_hash = hash_(key)
+            index = full_hash % capacity
+            while keys[index] is not None: # There are no tombstones after resizing
+                index += 1
+                if index == capacity:
+                    index = 0
+            hashes[index] = full_hash
+            keys[index] = key
+            players[index] = Player(key, name)
+        self._count += len(pairs)
+
+    def _resize(self, new_capacity: int) -> None:
+        """Reinserts every player into a new set of slots, dropping the tombstones.
+
+        Args:
+            new_capacity (int): The number of slots after resizing.
+        """
+        old_hashes, old_keys, old_players = self._hashes, self._keys, self._players
+        new_hash = self._select_hash(new_capacity)
+        rehash = new_hash is not self._hash # Stored hashes can be reused unless the hash function changes
+        self._hash = new_hash
+        self._hashes = hashes = [0] * new_capacity
+        self._keys = keys = [None] * new_capacity
+        self._players = players = [None] * new_capacity
+        self._deleted = 0
+        for old_index, key in enumerate(old_keys):
+            if key is None or key is _DELETED:
+                continue
+            hash_ = new_hash(key) if rehash else old_hashes[old_index]
+            index = hash_ % new_capacity
+            while keys[index] is not None:
+                index += 1
+                if index == new_capacity:
+                    index = 0
+            hashes[index] = hash_
+            keys[index] = key
+            players[index] = old_players[old_index]
+
+    def __len__(self) -> int:
+        """Returns the total number of players in the hash map."""
+        return self._count
+
+    def players(self):
+        """Yields every player in the hash map."""
+        for player in self._players:
+            if player is not None:
+                yield player
+
+    def display(self) -> None:
+        """Displays each occupied slot with the player it holds. Prints the index of the slot"""
+        for index, key in enumerate(self._keys):
+            if key is not None and key is not _DELETED:
+                print(f"Index {index}:")
+                print(f"  {self._players[index]}")
+                print("-" * 20)
+
+    def dump(self, stream, fmt: str = "text") -> int:
+        """Writes every player to a text stream as they are reached, in constant memory.
+
+        Args:
+            stream: A file-like object opened for writing text.
+            fmt (str): "text", "csv" or "jsonl" (see dump_players).
+
+        Returns:
+            int: The number of players written.
+        """
+        return dump_players(self.players(), stream, fmt)
@@ -0,0 +1,268 @@
+import math
+import operator
+from array import array
+from app.player_map import make_player_map
+
+try:
+    import numpy as np # Optional, used for the vectorised score operations
+except ImportError:
+    np = None
+
+
+MAX_SCORE: int = 2 ** 63 - 1 # The largest score the 64 bit score column holds
+
+
+class PlayerView:
+    """A lightweight, Player-like view of one row of a PlayerStore.
+
+    Holds only the store and the row index; the uid, name and score are read from (and the score written to) the
+    store's columns.
+    """
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index: int):
+        """Initialises a view of a row.
+
+        Args:
+            store (PlayerStore): The store holding the player.
+            index (int): The player's row in the store.
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def uid(self) -> str:
+        """Returns: The uid of the player."""
+        return self._store._uids[self._index]
+
+    @property
+    def name(self) -> str:
+        """Returns: The name of the player."""
+        return self._store._names[self._index]
+
+    @property
+    def score(self) -> int:
+        """Returns: The score of the player."""
+        return self._store._scores[self._index]
+
+    @score.setter
+    def score(self, new_score: int):
+        """Sets the new score for the player.
+
+        Args:
+            new_score (int): The new score of the player
+        """
+        if not isinstance(new_score, int) or new_score < 0:
+            raise ValueError("Score must be a positive integer.")
+        self._store._scores[self._index] = new_score
+
+    def __str__(self) -> str:
+        """Returns a human-readable string representation of the player, matching Player."""
+        return f"Player: uid={self.uid}, name={self.name}"
+
+
+class PlayerStore:
+    """A column (struct of arrays) store of players, for analytics over the whole roster.
+
+    Instead of a Player object per player, the uids and names are kept in two lists and the scores in one
+    contiguous array of 64 bit ints, with a dict from uid to row. PlayerView objects are made on demand when a
+    Player-like object is needed. With NumPy installed, the score operations run over the score array as a whole
+    (shared, not copied); without it they fall back to plain Python loops with the same results.
+    """
+
+    def __init__(self, players=()):
+        """Initialises a store, optionally with some players.
+
+        Args:
+            players (iterable): Player-like objects (with uid, name and score) to add.
+        """
+        self._uids = []
+        self._names = []
+        self._scores = array("q")
+        self._rows = {} # Row of each player by uid
+        for player in players:
+            self.append(player.uid, player.name, player.score)
+
+    @classmethod
+    def from_hash_map(cls, hash_map):
+        """Creates a store holding every player of a PlayerHashMap (of any engine).
+
+        Args:
+            hash_map (PlayerHashMap): The hash map to copy the players from.
+        """
+        return cls(hash_map.players())
+
+    def to_hash_map(self, engine: str = "chaining", **options):
+        """Returns a new hash map holding Player objects for every player, with their scores.
+
+        Args:
+            engine (str): The hash map's storage engine (see make_player_map).
+            **options: Passed on to the hash map's constructor, e.g. load_factor.
+        """
+        hash_map = make_player_map(engine, list(zip(self._uids, self._names)), assume_unique=True, **options)
+        for player, score in zip(hash_map.get_many(self._uids), self._scores):
+            player._set_score_unchecked(score) # Already validated by the store
+        return hash_map
+
+    def __len__(self) -> int:
+        """Returns the number of players in the store."""
+        return len(self._uids)
+
+    def __contains__(self, uid: str) -> bool:
+        """Returns True if the player with this uid is in the store."""
+        return uid in self._rows
+
+    def __getitem__(self, uid: str) -> PlayerView:
+        """Returns a view of the player with this uid.
+
+        Args:
+            uid (str): The uid of the player.
+        """
+        row = self._rows.get(uid)
+        if row is None:
+            raise KeyError(f"Player with UID '{uid}' not found.")
+        return PlayerView(self, row)
+
+    def __iter__(self):
+        """Yields a view of every player, in the order they were added."""
+        for row in range(len(self._uids)):
+            yield PlayerView(self, row)
+
+    def append(self, uid: str, name: str, score: int = 0) -> None:
+        """Adds a player to the store.
+
+        Args:
+            uid (str): The uid of the player.
+            name (str): The name of the player.
+            score (int): The score of the player.
+        """
+        if uid in self._rows:
+            raise ValueError(f"Player with UID '{uid}' is already in the store.")
+        if not isinstance(score, int) or score < 0:
+            raise ValueError("Score must be a positive integer.")
+        self._rows[uid] = len(self._uids)
+        self._uids.append(uid)
+        self._names.append(name)
+        self._scores.append(score)
+
+    def _score_array(self):
+        """Returns a NumPy array sharing the score column's memory.
+
+        Only kept for the duration of one operation, and released before any error propagates, as the score array
+        can't grow while it is shared.
+        """
+        return np.frombuffer(self._scores, dtype=np.int64) if self._scores else np.zeros(0, dtype=np.int64)
+
+    def add_scores(self, deltas) -> None:
+        """Adds a delta to the score of many players at once.
+
+        Every resulting score is checked before any is changed, so either all the deltas are applied or none are.
+        A score that would go above MAX_SCORE raises ValueError, with or without NumPy.
+
+        Args:
+            deltas (dict | iterable): Score deltas by uid, or (uid, delta) pairs. Deltas are ints or other integer
+                types such as NumPy's, but not bools. Deltas for the same uid add up.
+        """
+        totals = {}
+        for uid, delta in (deltas.items() if isinstance(deltas, dict) else deltas):
+            row = self._rows.get(uid)
+            if row is None:
+                raise KeyError(f"Player with UID '{uid}' not found.")
+            if isinstance(delta, bool):
+                raise ValueError("Score deltas must be integers.")
+            try:
+                delta = operator.index(delta)
+            except TypeError:
+                raise ValueError("Score deltas must be integers.") from None
+            totals[row] = totals.get(row, 0) + delta
+        if not totals:
+            return
+        if any(abs(total) > MAX_SCORE for total in totals.values()):
+            raise ValueError(f"Score must not be above {MAX_SCORE}.")
+        if np is not None:
+            rows = np.fromiter(totals.keys(), dtype=np.int64, count=len(totals))
+            totals_array = np.fromiter(totals.values(), dtype=np.int64, count=len(totals))
+            scores = self._score_array()
+            try:
+                new_scores = scores[rows] + totals_array
+                # Scores and totals are within 64 bits, so only a positive total can wrap around, to a negative sum
+                negative = new_scores < 0
+                if negative.any():
+                    if (negative & (totals_array > 0)).any():
+                        raise ValueError(f"Score must not be above {MAX_SCORE}.")
+                    raise ValueError("Score must be a positive integer.")
+                scores[rows] = new_scores
+            finally:
+                del scores # A raised error keeps this frame alive, and the view would stop the column growing
+            return
+        scores = self._scores
+        new_scores = [scores[row] + total for row, total in totals.items()]
+        if any(score > MAX_SCORE for score in new_scores):
+            raise ValueError(f"Score must not be above {MAX_SCORE}.")
+        if any(score < 0 for score in new_scores):
+            raise ValueError("Score must be a positive integer.")
+        for row, score in zip(totals, new_scores):
+            scores[row] = score
+
+    def filter_by_score(self, min_score: int | None = None, max_score: int | None = None) -> list:
+        """Returns views of the players whose score is within a range (inclusive), in the order they were added.
+
+        Args:
+            min_score (int | None): The lowest score to include, or None for no lower bound.
+            max_score (int | None): The highest score to include, or None for no upper bound.
+        """
+        if np is not None:
+            scores = self._score_array()
+            try:
+                mask = np.ones(len(scores), dtype=bool)
+                if min_score is not None:
+                    mask &= scores >= min_score
+                if max_score is not None:
+                    mask &= scores <= max_score
+            finally:
+                del scores
+            rows = np.flatnonzero(mask).tolist()
+        else:
+            low = -math.inf if min_score is None else min_score
+            high = math.inf if max_score is None else max_score
+            rows = [row for row, score in enumerate(self._scores) if low <= score <= high]
+        return [PlayerView(self, row) for row in rows]
+
+    def total_score(self) -> int:
+        """Returns the sum of every player's score."""
+        if np is not None:
+            return int(self._score_array().sum())
+        return sum(self._scores)
+
+    def mean_score(self) -> float:
+        """Returns the mean score."""
+        if not self._scores:
+            raise ValueError("Cannot take the mean of an empty store.")
+        return self.total_score() / len(self._scores)
+
+    def percentile(self, percent: float) -> float:
+        """Returns the score at a percentile, interpolating linearly between the closest scores.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+        """
+        if not self._scores:
+            raise ValueError("Cannot take a percentile of an empty store.")
+        if not 0 <= percent <= 100:
+            raise ValueError("Percent must be between 0 and 100.")
+        if np is not None:
+            return float(np.percentile(self._score_array(), percent))
+        scores = sorted(self._scores)
+        position = percent / 100 * (len(scores) - 1)
+        lower = math.floor(position)
+        upper = min(lower + 1, len(scores) - 1)
+        return scores[lower] + (scores[upper] - scores[lower]) * (position - lower)
+
+    def sort_by_score(self) -> list:
+        """Returns views of every player in descending order of score; equal scores keep the order they were added.
+        """
+        if np is not None:
+            rows = np.argsort(-self._score_array(), kind="stable").tolist()
+        else:
+            rows = sorted(range(len(self._scores)), key=self._scores.__getitem__, reverse=True)
+        return [PlayerView(self, row) for row in rows]
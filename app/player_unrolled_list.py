@@ -0,0 +1,252 @@
+from app.player import Player
+from app.player_dump import dump_players
+
+
+class PlayerChunk:
+    """A node of an unrolled list, holding up to a fixed number of players in order.
+
+    The uids are kept in a list alongside the players, so a chunk is searched with list.index (run in C) rather
+    than by reading each player's uid in Python.
+    """
+    __slots__ = ("uids", "players", "next_node", "previous_node")
+
+    def __init__(self):
+        """Initialises an empty chunk with no neighbours."""
+        self.uids = []
+        self.players = []
+        self.next_node = None # A pointer to the next chunk
+        self.previous_node = None # A pointer to the previous chunk
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(str(player) for player in self.players) + "]"
+
+
+class PlayerUnrolledList:
+    """A doubly linked list of players where each node (a PlayerChunk) holds up to chunk_size players.
+
+    Offers the same operations as PlayerList: appending at the head or tail, deleting the head, tail or a player
+    by uid, finding a player by uid, iterating in both directions and displaying the list. Storing many players
+    per node means far fewer node objects to allocate and follow, so walking and searching a long list is faster.
+    Deleting a player shifts the rest of its chunk, and a chunk left less than half full is merged with a
+    neighbour when they fit in one chunk, so the chunks stay reasonably full.
+    """
+    CHUNK_SIZE: int = 64 # Default maximum number of players per chunk
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        """Initialises an empty list.
+
+        Args:
+            chunk_size (int): The maximum number of players in each chunk.
+        """
+        if chunk_size < 2:
+            raise ValueError("Chunk size must be at least 2.")
+        self.chunk_size = chunk_size
+        self._head = None # The first chunk, or None if the list is empty
+        self._tail = None # The last chunk, or None if the list is empty
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Returns the number of players in the list."""
+        return self._size
+
+    def is_empty(self) -> bool:
+        """Returns True if the list holds no players."""
+        return self._head is None
+
+    def __iter__(self):
+        """Yields the players from head to tail."""
+        chunk = self._head
+        while chunk is not None:
+            yield from chunk.players
+            chunk = chunk.next_node
+
+    def __reversed__(self):
+        """Yields the players from tail to head."""
+        chunk = self._tail
+        while chunk is not None:
+            yield from reversed(chunk.players)
+            chunk = chunk.previous_node
+
+    def _new_chunk(self, before: PlayerChunk | None, after: PlayerChunk | None) -> PlayerChunk:
+        """Links a new empty chunk between two neighbouring chunks (None at either end of the list)."""
+        chunk = PlayerChunk()
+        chunk.previous_node = before
+        chunk.next_node = after
+        if before is None:
+            self._head = chunk
+        else:
+            before.next_node = chunk
+        if after is None:
+            self._tail = chunk
+        else:
+            after.previous_node = chunk
+        return chunk
+
+    def _unlink_chunk(self, chunk: PlayerChunk) -> None:
+        """Removes a chunk from the list by rewriting its neighbours' references."""
+        if chunk.previous_node is None:
+            self._head = chunk.next_node
+        else:
+            chunk.previous_node.next_node = chunk.next_node
+        if chunk.next_node is None:
+            self._tail = chunk.previous_node
+        else:
+            chunk.next_node.previous_node = chunk.previous_node
+
+    def append_node_to_head(self, player: Player) -> None:
+        """Inserts a player at the head of the list, starting a new chunk if the head chunk is full.
+
+        Args:
+            player (Player): The player to insert.
+        """
+        chunk = self._head
+        if chunk is None or len(chunk.players) >= self.chunk_size:
+            chunk = self._new_chunk(None, chunk)
+        chunk.uids.insert(0, player.uid)
+        chunk.players.insert(0, player)
+        self._size += 1
+
+    def append_node_to_tail(self, player: Player) -> None:
+        """Inserts a player at the tail of the list, starting a new chunk if the tail chunk is full.
+
+        Args:
+            player (Player): The player to insert.
+        """
+        chunk = self._tail
+        if chunk is None or len(chunk.players) >= self.chunk_size:
+            chunk = self._new_chunk(chunk, None)
+        chunk.uids.append(player.uid)
+        chunk.players.append(player)
+        self._size += 1
+
+    def delete_head(self) -> None:
+        """Deletes the player at the head of the list."""
+        if self.is_empty():
+            raise IndexError("Cannot delete from an empty list.")
+        self._delete_at(self._head, 0)
+
+    def delete_tail(self) -> None:
+        """Deletes the player at the tail of the list."""
+        if self.is_empty():
+            raise IndexError("Cannot delete from an empty list.")
+        self._delete_at(self._tail, len(self._tail.players) - 1)
+
+    def _find(self, uid: str) -> tuple:
+        """Returns the chunk holding a uid and the uid's position in it, or (None, -1) if it isn't in the list."""
+        chunk = self._head
+        while chunk is not None:
+            if uid in chunk.uids:
+                return chunk, chunk.uids.index(uid)
+            chunk = chunk.next_node
+        return None, -1
+
+    def delete_by_key(self, key: str) -> None:
+        """Deletes a player by their uid.
+
+        Args:
+            key (str): The uid of the player to delete.
+        """
+        chunk, position = self._find(key)
+        if chunk is None:
+            raise ValueError(f"Node with key {key} not found.")
+        self._delete_at(chunk, position)
+
+    def _delete_at(self, chunk: PlayerChunk, position: int) -> None:
+        """Deletes the player at a position of a chunk, then removes or merges the chunk if it is sparse."""
+        del chunk.uids[position]
+        del chunk.players[position]
+        self._size -= 1
+        count = len(chunk.players)
+        if count == 0:
+            self._unlink_chunk(chunk)
+        elif count < self.chunk_size // 2:
+            # Merge with a neighbour when both fit in one chunk, so the chunks don't become mostly empty
+            next_chunk = chunk.next_node
+            if next_chunk is not None and count + len(next_chunk.players) <= self.chunk_size:
+                chunk.uids.extend(next_chunk.uids)
+                chunk.players.extend(next_chunk.players)
+                self._unlink_chunk(next_chunk)
+            elif chunk.previous_node is not None and count + len(chunk.previous_node.players) <= self.chunk_size:
+                chunk.previous_node.uids.extend(chunk.uids)
+                chunk.previous_node.players.extend(chunk.players)
+                self._unlink_chunk(chunk)
+
+    def delete_player_by_uid(self, uid: str) -> None:
+        """Deletes a player from the list based on their UID.
+
+        Args:
+            uid (str): The UID of the player to delete.
+        """
+        self.delete_by_key(uid)
+
+    def find_player_by_uid(self, uid: str) -> Player | None:
+        """Retrieves a player from the list based on their UID, without raising if they are missing.
+
+        Args:
+            uid (str): The UID of the player.
+
+        Returns:
+            The player with the matching UID, or None if there isn't one.
+        """
+        chunk, position = self._find(uid)
+        return None if chunk is None else chunk.players[position]
+
+    def get_player_by_uid(self, uid: str) -> Player:
+        """Retrieves a player from the list based on their UID.
+
+        Args:
+            uid (str): The UID of the player.
+
+        Returns:
+            The player with the matching UID.
+        """
+        player = self.find_player_by_uid(uid)
+        if player is None:
+            raise KeyError(f"Player with UID '{uid}' not found.")
+        return player
+
+    def add_or_update_player(self, player: Player) -> bool:
+        """Adds a new player to the tail of the list or updates the player's name if they already exist.
+
+        Returns:
+            bool: True if a new player was added, False if an existing player was updated.
+        """
+        existing = self.find_player_by_uid(player.uid)
+        if existing is not None:
+            existing._player_name = player.name
+            return False
+        self.append_node_to_tail(player)
+        return True
+
+    def display(self, forward: bool = True) -> None:
+        """Displays the players in the list, one chunk at a time.
+
+        :Args
+            forward (bool): Direction in which to display the list. True will print head to tail.
+        """
+        if self.is_empty():
+            print("  (No players)")
+            return
+
+        # Each chunk's players are printed as they are reached, rather than joining the whole list into one string
+        separator = "  "
+        chunk = self._head if forward else self._tail
+        while chunk:
+            print(separator + "[", end="")
+            print(*(chunk.players if forward else reversed(chunk.players)), sep=", ", end="]")
+            separator = "   (linked node-->)   "
+            chunk = chunk.next_node if forward else chunk.previous_node
+        print()
+
+    def dump(self, stream, fmt: str = "text", forward: bool = True) -> int:
+        """Writes the players to a text stream as they are reached, in constant memory.
+
+        Args:
+            stream: A file-like object opened for writing text.
+            fmt (str): "text", "csv" or "jsonl" (see dump_players).
+            forward (bool): True writes head to tail, False tail to head.
+
+        Returns:
+            int: The number of players written.
+        """
+        return dump_players(iter(self) if forward else reversed(self), stream, fmt)
@@ -0,0 +1,71 @@
+"""Compares PlayerBST.balance with the previous list-and-slice rebuild, on degenerate trees of up to 10^6 nodes.
+
+Each tree is the shape inserting players in name order gives: a chain of right children. It is linked directly,
+as inserting 10^6 players into an unbalanced tree would take hours. The time of each balance is measured
+without tracing, then the peak memory allocated during a second balance of a new tree is traced.
+
+Run from the repository root (pass a smaller maximum exponent, e.g. 5, for a quicker run):
+    python -m benchmarks.bench_bst_balance [max_exponent]
+"""
+import sys
+import time
+import tracemalloc
+from app.player import Player
+from app.player_bst import PlayerBST
+
+
+def degenerate_tree(players: list) -> PlayerBST:
+    """Returns an unbalanced BST of the players (sorted by name) linked as a chain of right children."""
+    bst = PlayerBST()
+    previous_node = None
+    for player in players:
+        node = bst._node_type(player)
+        if previous_node is None:
+            bst.root = node
+        else:
+            previous_node.right = node
+        previous_node = node
+    return bst
+
+
+def copying_balance(bst: PlayerBST) -> None:
+    """The previous balance: lists the players, then builds new nodes from slices of the list."""
+
+    def build(players_list):
+        if not players_list:
+            return None
+        mid = len(players_list) // 2
+        root = bst._node_type(players_list[mid])
+        root.left = build(players_list[:mid])
+        root.right = build(players_list[mid + 1:])
+        return root
+
+    bst.root = build(bst.in_order_traversal())
+
+
+def _measure(balance, players: list) -> tuple:
+    """Returns the seconds one balance of a new degenerate tree takes, and the peak bytes allocated by another."""
+    bst = degenerate_tree(players)
+    start = time.perf_counter()
+    balance(bst)
+    seconds = time.perf_counter() - start
+    bst = degenerate_tree(players)
+    tracemalloc.start()
+    balance(bst)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    for exponent in range(4, max_exponent + 1):
+        n = 10 ** exponent
+        players = [Player(str(i), f"Player {i:08d}") for i in range(n)]
+        for name, balance in (("copying", copying_balance), ("in place", PlayerBST.balance)):
+            seconds, peak = _measure(balance, players)
+            print(f"n={n:>8}  {name:<9} {seconds:7.3f}s  peak={peak / 2 ** 20:8.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Compares the chaining and open addressing PlayerHashMap engines, and bulk loading against one-by-one inserts.
+
+Run from the repository root:
+    python -m benchmarks.bench_hash_map
+"""
+import time
+from app.player_map import ENGINES, make_player_map
+
+
+def _time(function) -> float:
+    """Returns how long a call to function takes, in seconds."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def bench_engine(engine: str, n: int) -> dict:
+    """Times inserting, looking up (hits and misses) and deleting n players with one engine."""
+    keys = [f"uid{i:08d}" for i in range(n)]
+    misses = [f"missing{i:08d}" for i in range(n)]
+    hash_map = make_player_map(engine)
+
+    def insert():
+        for key in keys:
+            hash_map[key] = "Player"
+
+    def lookup():
+        for key in keys:
+            _ = hash_map[key]
+
+    def lookup_misses():
+        for key in misses:
+            try:
+                _ = hash_map[key]
+            except KeyError:
+                pass
+
+    def delete():
+        for key in keys:
+            del hash_map[key]
+
+    return {
+        "insert": _time(insert),
+        "lookup": _time(lookup),
+        "miss": _time(lookup_misses),
+        "delete": _time(delete),
+    }
+
+
+def bench_bulk_load(engine: str, n: int) -> dict:
+    """Times loading n players one at a time against passing them all to make_player_map."""
+    pairs = [(f"uid{i:08d}", "Player") for i in range(n)]
+
+    def one_by_one():
+        hash_map = make_player_map(engine)
+        for key, name in pairs:
+            hash_map[key] = name
+
+    return {
+        "setitem": _time(one_by_one),
+        "from_pairs": _time(lambda: make_player_map(engine, pairs)),
+        "unique": _time(lambda: make_player_map(engine, pairs, assume_unique=True)),
+    }
+
+
+def main():
+    for n in (10 ** 3, 10 ** 4, 10 ** 5):
+        for engine in ENGINES:
+            results = bench_engine(engine, n)
+            timings = "  ".join(f"{name}={seconds * 1e9 / n:8.0f}ns" for name, seconds in results.items())
+            print(f"n={n:>8}  {engine:<16} {timings}")
+    for n in (10 ** 4, 10 ** 5):
+        for engine in ENGINES:
+            results = bench_bulk_load(engine, n)
+            timings = "  ".join(f"{name}={seconds:6.3f}s" for name, seconds in results.items())
+            print(f"load n={n:>8}  {engine:<16} {timings}")
+
+
+if __name__ == "__main__":
+    main()
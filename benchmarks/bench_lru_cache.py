@@ -0,0 +1,70 @@
+"""Compares PlayerLRUCache with an LRU cache wrapping collections.OrderedDict.
+
+Replays the same random, skewed stream of reads through both caches; a miss is followed by a put, as a
+read-through cache would do.
+
+Run from the repository root:
+    python -m benchmarks.bench_lru_cache
+"""
+import random
+import time
+from collections import OrderedDict
+from app.player import Player
+from app.player_lru_cache import PlayerLRUCache
+
+
+class OrderedDictLRUCache:
+    """The OrderedDict based LRU cache PlayerLRUCache is compared with, counting hits, misses and evictions."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._players = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, uid: str, default=None):
+        player = self._players.get(uid)
+        if player is None:
+            self.misses += 1
+            return default
+        self._players.move_to_end(uid)
+        self.hits += 1
+        return player
+
+    def put(self, player: Player) -> None:
+        self._players[player.uid] = player
+        self._players.move_to_end(player.uid)
+        if len(self._players) > self.capacity:
+            self._players.popitem(last=False)
+            self.evictions += 1
+
+
+def _replay(cache, stream, players) -> float:
+    """Returns the seconds taken to replay a stream of reads through a cache."""
+    start = time.perf_counter()
+    get = cache.get
+    put = cache.put
+    for index in stream:
+        if get(players[index].uid) is None:
+            put(players[index])
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(1)
+    n = 10 ** 5
+    players = [Player(f"uid{i:08d}", f"Player {i}") for i in range(n)]
+    # Skewed towards low indexes, so a small cache still gets a useful hit rate
+    stream = [min(n - 1, int(rng.paretovariate(1.2)) - 1) for _ in range(10 ** 6)]
+    for capacity in (100, 1_000, 10_000):
+        for name, cache in (("PlayerLRUCache", PlayerLRUCache(capacity)),
+                            ("OrderedDict", OrderedDictLRUCache(capacity))):
+            seconds = _replay(cache, stream, players)
+            hit_rate = cache.hits / (cache.hits + cache.misses)
+            print(f"capacity={capacity:>6}  {name:<15} {seconds * 1e9 / len(stream):6.0f}ns/read  "
+                  f"hit_rate={hit_rate:.3f}  evictions={cache.evictions}")
+
+
+if __name__ == "__main__":
+    main()
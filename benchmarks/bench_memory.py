@@ -0,0 +1,74 @@
+"""Measures the memory used per player by Player, PlayerNode and PlayerBNode.
+
+The "dict" rows use copies of the classes as they were before __slots__ (a per-instance __dict__), the "slots"
+rows the current classes and the "lean" rows the plain attribute node variants.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory
+"""
+import tracemalloc
+from app.player import Player
+from app.player_node import PlayerNode, LeanPlayerNode
+from app.player_bnode import PlayerBNode, LeanPlayerBNode
+
+
+class _DictPlayer:
+    """Player laid out as before __slots__."""
+
+    def __init__(self, unique_id: str, player_name: str):
+        self._unique_id = unique_id
+        self._player_name = player_name
+        self._score = 0
+
+
+class _DictPlayerNode:
+    """PlayerNode laid out as before __slots__."""
+
+    def __init__(self, player):
+        self._player = player
+        self._next_node = None
+        self._previous_node = None
+
+
+class _DictPlayerBNode:
+    """PlayerBNode laid out as before __slots__."""
+
+    def __init__(self, player):
+        self._player = player
+        self._left = None
+        self._right = None
+
+
+def bytes_per_player(player_type, node_types, n: int) -> float:
+    """Returns the bytes allocated per player for n players, each held in one node of every node type.
+
+    The uid and name strings are created before measuring, so only the objects themselves are counted.
+    """
+    uids = [f"uid{i:08d}" for i in range(n)]
+    names = [f"Player {i}" for i in range(n)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    players = [player_type(uid, name) for uid, name in zip(uids, names)]
+    nodes = [[node_type(player) for player in players] for node_type in node_types]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del players, nodes
+    # The lists holding the objects are the same size in every layout
+    return (after - before) / n
+
+
+def main():
+    n = 100_000
+    layouts = {
+        "dict": (_DictPlayer, (_DictPlayerNode, _DictPlayerBNode)),
+        "slots": (Player, (PlayerNode, PlayerBNode)),
+        "lean": (Player, (LeanPlayerNode, LeanPlayerBNode)),
+    }
+    for layout, (player_type, node_types) in layouts.items():
+        player_only = bytes_per_player(player_type, (), n)
+        with_nodes = bytes_per_player(player_type, node_types, n)
+        print(f"{layout:<6} player={player_only:6.1f} bytes  player+list node+BST node={with_nodes:6.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compares apply_score_deltas with the naive loop of lookups and score assignments it replaces.
+
+Both apply the same random deltas to a map of players, for each engine. Each is timed as the best of a few runs,
+on the same map, so the scores keep growing but every run does the same work.
+
+Run from the repository root (pass a smaller exponent for the number of players, e.g. 5, for a quicker run):
+    python -m benchmarks.bench_score_deltas [players_exponent]
+"""
+import random
+import sys
+import time
+from app.player_map import ENGINES, make_player_map
+
+REPEATS = 3 # Runs of each update, the fastest is reported
+
+
+def naive_loop(hash_map, deltas: dict) -> None:
+    """Applies the deltas one player at a time, as callers did before apply_score_deltas."""
+    for uid, delta in deltas.items():
+        hash_map[uid].score += delta
+
+
+def _best_time(function, *args) -> float:
+    """Returns the fastest of REPEATS calls to function, in seconds."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = 10 ** (int(sys.argv[1]) if len(sys.argv) > 1 else 6)
+    rng = random.Random(1)
+    for engine in ENGINES:
+        hash_map = make_player_map(engine, [(f"uid{i:08d}", f"Player {i}") for i in range(n)], assume_unique=True)
+        for batch in (10 ** 3, 10 ** 4, 10 ** 5):
+            deltas = {f"uid{rng.randrange(n):08d}": rng.randrange(1, 100) for _ in range(batch)}
+            loop = _best_time(naive_loop, hash_map, deltas)
+            batched = _best_time(hash_map.apply_score_deltas, deltas)
+            print(f"{engine:<16} n={n}  deltas={len(deltas):>6}  loop={loop:.3f}s  "
+                  f"apply_score_deltas={batched:.3f}s  speed-up={loop / batched:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Compares the comparison, counting and radix sorts of Player.sort_players.
+
+Each size is timed with a narrow score range (100 distinct scores) and a wide one (as many scores as players).
+10 ** 7 players need several GB of memory, so the largest size is a command line argument.
+
+Run from the repository root:
+    python -m benchmarks.bench_sorting [max_exponent, default 6]
+"""
+import random
+import sys
+import time
+from app.player import Player
+
+
+def bench_sort(n: int, score_range: int) -> dict:
+    """Times each sort method on the same n players with scores drawn from range(score_range)."""
+    random.seed(42)
+    players = [Player(str(uid), "Player") for uid in range(n)]
+    for player in players:
+        player.score = random.randrange(score_range)
+    results = {}
+    for method in ("comparison", "counting", "radix", "auto"):
+        to_sort = players[:]
+        start = time.perf_counter()
+        Player.sort_players(to_sort, method=method)
+        results[method] = time.perf_counter() - start
+    return results
+
+
+def main():
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    for exponent in range(3, max_exponent + 1):
+        n = 10 ** exponent
+        for score_range in (100, n):
+            results = bench_sort(n, score_range)
+            timings = "  ".join(f"{method}={seconds:8.4f}s" for method, seconds in results.items())
+            print(f"n=10^{exponent}  range={score_range:>10}  {timings}")
+
+
+if __name__ == "__main__":
+    main()
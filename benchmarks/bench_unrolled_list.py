@@ -0,0 +1,76 @@
+"""Compares PlayerUnrolledList with PlayerList (one PlayerNode per player) for appends, traversal and deletes.
+
+Deleting by uid searches the list, so only a fixed number of random uids are deleted at each size and the time
+is reported per delete.
+
+Run from the repository root (pass a smaller maximum exponent, e.g. 5, for a quicker run):
+    python -m benchmarks.bench_unrolled_list [max_exponent]
+"""
+import random
+import sys
+import time
+from app.player import Player
+from app.player_list import PlayerList
+from app.player_node import LeanPlayerNode
+from app.player_unrolled_list import PlayerUnrolledList
+
+DELETES = 200 # Number of deletes by uid timed at each size
+
+
+def _time(function) -> float:
+    """Returns how long a call to function takes, in seconds."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def bench_list(make_list, players, doomed) -> dict:
+    """Times appending every player, walking the list both ways, deleting some uids and emptying it from the head."""
+    player_list = make_list()
+
+    def append():
+        for player in players:
+            player_list.append_node_to_tail(player)
+
+    def traverse():
+        for _ in player_list:
+            pass
+        for _ in reversed(player_list):
+            pass
+
+    def delete_by_uid():
+        for uid in doomed:
+            player_list.delete_by_key(uid)
+
+    def delete_head():
+        while not player_list.is_empty():
+            player_list.delete_head()
+
+    return {
+        "append": _time(append) / len(players),
+        "traverse": _time(traverse) / (2 * len(players)),
+        "delete_by_uid": _time(delete_by_uid) / len(doomed),
+        "delete_head": _time(delete_head) / (len(players) - len(doomed)),
+    }
+
+
+def main():
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    rng = random.Random(1)
+    variants = (
+        ("PlayerList", PlayerList),
+        ("PlayerList lean", lambda: PlayerList(node_type=LeanPlayerNode)),
+        ("PlayerUnrolledList", PlayerUnrolledList),
+    )
+    for exponent in range(4, max_exponent + 1):
+        n = 10 ** exponent
+        players = [Player(f"uid{i:08d}", f"Player {i}") for i in range(n)]
+        doomed = [player.uid for player in rng.sample(players, DELETES)]
+        for name, make_list in variants:
+            results = bench_list(make_list, players, doomed)
+            timings = "  ".join(f"{operation}={seconds * 1e9:10.0f}ns" for operation, seconds in results.items())
+            print(f"n={n:>8}  {name:<19} {timings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import unittest
 from app.player_list import PlayerList
 from app.player import Player
+from app.player_node import LeanPlayerNode
 
 """
 Unit tests for the player_list class.
@@ -13,6 +14,13 @@ Tests included:
     - Appending a node to an empty list at the tail (node should become the tail node)
     - Appending a node to a list that is not empty at the tail
     - That the tail references are correctly replaced when appending a new node
+    - Building and deleting from a list of lean nodes
+    - Keeping the uid index of an indexed list in sync with the list
+    - Refusing duplicate uids in an indexed list
+    - Iterating forwards and backwards, and the length kept by appends and deletes
+    - Extending and splicing lists by relinking their ends
+    - Finding nodes by uid and moving them to the head
+    - Clearing a list and its uid index
 """
 
 
@@ -185,5 +193,147 @@ class TestPlayerList(unittest.TestCase):
         with self.assertRaises(ValueError):
             player_list.delete_by_key("999999")
 
+    # Test that a list of lean nodes behaves like a list of PlayerNodes
+    def test_lean_nodes(self):
+        player_list = PlayerList(node_type=LeanPlayerNode)
+        player_list.append_node_to_head(Player("12345", "Greg"))
+        player_list.append_node_to_tail(Player("654321", "Tom"))
+        player_list.append_node_to_tail(Player("987654", "Simon"))
+        self.assertIsInstance(player_list.head, LeanPlayerNode)
+        self.assertEqual(player_list.get_player_by_uid("654321").name, "Tom")
+        player_list.delete_by_key("654321")
+        self.assertEqual(player_list.head.next_node, player_list.tail)
+        self.assertEqual(player_list.tail.previous_node.key, "12345")
+
+    # Test that the uid index follows every append and delete, and that the order of the list is kept
+    def test_indexed_list(self):
+        player_list = PlayerList(indexed=True)
+        for uid in ("1", "2", "3", "4", "5"):
+            player_list.append_node_to_tail(Player(uid, f"Player {uid}"))
+        player_list.append_node_to_head(Player("0", "Player 0"))
+        self.assertTrue(player_list.indexed)
+        self.assertEqual(player_list.get_player_by_uid("3").name, "Player 3")
+        self.assertIsNone(player_list.find_player_by_uid("9"))
+
+        player_list.delete_by_key("3")
+        player_list.delete_head()
+        player_list.delete_tail()
+        self.assertEqual(sorted(player_list._index), ["1", "2", "4"])
+        self.assertIsNone(player_list.find_player_by_uid("3"))
+        self.assertEqual(player_list.head.key, "1")
+        self.assertEqual(player_list.head.next_node.key, "2")
+        self.assertEqual(player_list.tail.previous_node.key, "2")
+        with self.assertRaises(ValueError):
+            player_list.delete_by_key("3")
+
+        self.assertFalse(player_list.add_or_update_player(Player("2", "Renamed")))
+        self.assertTrue(player_list.add_or_update_player(Player("6", "Player 6")))
+        self.assertEqual(player_list.get_player_by_uid("2").name, "Renamed")
+        self.assertEqual(player_list.tail.key, "6")
+
+    # Test that an indexed list refuses a second node with the same uid
+    def test_indexed_list_duplicate_uid(self):
+        player_list = PlayerList(indexed=True)
+        player_list.append_node_to_tail(Player("1", "Greg"))
+        with self.assertRaises(ValueError):
+            player_list.append_node_to_head(Player("1", "Tom"))
+        self.assertEqual(player_list.head, player_list.tail)
+
+    # Test finding nodes by uid, with and without an index, and moving them to the head from any position
+    def test_get_node_and_move_to_head(self):
+        for indexed in (False, True):
+            player_list = PlayerList(indexed=indexed)
+            for uid in ("1", "2", "3", "4"):
+                player_list.append_node_to_tail(Player(uid, f"Player {uid}"))
+            self.assertEqual(player_list.get_node("3").player.name, "Player 3")
+            self.assertIsNone(player_list.get_node("9"))
+
+            player_list.move_node_to_head(player_list.get_node("3")) # From the middle
+            self.assertEqual([player.uid for player in player_list], ["3", "1", "2", "4"])
+            player_list.move_node_to_head(player_list.get_node("4")) # From the tail
+            self.assertEqual([player.uid for player in player_list], ["4", "3", "1", "2"])
+            self.assertEqual(player_list.tail.key, "2")
+            player_list.move_node_to_head(player_list.head) # Already the head
+            self.assertEqual([player.uid for player in reversed(player_list)], ["2", "1", "3", "4"])
+            self.assertIsNone(player_list.head.previous_node)
+            self.assertEqual(len(player_list), 4)
+
+    # Test iterating a list in both directions, and that its length follows every append and delete
+    def test_iteration_and_length(self):
+        player_list = PlayerList()
+        self.assertEqual(len(player_list), 0)
+        self.assertEqual(list(player_list), [])
+        for uid in ("2", "3", "4"):
+            player_list.append_node_to_tail(Player(uid, f"Player {uid}"))
+        player_list.append_node_to_head(Player("1", "Player 1"))
+        self.assertEqual([player.uid for player in player_list], ["1", "2", "3", "4"])
+        self.assertEqual([player.uid for player in reversed(player_list)], ["4", "3", "2", "1"])
+        self.assertEqual(len(player_list), 4)
+        player_list.delete_head()
+        player_list.delete_tail()
+        player_list.delete_by_key("2")
+        self.assertEqual(len(player_list), 1)
+        with self.assertRaises(ValueError):
+            player_list.delete_by_key("2")
+        self.assertEqual(len(player_list), 1)
+
+    # Test extending with another list (which is left empty), with players, and splicing into the middle
+    def test_extend_and_splice(self):
+        first = PlayerList()
+        second = PlayerList()
+        for uid in ("1", "2"):
+            first.append_node_to_tail(Player(uid, "Greg"))
+        for uid in ("5", "6"):
+            second.append_node_to_tail(Player(uid, "Tom"))
+        first.extend(second)
+        self.assertEqual([player.uid for player in first], ["1", "2", "5", "6"])
+        self.assertEqual([player.uid for player in reversed(first)], ["6", "5", "2", "1"])
+        self.assertTrue(second.is_empty())
+        self.assertEqual(len(second), 0)
+
+        middle = PlayerList()
+        middle.extend([Player("3", "Simon"), Player("4", "Simon")])
+        first.splice(middle, after=first.head.next_node)
+        self.assertEqual([player.uid for player in first], ["1", "2", "3", "4", "5", "6"])
+        self.assertEqual([player.uid for player in reversed(first)], ["6", "5", "4", "3", "2", "1"])
+        self.assertEqual(len(first), 6)
+
+        front = PlayerList()
+        front.append_node_to_tail(Player("0", "Bobby"))
+        first.splice(front)
+        self.assertEqual(first.head.key, "0")
+        self.assertEqual(first.head.next_node.previous_node, first.head)
+        with self.assertRaises(ValueError):
+            first.splice(first)
+
+    # Test that clearing a list empties it and its index, so the same uids can be added again
+    def test_clear(self):
+        player_list = PlayerList(indexed=True)
+        for uid in ("1", "2", "3"):
+            player_list.append_node_to_tail(Player(uid, f"Player {uid}"))
+        player_list.clear()
+        self.assertTrue(player_list.is_empty())
+        self.assertEqual(len(player_list), 0)
+        self.assertIsNone(player_list.find_player_by_uid("2"))
+        player_list.append_node_to_tail(Player("2", "Player 2"))
+        self.assertEqual([player.uid for player in player_list], ["2"])
+
+    # Test that splicing into an indexed list updates the index and refuses uids already in the list
+    def test_splice_indexed(self):
+        indexed = PlayerList(indexed=True)
+        indexed.append_node_to_tail(Player("1", "Greg"))
+        other = PlayerList()
+        other.extend([Player("2", "Tom"), Player("3", "Simon")])
+        indexed.extend(other)
+        self.assertEqual(indexed.get_player_by_uid("3").name, "Simon")
+        indexed.delete_by_key("2")
+        self.assertEqual([player.uid for player in indexed], ["1", "3"])
+        duplicate = PlayerList()
+        duplicate.append_node_to_tail(Player("3", "Bobby"))
+        with self.assertRaises(ValueError):
+            indexed.extend(duplicate)
+        self.assertEqual(len(duplicate), 1)
+        self.assertEqual(len(indexed), 2)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
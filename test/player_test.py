@@ -1,4 +1,6 @@
 import unittest
+from unittest import mock
+from app import player as player_module
 from app.player import Player
 
 class TestPlayer(unittest.TestCase):
@@ -7,6 +9,10 @@ class TestPlayer(unittest.TestCase):
     Tests included:
         - Testing that the player uid is properly set
         - Testing that the player name is properly set
+        - Testing that non-ASCII UIDs can be hashed
+        - Testing the width of the wide Pearson and FNV-1a hashes
+        - Testing that players have no per-instance __dict__
+        - Testing that the hash is cached and that batch hashing matches single hashing
     """
     def test_uid_property(self):
         player = Player("12345", "Greg")
@@ -19,3 +25,44 @@ class TestPlayer(unittest.TestCase):
         player2 = Player("987654", "Tom")
         self.assertEqual(player.name, "Greg")
         self.assertEqual(player2.name, "Tom")
+
+    def test_pearson_hash_non_ascii(self):
+        # UIDs are hashed as UTF-8 bytes, so characters above 255 don't index outside the Pearson table
+        self.assertTrue(0 <= Player.pearson_hash("玩家42") < 256)
+        self.assertEqual(Player.pearson_hash("12345"), Player.pearson_hash_wide("12345", bits=16) >> 8)
+
+    def test_wide_hashes(self):
+        for bits in (16, 32, 64):
+            self.assertTrue(0 <= Player.pearson_hash_wide("12345", bits=bits) < 2 ** bits)
+        self.assertNotEqual(Player.pearson_hash_wide("12345"), Player.pearson_hash_wide("12346"))
+        self.assertEqual(Player.fnv1a_hash("a", bits=32), 0xE40C292C)
+        self.assertEqual(Player.fnv1a_hash("a", bits=64), 0xAF63DC4C8601EC8C)
+        with self.assertRaises(ValueError):
+            Player.pearson_hash_wide("12345", bits=8)
+
+    def test_slots(self):
+        player = Player("12345", "Greg")
+        self.assertFalse(hasattr(player, "__dict__"))
+        with self.assertRaises(AttributeError):
+            player.nickname = "G"
+
+    def test_hash(self):
+        player = Player("12345", "Greg")
+        self.assertEqual(hash(player), Player.pearson_hash("12345"))
+
+    def test_pearson_hash_many(self):
+        keys = ["", "12345", "987654", "玩家42", "a" * 40]
+        self.assertEqual(Player.pearson_hash_many(keys), [Player.pearson_hash(key) for key in keys])
+        for bits in (16, 32, 64):
+            self.assertEqual(Player.pearson_hash_many(keys, bits=bits),
+                             [Player.pearson_hash_wide(key, bits=bits) for key in keys])
+        self.assertEqual(Player.pearson_hash_many([]), [])
+        with self.assertRaises(ValueError):
+            Player.pearson_hash_many(keys, bits=12)
+        # Without NumPy the UIDs are hashed in groups of the same length, or as one group if they all are
+        with mock.patch.object(player_module, "np", None):
+            for batch in (keys, [f"uid{i:04d}" for i in range(300)], ["", ""]):
+                self.assertEqual(Player.pearson_hash_many(batch), [Player.pearson_hash(key) for key in batch])
+                for bits in (16, 32, 64):
+                    self.assertEqual(Player.pearson_hash_many(batch, bits=bits),
+                                     [Player.pearson_hash_wide(key, bits=bits) for key in batch])
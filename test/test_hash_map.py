@@ -1,5 +1,6 @@
 import unittest
 from app.player_hash_map import PlayerHashMap
+from app.player_map import ENGINES, make_player_map
 
 class TestHashMap(unittest.TestCase):
     """ Unit tests for testing the Hash Map functionality. Tests include:
@@ -10,6 +11,20 @@ class TestHashMap(unittest.TestCase):
         test_length
         test_collision_handling
         test_nonexistent_player
+        test_resize_grows_buckets
+        test_resize_shrinks_buckets
+        test_initial_capacity
+        test_incremental_rehash
+        test_incremental_rehash_bounded_step
+        test_hash_functions
+        test_wide_hash_uses_more_than_256_buckets
+        test_update
+        test_from_pairs
+        test_stats
+        test_get_and_contains
+        test_get_many
+        test_bloom_filter
+        test_apply_score_deltas
     """
     def setUp(self):
         # Add players
@@ -72,3 +87,186 @@ class TestHashMap(unittest.TestCase):
         # Try to retrieve a player that doesn't exist
         with self.assertRaises(KeyError):
             _ = self.hash_map['99999']
+
+    def test_resize_grows_buckets(self):
+        # Adding more players than buckets * load factor doubles the buckets and keeps every player
+        hash_map = PlayerHashMap()
+        for i in range(1000):
+            hash_map[f"uid{i}"] = f"Player {i}"
+        self.assertGreaterEqual(hash_map.capacity, 1000)
+        self.assertLessEqual(len(hash_map), hash_map.capacity * hash_map.load_factor)
+        self.assertEqual(len(hash_map), 1000)
+        for i in range(1000):
+            self.assertEqual(hash_map[f"uid{i}"].name, f"Player {i}")
+
+    def test_resize_shrinks_buckets(self):
+        # Deleting players below the minimum load factor halves the buckets, but never below the initial capacity
+        hash_map = PlayerHashMap(min_load_factor=0.25)
+        for i in range(200):
+            hash_map[f"uid{i}"] = f"Player {i}"
+        grown_capacity = hash_map.capacity
+        for i in range(190):
+            del hash_map[f"uid{i}"]
+        self.assertLess(hash_map.capacity, grown_capacity)
+        self.assertGreaterEqual(hash_map.capacity, PlayerHashMap.SIZE)
+        for i in range(190, 200):
+            self.assertEqual(hash_map[f"uid{i}"].name, f"Player {i}")
+
+    def test_initial_capacity(self):
+        # The capacity hint sets the initial number of buckets
+        hash_map = PlayerHashMap(capacity=64)
+        self.assertEqual(hash_map.capacity, 64)
+        with self.assertRaises(ValueError):
+            PlayerHashMap(capacity=0)
+        with self.assertRaises(ValueError):
+            PlayerHashMap(load_factor=1.0, min_load_factor=0.75)
+
+    def test_incremental_rehash(self):
+        # Players stay reachable, updatable and deletable while buckets are being migrated
+        hash_map = PlayerHashMap(incremental=True, rehash_step=1)
+        for i in range(500):
+            hash_map[f"uid{i}"] = f"Player {i}"
+            self.assertEqual(len(hash_map), i + 1)
+        self.assertTrue(hash_map.is_rehashing)
+        for i in range(500):
+            self.assertEqual(hash_map[f"uid{i}"].name, f"Player {i}")
+        hash_map["uid0"] = "Renamed"
+        self.assertEqual(hash_map["uid0"].name, "Renamed")
+        self.assertEqual(len(hash_map), 500)
+        for i in range(0, 500, 2):
+            del hash_map[f"uid{i}"]
+        self.assertEqual(len(hash_map), 250)
+        with self.assertRaises(KeyError):
+            _ = hash_map["uid0"]
+        self.assertEqual(hash_map["uid1"].name, "Player 1")
+
+    def test_incremental_rehash_bounded_step(self):
+        # A resize starts a migration instead of moving every player, which completes after enough operations
+        hash_map = PlayerHashMap(incremental=True, rehash_step=2)
+        for i in range(11):
+            hash_map[f"uid{i}"] = f"Player {i}"
+        self.assertTrue(hash_map.is_rehashing)
+        self.assertEqual(hash_map.capacity, 20)
+        for _ in range(5):
+            _ = hash_map["uid3"]
+        self.assertFalse(hash_map.is_rehashing)
+        self.assertEqual(len(hash_map), 11)
+
+    def test_hash_functions(self):
+        # Every hash function strategy stores and retrieves the same players
+        for hash_function in ("pearson8", "pearson_wide", "fnv1a", "builtin", lambda key: len(key)):
+            hash_map = PlayerHashMap(hash_function=hash_function)
+            for i in range(100):
+                hash_map[f"uid{i}"] = f"Player {i}"
+            hash_map["ünïcødé"] = "Zoë"
+            self.assertEqual(len(hash_map), 101)
+            self.assertEqual(hash_map["uid42"].name, "Player 42")
+            self.assertEqual(hash_map["ünïcødé"].name, "Zoë")
+        with self.assertRaises(ValueError):
+            PlayerHashMap(hash_function="md5")
+
+    def test_wide_hash_uses_more_than_256_buckets(self):
+        hash_map = PlayerHashMap(capacity=4096)
+        for i in range(4000):
+            hash_map[f"uid{i}"] = f"Player {i}"
+        used_buckets = sum(1 for player_list in hash_map.hashmap if not player_list.is_empty())
+        self.assertGreater(used_buckets, 256)
+
+    def test_update(self):
+        # Bulk updates add new players, rename existing ones and presize the buckets once
+        self.hash_map.update([('09724', 'Gregory'), ('99999', 'Zed')] + [(f"uid{i}", f"Player {i}") for i in range(100)])
+        self.assertEqual(len(self.hash_map), 110)
+        self.assertGreaterEqual(self.hash_map.capacity, 110)
+        self.assertEqual(self.hash_map['09724'].name, 'Gregory')
+        self.assertEqual(self.hash_map['99999'].name, 'Zed')
+        self.assertEqual(self.hash_map['uid50'].name, 'Player 50')
+
+    def test_from_pairs(self):
+        pairs = {f"uid{i}": f"Player {i}" for i in range(1000)}
+        for engine in ENGINES:
+            for assume_unique in (False, True):
+                hash_map = make_player_map(engine, pairs, assume_unique=assume_unique)
+                self.assertEqual(len(hash_map), 1000)
+                self.assertLessEqual(len(hash_map), hash_map.capacity * hash_map.load_factor)
+                for i in range(0, 1000, 7):
+                    self.assertEqual(hash_map[f"uid{i}"].name, f"Player {i}")
+
+    def test_stats(self):
+        # Chain lengths match the collisions listed in setUp
+        stats = self.hash_map.stats()
+        self.assertEqual(stats["capacity"], 10)
+        self.assertEqual(stats["size"], 9)
+        self.assertAlmostEqual(stats["load_factor"], 0.9)
+        self.assertEqual(stats["min_chain"], 0)
+        self.assertEqual(stats["max_chain"], 2)
+        self.assertAlmostEqual(stats["mean_chain"], 0.9)
+        self.assertEqual(stats["empty_buckets"], 4)
+        self.assertEqual(stats["histogram"], {0: 4, 1: 3, 2: 3})
+        self.assertEqual(sum(stats["histogram"].values()), stats["capacity"])
+        self.assertGreater(stats["stddev_chain"], 0)
+
+    def test_get_and_contains(self):
+        # Missing players return the default instead of raising
+        self.assertEqual(self.hash_map.get('09724').name, 'Greg')
+        self.assertIsNone(self.hash_map.get('99999'))
+        self.assertEqual(self.hash_map.get('99999', 'missing'), 'missing')
+        self.assertIn('67890', self.hash_map)
+        self.assertNotIn('99999', self.hash_map)
+
+    def test_get_many(self):
+        players = self.hash_map.get_many(['09724', '99999', '20130'])
+        self.assertEqual(players[0].name, 'Greg')
+        self.assertIsNone(players[1])
+        self.assertEqual(players[2].name, 'Maddy')
+
+    def test_bloom_filter(self):
+        # The Bloom filter never hides a player, through resizes (incremental or not) and deletes
+        for incremental in (False, True):
+            hash_map = PlayerHashMap(bloom_filter=True, incremental=incremental, min_load_factor=0.25)
+            for i in range(1000):
+                hash_map[f"uid{i}"] = f"Player {i}"
+                self.assertIn(f"uid{i}", hash_map)
+            hash_map.update([(f"bulk{i}", "Bulk") for i in range(200)])
+            for i in range(1000):
+                self.assertEqual(hash_map.get(f"uid{i}").name, f"Player {i}")
+            self.assertEqual(hash_map.get("bulk199").name, "Bulk")
+            self.assertEqual(hash_map.get_many(["missing", "uid5"])[1].name, "Player 5")
+            for i in range(900):
+                del hash_map[f"uid{i}"]
+                self.assertNotIn(f"uid{i}", hash_map)
+            for i in range(900, 1000):
+                self.assertIn(f"uid{i}", hash_map)
+
+    def test_apply_score_deltas(self):
+        # Valid deltas are applied; missing uids and invalid deltas are reported instead of raising
+        self.hash_map['09724'].score = 5
+        result = self.hash_map.apply_score_deltas([
+            ('09724', 10), ('54321', 3), ('09724', 1), ('99999', 4), ('12345', -1), ('20130', 1.5),
+        ])
+        self.assertEqual(result.updated, 2)
+        self.assertEqual(result.missing, ['99999'])
+        self.assertEqual(sorted(result.invalid), ['12345', '20130'])
+        self.assertFalse(result.ok)
+        self.assertEqual(self.hash_map['09724'].score, 16)
+        self.assertEqual(self.hash_map['54321'].score, 3)
+        self.assertEqual(self.hash_map['12345'].score, 0)
+        # Bools are ints, as for the score property
+        self.assertTrue(self.hash_map.apply_score_deltas({'54321': True}).ok)
+        self.assertEqual(self.hash_map['54321'].score, 4)
+        # A later invalid delta drops the uid's earlier ones, and is reported even for a missing uid
+        result = self.hash_map.apply_score_deltas([('54321', 5), ('99999', 1), ('54321', None), ('88888', "1")])
+        self.assertEqual((result.updated, result.missing, result.invalid), (0, ['99999'], ['54321', '88888']))
+        self.assertEqual(self.hash_map['54321'].score, 4)
+        # Deltas add up before the total is checked, so an earlier negative one is fine
+        self.assertTrue(self.hash_map.apply_score_deltas(iter([('54321', -6), ('54321', 3)])).ok)
+        self.assertEqual(self.hash_map['54321'].score, 1)
+        for engine in ENGINES:
+            for incremental in ((False, True) if engine == "chaining" else (False,)):
+                kwargs = {"incremental": incremental} if engine == "chaining" else {}
+                hash_map = make_player_map(engine, **kwargs)
+                for i in range(300):
+                    hash_map[f"uid{i}"] = f"Player {i}"
+                result = hash_map.apply_score_deltas({f"uid{i}": i for i in range(300)})
+                self.assertTrue(result.ok)
+                self.assertEqual(result.updated, 300)
+                self.assertEqual(hash_map["uid123"].score, 123)
@@ -0,0 +1,29 @@
+import unittest
+from app.player_bloom_filter import PlayerBloomFilter
+
+class TestPlayerBloomFilter(unittest.TestCase):
+    """ Unit tests for the Bloom filter. Tests include:
+
+        test_no_false_negatives
+        test_false_positive_rate
+    """
+    def test_no_false_negatives(self):
+        bloom = PlayerBloomFilter(1000)
+        for i in range(1000):
+            bloom.add(f"uid{i}")
+        for i in range(1000):
+            self.assertIn(f"uid{i}", bloom)
+
+    def test_false_positive_rate(self):
+        # Once filled to its expected size, the false positive rate stays close to the requested one
+        bloom = PlayerBloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"uid{i}")
+        false_positives = sum(1 for i in range(10000) if f"missing{i}" in bloom)
+        self.assertLess(false_positives, 300)
+        with self.assertRaises(ValueError):
+            PlayerBloomFilter(10, error_rate=1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
+import random
 import unittest
 from app.player import Player
 from app.player_bst import PlayerBST
-from app.player_bnode import PlayerBNode
+from app.player_bnode import PlayerBNode, LeanPlayerBNode
 
 class TestPlayerBST(unittest.TestCase):
     """Unit tests for the PlayerBST class."""
@@ -155,6 +156,166 @@ class TestPlayerBST(unittest.TestCase):
         # Left child of Tim should be Robby
         self.assertEqual(self.bst.root.right.left.player.name, "Robby")
 
+    def test_lean_nodes(self):
+        """Test that a BST of lean nodes inserts, searches and balances like one of PlayerBNodes."""
+        self.bst = PlayerBST(node_type=LeanPlayerBNode)
+        for player in (self.player3, self.player4, self.player1, self.player5, self.player2):
+            self.bst.insert(player)
+        self.assertIsInstance(self.bst.root, LeanPlayerBNode)
+        self.assertEqual(self.bst.search("Robby").uid, "5")
+        self.bst.balance()
+        self.assertIsInstance(self.bst.root, LeanPlayerBNode)
+        self.assertEqual(self.bst.root.player.name, "Greg")
+        self.assertEqual(self._get_height(self.bst.root), 3)
+
+    def test_balanced_insert_sorted(self):
+        """Test that a balanced BST stays an AVL tree when players are inserted in name order."""
+        for node_type in (PlayerBNode, LeanPlayerBNode):
+            self.bst = PlayerBST(node_type=node_type, balanced=True)
+            names = [f"Player {i:05d}" for i in range(2000)]
+            for index, name in enumerate(names):
+                self.bst.insert(Player(str(index), name))
+            self._assert_avl(self.bst.root)
+            self.assertLessEqual(self._get_height(self.bst.root), 12) # 1.44 * log2(2000) is about 15.8
+            self.assertEqual([player.name for player in self.bst.in_order_traversal()], names)
+            self.assertEqual(self.bst.search("Player 01999").uid, "1999")
+            self.assertIsNone(self.bst.search("Player 02000"))
+
+    def test_balanced_insert_shuffled(self):
+        """Test that a balanced BST stays an AVL tree when players are inserted in random order."""
+        names = [f"Player {i:05d}" for i in range(2000)]
+        shuffled = names[:]
+        random.Random(1).shuffle(shuffled)
+        self.bst = PlayerBST(balanced=True)
+        for name in shuffled:
+            self.bst.insert(Player(name, name))
+        self._assert_avl(self.bst.root)
+        self.assertEqual([player.name for player in self.bst.in_order_traversal()], names)
+
+    def test_balanced_insert_duplicate(self):
+        """Test that a balanced BST replaces the player of a duplicate name without changing the tree."""
+        self.bst = PlayerBST(balanced=True)
+        for player in (self.player3, self.player4, self.player1, self.player5, self.player2):
+            self.bst.insert(player)
+        self.assertEqual(self.bst.root.player.name, "Bobby")
+        self.bst.insert(Player("6", "Greg"))
+        self.assertEqual(self.bst.search("Greg").uid, "6")
+        self.assertEqual(len(self.bst.in_order_traversal()), 5)
+        self._assert_avl(self.bst.root)
+
+    def test_deep_unbalanced_tree(self):
+        """Test that inserting, searching and traversing a degenerate tree doesn't hit the recursion limit."""
+        for index in range(3000):
+            self.bst.insert(Player(str(index), f"Player {index:05d}"))
+        self.assertEqual(self.bst.search("Player 02999").uid, "2999")
+        self.assertEqual(len(self.bst.in_order_traversal()), 3000)
+
+    def test_balance_reuses_nodes(self):
+        """Test that balancing relinks the existing nodes into a tree of minimal height, whatever its shape."""
+        names = [f"Player {i:04d}" for i in range(1000)]
+        shuffled = names[:]
+        random.Random(2).shuffle(shuffled)
+        for order in (names, shuffled):
+            self.bst = PlayerBST()
+            for name in order:
+                self.bst.insert(Player(name, name))
+            nodes_before = {id(node) for node in self.bst._iter_nodes()}
+            self.bst.balance()
+            self.assertEqual({id(node) for node in self.bst._iter_nodes()}, nodes_before)
+            self.assertEqual([player.name for player in self.bst.in_order_traversal()], names)
+            self.assertEqual(self._get_height(self.bst.root), 10) # 1000 nodes need a height of 10
+            self._assert_avl(self.bst.root)
+        self.bst = PlayerBST()
+        self.bst.balance()
+        self.assertIsNone(self.bst.root)
+
+    def test_from_players(self):
+        """Test building a balanced BST in one pass, with the last player of a repeated name winning."""
+        players = [self.player1, self.player2, self.player3, self.player4, self.player5, Player("6", "Greg")]
+        self.bst = PlayerBST.from_players(players)
+        self.assertEqual([player.name for player in self.bst.in_order_traversal()],
+                         ["Billy", "Bobby", "Greg", "Robby", "Tim"])
+        self.assertEqual(self.bst.search("Greg").uid, "6")
+        self.assertEqual(self.bst.root.player.name, "Greg")
+        self._assert_avl(self.bst.root)
+
+        names = [f"Player {i:04d}" for i in range(1000)]
+        self.bst = PlayerBST.from_players((Player(name, name) for name in names), presorted=True,
+                                          node_type=LeanPlayerBNode, balanced=True)
+        self.assertIsInstance(self.bst.root, LeanPlayerBNode)
+        self.assertEqual(self._get_height(self.bst.root), 10)
+        self.bst.insert(Player("new", "Player 0500a"))
+        self._assert_avl(self.bst.root)
+        self.assertIsNone(PlayerBST.from_players([]).root)
+
+    def test_merge(self):
+        """Test merging two trees, where the other tree's player wins for a name in both."""
+        self.bst = PlayerBST.from_players([self.player1, self.player3, self.player5])
+        other = PlayerBST()
+        for player in (self.player2, self.player4, Player("6", "Greg")):
+            other.insert(player)
+        self.bst.merge(other)
+        self.assertIsNone(other.root)
+        self.assertEqual([player.name for player in self.bst.in_order_traversal()],
+                         ["Billy", "Bobby", "Greg", "Robby", "Tim"])
+        self.assertEqual(self.bst.search("Greg").uid, "6")
+        self._assert_avl(self.bst.root)
+        self.bst.merge(PlayerBST())
+        self.assertEqual(len(self.bst.in_order_traversal()), 5)
+        with self.assertRaises(ValueError):
+            self.bst.merge(self.bst)
+
+    def test_iter_players_range(self):
+        """Test lazily iterating a range of names in both directions, against filtering the sorted names."""
+        names = [f"Player {i:03d}" for i in range(0, 400, 2)]
+        shuffled = names[:]
+        random.Random(3).shuffle(shuffled)
+        for player_name in shuffled:
+            self.bst.insert(Player(player_name, player_name))
+        bounds = (None, "Player 000", "Player 101", "Player 150", "Player 398", "Player 399", "Z")
+        for lo in bounds:
+            for hi in bounds:
+                expected = [name for name in names if (lo is None or name >= lo) and (hi is None or name <= hi)]
+                self.assertEqual([player.name for player in self.bst.iter_players(lo, hi)], expected)
+                self.assertEqual([player.name for player in self.bst.iter_players(lo, hi, reverse=True)],
+                                 expected[::-1])
+                self.assertEqual(self.bst.count_range(lo, hi), len(expected))
+        page = self.bst.iter_players("Player 100")
+        self.assertEqual([next(page).name for _ in range(3)], ["Player 100", "Player 102", "Player 104"])
+
+    def test_neighbour_queries(self):
+        """Test floor, ceiling, successor, min and max, including names that aren't in the tree."""
+        self.assertIsNone(self.bst.min())
+        self.assertIsNone(self.bst.max())
+        self.assertIsNone(self.bst.floor("Greg"))
+        for player in (self.player1, self.player2, self.player3, self.player4, self.player5):
+            self.bst.insert(player) # Greg, Tim, Billy, Bobby, Robby
+        self.assertEqual(self.bst.min().name, "Billy")
+        self.assertEqual(self.bst.max().name, "Tim")
+        self.assertEqual(self.bst.floor("Greg").name, "Greg")
+        self.assertEqual(self.bst.floor("Harry").name, "Greg")
+        self.assertIsNone(self.bst.floor("Adam"))
+        self.assertEqual(self.bst.ceiling("Harry").name, "Robby")
+        self.assertEqual(self.bst.ceiling("Robby").name, "Robby")
+        self.assertIsNone(self.bst.ceiling("Zed"))
+        self.assertEqual(self.bst.successor("Greg").name, "Robby")
+        self.assertEqual(self.bst.successor("Adam").name, "Billy")
+        self.assertIsNone(self.bst.successor("Tim"))
+
+    def _assert_avl(self, node):
+        """Helper method checking recorded heights are correct and every node's subtrees differ by at most one.
+
+        Returns:
+            int: The height of the subtree.
+        """
+        if node is None:
+            return 0
+        left_height = self._assert_avl(node.left)
+        right_height = self._assert_avl(node.right)
+        self.assertLessEqual(abs(left_height - right_height), 1)
+        self.assertEqual(node.height, max(left_height, right_height) + 1)
+        return node.height
+
     def _get_height(self, node):
         """Helper method to calculate the height of the BST.
 
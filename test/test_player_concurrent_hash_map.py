@@ -0,0 +1,111 @@
+import threading
+import unittest
+from app.player_concurrent_hash_map import PlayerConcurrentHashMap
+
+class TestPlayerConcurrentHashMap(unittest.TestCase):
+    """ Unit tests for the thread-safe hash map. Tests include:
+
+        test_single_thread_behaviour
+        test_concurrent_writers
+        test_concurrent_readers_and_writers
+    """
+    THREADS = 8
+    PLAYERS_PER_THREAD = 500
+
+    def test_single_thread_behaviour(self):
+        hash_map = PlayerConcurrentHashMap(stripes=4)
+        hash_map['09724'] = 'Greg'
+        hash_map['09724'] = 'Gregory'
+        self.assertEqual(hash_map['09724'].name, 'Gregory')
+        self.assertEqual(hash_map.get('09724').name, 'Gregory')
+        self.assertIsNone(hash_map.get('99999'))
+        self.assertIn('09724', hash_map)
+        self.assertEqual(len(hash_map), 1)
+        del hash_map['09724']
+        self.assertEqual(len(hash_map), 0)
+        with self.assertRaises(KeyError):
+            _ = hash_map['09724']
+        with self.assertRaises(KeyError):
+            del hash_map['09724']
+
+    def test_concurrent_writers(self):
+        # Each thread adds its own players, renames them and deletes every other one while the map resizes
+        hash_map = PlayerConcurrentHashMap(stripes=4)
+        errors = []
+
+        def writer(thread_id):
+            try:
+                keys = [f"t{thread_id}-{i}" for i in range(self.PLAYERS_PER_THREAD)]
+                for key in keys:
+                    hash_map[key] = "Player"
+                for key in keys:
+                    hash_map[key] = key.upper()
+                for key in keys[::2]:
+                    del hash_map[key]
+            except Exception as error: # Reported on the main thread
+                errors.append(error)
+
+        threads = [threading.Thread(target=writer, args=(thread_id,)) for thread_id in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(hash_map), self.THREADS * self.PLAYERS_PER_THREAD // 2)
+        self.assertGreater(hash_map.capacity, PlayerConcurrentHashMap.SIZE)
+        self.assertEqual(hash_map.stats()["size"], len(hash_map))
+        for thread_id in range(self.THREADS):
+            for i in range(self.PLAYERS_PER_THREAD):
+                key = f"t{thread_id}-{i}"
+                if i % 2:
+                    self.assertEqual(hash_map[key].name, key.upper())
+                else:
+                    with self.assertRaises(KeyError):
+                        _ = hash_map[key]
+
+    def test_concurrent_readers_and_writers(self):
+        # Players added before the readers start must always be found, even while writers force resizes
+        hash_map = PlayerConcurrentHashMap(min_load_factor=0.25)
+        stable_keys = [f"stable-{i}" for i in range(200)]
+        for key in stable_keys:
+            hash_map[key] = key
+        stop = threading.Event()
+        errors = []
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    for key in stable_keys:
+                        if hash_map[key].name != key:
+                            errors.append(f"Wrong player for {key}")
+            except Exception as error:
+                errors.append(error)
+
+        def writer(thread_id):
+            try:
+                for _ in range(3):
+                    keys = [f"w{thread_id}-{i}" for i in range(self.PLAYERS_PER_THREAD)]
+                    for key in keys:
+                        hash_map[key] = key
+                    for key in keys:
+                        del hash_map[key]
+            except Exception as error:
+                errors.append(error)
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        writers = [threading.Thread(target=writer, args=(thread_id,)) for thread_id in range(4)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(hash_map), len(stable_keys))
+
+
+if __name__ == '__main__':
+    unittest.main()
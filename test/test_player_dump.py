@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import unittest
+from app.player import Player
+from app.player_bst import PlayerBST
+from app.player_dump import dump_players
+from app.player_list import PlayerList
+from app.player_map import ENGINES, make_player_map
+
+class TestPlayerDump(unittest.TestCase):
+    """ Unit tests for dumping players to a stream. Tests include:
+
+        test_formats
+        test_list_dump
+        test_hash_map_dump
+        test_bst_dump
+    """
+    def test_formats(self):
+        players = [Player("1", "Greg"), Player("2", 'Tom "Tommy", Jr')]
+        players[0].score = 10
+        stream = io.StringIO()
+        self.assertEqual(dump_players(players, stream, "text"), 2)
+        self.assertEqual(stream.getvalue().splitlines()[0], "Player: uid=1, name=Greg, score=10")
+
+        stream = io.StringIO()
+        dump_players(players, stream, "csv", buffer_lines=1)
+        rows = list(csv.reader(io.StringIO(stream.getvalue())))
+        self.assertEqual(rows, [["uid", "name", "score"], ["1", "Greg", "10"], ["2", 'Tom "Tommy", Jr', "0"]])
+
+        stream = io.StringIO()
+        dump_players(iter(players), stream, "jsonl")
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(records[1], {"uid": "2", "name": 'Tom "Tommy", Jr', "score": 0})
+
+        with self.assertRaises(ValueError):
+            dump_players(players, io.StringIO(), "xml")
+
+    def test_list_dump(self):
+        player_list = PlayerList()
+        for uid in ("1", "2", "3"):
+            player_list.append_node_to_tail(Player(uid, f"Player {uid}"))
+        stream = io.StringIO()
+        self.assertEqual(player_list.dump(stream, "jsonl", forward=False), 3)
+        self.assertEqual([json.loads(line)["uid"] for line in stream.getvalue().splitlines()], ["3", "2", "1"])
+
+    def test_hash_map_dump(self):
+        for engine in ENGINES:
+            hash_map = make_player_map(engine, [(f"uid{i}", f"Player {i}") for i in range(2500)])
+            stream = io.StringIO()
+            self.assertEqual(hash_map.dump(stream, "csv"), 2500)
+            rows = list(csv.reader(io.StringIO(stream.getvalue())))
+            self.assertEqual(len(rows), 2501)
+            self.assertEqual({row[0] for row in rows[1:]}, {f"uid{i}" for i in range(2500)})
+
+    def test_bst_dump(self):
+        bst = PlayerBST()
+        for name in ("Greg", "Bobby", "Tim", "Billy", "Robby"):
+            bst.insert(Player(name.lower(), name))
+        stream = io.StringIO()
+        self.assertEqual(bst.dump(stream), 5)
+        self.assertEqual([line.split("name=")[1].split(",")[0] for line in stream.getvalue().splitlines()],
+                         ["Billy", "Bobby", "Greg", "Robby", "Tim"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import gc
+import random
+import unittest
+import weakref
+from app.player import Player
+from app.player_leaderboard import PlayerLeaderboard
+
+class TestPlayerLeaderboard(unittest.TestCase):
+    """ Unit tests for the live leaderboard. Tests include:
+
+        test_ranks
+        test_score_changes_update_ranks
+        test_range_and_top
+        test_remove
+        test_clear
+        test_dropped_leaderboard_is_collected
+        test_matches_sorting_after_random_updates
+    """
+    def setUp(self):
+        self.players = [Player("1", "Greg"), Player("2", "Tom"), Player("3", "Billy"), Player("4", "Bobby")]
+        for player, score in zip(self.players, (10, 30, 20, 10)):
+            player.score = score
+        self.leaderboard = PlayerLeaderboard(self.players)
+
+    def _uids(self, players):
+        return [player.uid for player in players]
+
+    def test_ranks(self):
+        # Highest score first, equal scores ordered by uid
+        self.assertEqual(len(self.leaderboard), 4)
+        self.assertEqual(self.leaderboard.rank_of("2"), 1)
+        self.assertEqual(self.leaderboard.rank_of("3"), 2)
+        self.assertEqual(self.leaderboard.rank_of("1"), 3)
+        self.assertEqual(self.leaderboard.rank_of("4"), 4)
+        self.assertEqual(self.leaderboard.player_at(1).name, "Tom")
+        self.assertEqual(self.leaderboard.player_at(4).name, "Bobby")
+        with self.assertRaises(IndexError):
+            self.leaderboard.player_at(5)
+        with self.assertRaises(KeyError):
+            self.leaderboard.rank_of("99")
+
+    def test_score_changes_update_ranks(self):
+        self.players[3].score = 50 # Bobby
+        self.assertEqual(self.leaderboard.rank_of("4"), 1)
+        self.assertEqual(self.leaderboard.rank_of("2"), 2)
+        self.players[1].score = 0 # Tom
+        self.assertEqual(self.leaderboard.rank_of("2"), 4)
+        self.assertEqual(self._uids(self.leaderboard.top(4)), ["4", "3", "1", "2"])
+
+    def test_range_and_top(self):
+        self.assertEqual(self._uids(self.leaderboard.top(2)), ["2", "3"])
+        self.assertEqual(self._uids(self.leaderboard.range(2, 3)), ["3", "1"])
+        self.assertEqual(self._uids(self.leaderboard.range(3, 10)), ["1", "4"])
+        self.assertEqual(self.leaderboard.range(5, 10), [])
+
+    def test_remove(self):
+        self.leaderboard.remove("2")
+        self.assertNotIn("2", self.leaderboard)
+        self.assertEqual(self.leaderboard.rank_of("3"), 1)
+        # A removed player's score changes no longer reach the leaderboard
+        self.players[1].score = 100
+        self.assertEqual(self._uids(self.leaderboard.top(10)), ["3", "1", "4"])
+        with self.assertRaises(KeyError):
+            self.leaderboard.remove("2")
+
+    def test_clear(self):
+        self.leaderboard.clear()
+        self.assertEqual(len(self.leaderboard), 0)
+        self.assertEqual(self.leaderboard.top(10), [])
+        # The players no longer have the leaderboard's listener
+        for player in self.players:
+            self.assertIsNone(player._score_listeners)
+        self.leaderboard.add(self.players[0])
+        self.assertEqual(self.leaderboard.rank_of("1"), 1)
+
+    def test_dropped_leaderboard_is_collected(self):
+        # The players' listeners don't keep a leaderboard alive, and are unregistered at the next score change
+        leaderboard_ref = weakref.ref(self.leaderboard)
+        self.leaderboard = None
+        gc.collect()
+        self.assertIsNone(leaderboard_ref())
+        self.players[0].score = 5
+        self.assertIsNone(self.players[0]._score_listeners)
+        self.assertIsNotNone(self.players[1]._score_listeners)
+
+    def test_matches_sorting_after_random_updates(self):
+        rng = random.Random(7)
+        players = [Player(f"{uid:04d}", "Player") for uid in range(500)]
+        leaderboard = PlayerLeaderboard(players)
+        for _ in range(2000):
+            rng.choice(players).score = rng.randrange(100)
+        expected = self._uids(Player.sorted_players(players, tie_break="uid"))
+        self.assertEqual(self._uids(leaderboard.top(500)), expected)
+        for rank in (1, 17, 250, 500):
+            self.assertEqual(leaderboard.player_at(rank).uid, expected[rank - 1])
+            self.assertEqual(leaderboard.rank_of(expected[rank - 1]), rank)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from app.player import Player
+from app.player_lru_cache import PlayerLRUCache
+
+class TestPlayerLRUCache(unittest.TestCase):
+    """ Unit tests for the LRU player cache. Tests include:
+
+        test_evicts_least_recently_used
+        test_byte_limit
+        test_ttl
+        test_replace_and_clear
+    """
+    def test_evicts_least_recently_used(self):
+        cache = PlayerLRUCache(capacity=3)
+        for uid in ("1", "2", "3"):
+            cache.put(Player(uid, f"Player {uid}"))
+        self.assertEqual(cache.get("1").name, "Player 1") # "1" is now the most recently used
+        cache.put(Player("4", "Player 4"))
+        self.assertNotIn("2", cache)
+        self.assertIsNone(cache.get("2"))
+        self.assertEqual([cache.get(uid).uid for uid in ("1", "3", "4")], ["1", "3", "4"])
+        cache.put(Player("3", "Renamed")) # Replacing a player doesn't evict anything
+        self.assertEqual(cache.get("3").name, "Renamed")
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.stats()["hits"], 5)
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        del cache["1"]
+        self.assertEqual(len(cache), 2)
+        with self.assertRaises(KeyError):
+            del cache["1"]
+
+    def test_byte_limit(self):
+        player_size = PlayerLRUCache.size_of(Player("uid00000", "Player 0"))
+        cache = PlayerLRUCache(capacity=100, max_bytes=player_size * 5)
+        for i in range(8):
+            cache.put(Player(f"uid{i:05d}", f"Player {i}"))
+        self.assertEqual(len(cache), 5)
+        self.assertLessEqual(cache.bytes, player_size * 5)
+        self.assertEqual(cache.evictions, 3)
+        self.assertNotIn("uid00002", cache)
+        self.assertIn("uid00003", cache)
+
+    def test_ttl(self):
+        now = [0.0]
+        cache = PlayerLRUCache(ttl=10, clock=lambda: now[0])
+        cache.put(Player("1", "Greg"))
+        now[0] = 5
+        cache.put(Player("2", "Tom"))
+        self.assertIsNotNone(cache.get("1"))
+        now[0] = 12
+        self.assertNotIn("1", cache)
+        self.assertIsNone(cache.get("1"))
+        self.assertEqual(cache.get("2").name, "Tom")
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_replace_and_clear(self):
+        player_size = PlayerLRUCache.size_of(Player("1", "Greg"))
+        cache = PlayerLRUCache(capacity=2, max_bytes=player_size * 10)
+        cache.put(Player("1", "Greg"))
+        cache.put(Player("2", "Tom"))
+        # Replacing a player makes it the most recently used and counts only its new size
+        cache.put(Player("1", "Gregory"))
+        self.assertEqual(cache.bytes, sum(PlayerLRUCache.size_of(player)
+                                          for player in (Player("1", "Gregory"), Player("2", "Tom"))))
+        cache.put(Player("3", "Billy"))
+        self.assertNotIn("2", cache)
+        self.assertEqual(cache.get("1").name, "Gregory")
+        cache.clear()
+        self.assertEqual((len(cache), cache.bytes), (0, 0))
+        self.assertIsNone(cache.get("1"))
+        cache.put(Player("1", "Greg"))
+        self.assertEqual(cache.get("1").name, "Greg")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import gc
+import random
+import unittest
+import weakref
+from app.player import Player
+from app.player_name_index import PlayerNameIndex
+
+class TestPlayerNameIndex(unittest.TestCase):
+    """ Unit tests for the prefix name index. Tests include:
+
+        test_insert_exact_and_delete
+        test_prefix
+        test_top_without_cache
+        test_top_cache_follows_scores
+        test_clear_and_dropped_index
+    """
+    def setUp(self):
+        self.names = ["Greg", "Gregory", "Grace", "Gretchen", "Tim", "Tom", "Billy", "Bobby", "Robby", "G"]
+        self.players = [Player(str(uid), name) for uid, name in enumerate(self.names)]
+        for score, player in zip((5, 9, 7, 1, 3, 8, 2, 6, 4, 0), self.players):
+            player.score = score
+
+    def test_insert_exact_and_delete(self):
+        index = PlayerNameIndex(self.players)
+        self.assertEqual(len(index), 10)
+        self.assertEqual(index.exact("Greg").uid, "0")
+        self.assertIsNone(index.exact("Gre"))
+        self.assertNotIn("Gregg", index)
+        index.insert(Player("new", "Greg")) # The same name replaces the player
+        self.assertEqual(index.exact("Greg").uid, "new")
+        self.assertEqual(len(index), 10)
+        index.delete("Gregory")
+        self.assertIsNone(index.exact("Gregory"))
+        self.assertNotIn("o", index._find("Greg").children) # The nodes of "ory" were pruned
+        self.assertEqual(index.exact("Greg").uid, "new")
+        with self.assertRaises(KeyError):
+            index.delete("Gregory")
+        with self.assertRaises(KeyError):
+            index.delete("Gre")
+        self.assertEqual(len(index), 9)
+
+    def test_prefix(self):
+        index = PlayerNameIndex(self.players)
+        self.assertEqual([player.name for player in index.prefix("Gr")], ["Grace", "Greg", "Gregory", "Gretchen"])
+        self.assertEqual([player.name for player in index.prefix("G", limit=3)], ["G", "Grace", "Greg"])
+        self.assertEqual([player.name for player in index.prefix("")], sorted(self.names))
+        self.assertEqual(index.prefix("X"), [])
+        self.assertEqual(index.prefix("Gr", limit=0), [])
+
+    def test_top_without_cache(self):
+        index = PlayerNameIndex(self.players)
+        self.assertEqual([player.name for player in index.top("Gr", 2)], ["Gregory", "Grace"])
+        with self.assertRaises(ValueError):
+            index.top("Gr")
+
+    def test_top_cache_follows_scores(self):
+        index = PlayerNameIndex(self.players, top_k=3)
+        self.assertEqual([player.name for player in index.top("Gr")], ["Gregory", "Grace", "Greg"])
+        self.assertEqual([player.name for player in index.top("", 2)], ["Gregory", "Tom"])
+        self.players[3].score = 10 # Gretchen
+        self.assertEqual([player.name for player in index.top("Gr")], ["Gretchen", "Gregory", "Grace"])
+        index.delete("Gregory")
+        self.assertEqual([player.name for player in index.top("Gr")], ["Gretchen", "Grace", "Greg"])
+        self.players[1].score = 50 # No longer indexed, so the caches don't change
+        self.assertEqual(index.top("", 1)[0].name, "Gretchen")
+        self.assertEqual(index.top("X"), [])
+        with self.assertRaises(ValueError):
+            index.top("Gr", 4)
+
+        # The caches agree with a heap over the whole prefix after random updates
+        rng = random.Random(4)
+        for _ in range(200):
+            rng.choice(self.players).score = rng.randrange(20)
+        uncached = PlayerNameIndex([index.exact(name) for name in self.names if name in index])
+        for prefix in ("", "G", "Gr", "Gre", "T", "B", "R"):
+            self.assertEqual(index.top(prefix), uncached.top(prefix, 3))
+
+    def test_clear_and_dropped_index(self):
+        index = PlayerNameIndex(self.players, top_k=3)
+        index.clear()
+        self.assertEqual((len(index), index.top("")), (0, []))
+        self.assertTrue(all(player._score_listeners is None for player in self.players))
+        # An index dropped without clearing is collected, and its listeners go at the next score change
+        index = PlayerNameIndex(self.players, top_k=3)
+        index_ref = weakref.ref(index)
+        del index
+        gc.collect()
+        self.assertIsNone(index_ref())
+        self.players[0].score = 100
+        self.assertIsNone(self.players[0]._score_listeners)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from app.player_hash_map import PlayerHashMap
+from app.player_map import make_player_map
+from app.player_open_hash_map import PlayerOpenHashMap
+
+class TestPlayerOpenHashMap(unittest.TestCase):
+    """ Unit tests for the open addressing hash map engine. Tests include:
+
+        test_engine_selection
+        test_add_and_retrieve_players
+        test_update_player
+        test_delete_player
+        test_probing_past_tombstones
+        test_resize
+        test_update
+        test_get_and_contains
+    """
+    def setUp(self):
+        self.hash_map = make_player_map("open_addressing")
+        self.hash_map['09724'] = 'Greg'
+        self.hash_map['67890'] = 'Tom'
+        self.hash_map['54321'] = 'Billy'
+        self.hash_map['09876'] = 'Bobby'
+        self.hash_map['11223'] = 'Simon'
+
+    def test_engine_selection(self):
+        self.assertIsInstance(self.hash_map, PlayerOpenHashMap)
+        self.assertIsInstance(make_player_map(), PlayerHashMap)
+        self.assertIsInstance(make_player_map("chaining", incremental=True), PlayerHashMap)
+        with self.assertRaises(ValueError):
+            make_player_map("cuckoo")
+        with self.assertRaises(ValueError):
+            make_player_map("open_addressing", load_factor=1.0)
+        # Chaining-only options are refused with a clear error rather than a TypeError from the constructor
+        for option in ("incremental", "rehash_step", "bloom_filter"):
+            with self.assertRaisesRegex(ValueError, option):
+                make_player_map("open_addressing", **{option: True})
+        with self.assertRaises(TypeError):
+            PlayerHashMap(engine="open_addressing")
+        hash_map = make_player_map("open_addressing", {"1": "Greg", "2": "Tom"}, capacity=4)
+        self.assertEqual(hash_map["2"].name, "Tom")
+
+    def test_add_and_retrieve_players(self):
+        self.assertEqual(self.hash_map['09724'].name, 'Greg')
+        self.assertEqual(self.hash_map['67890'].name, 'Tom')
+        self.assertEqual(self.hash_map['54321'].name, 'Billy')
+        self.assertEqual(self.hash_map['09876'].name, 'Bobby')
+        self.assertEqual(self.hash_map['11223'].name, 'Simon')
+        self.assertEqual(len(self.hash_map), 5)
+        with self.assertRaises(KeyError):
+            _ = self.hash_map['99999']
+
+    def test_update_player(self):
+        self.hash_map['09724'] = 'Gregory'
+        self.assertEqual(self.hash_map['09724'].name, 'Gregory')
+        self.assertEqual(len(self.hash_map), 5)
+
+    def test_delete_player(self):
+        del self.hash_map['67890']
+        with self.assertRaises(KeyError):
+            _ = self.hash_map['67890']
+        with self.assertRaises(KeyError):
+            del self.hash_map['67890']
+        self.assertEqual(len(self.hash_map), 4)
+
+    def test_probing_past_tombstones(self):
+        # Every key has the same home slot, so each one is found by probing past the earlier ones
+        hash_map = make_player_map("open_addressing", capacity=16, hash_function=lambda key: 0)
+        for i in range(8):
+            hash_map[f"uid{i}"] = f"Player {i}"
+        del hash_map["uid0"]
+        del hash_map["uid3"]
+        self.assertEqual(hash_map["uid7"].name, "Player 7")
+        hash_map["uid8"] = "Player 8" # Reuses a tombstone
+        hash_map["uid7"] = "Renamed"
+        self.assertEqual(hash_map["uid7"].name, "Renamed")
+        self.assertEqual(len(hash_map), 7)
+
+    def test_resize(self):
+        hash_map = make_player_map("open_addressing")
+        for i in range(1000):
+            hash_map[f"uid{i}"] = f"Player {i}"
+        for i in range(0, 1000, 2):
+            del hash_map[f"uid{i}"]
+        for i in range(1000, 1500):
+            hash_map[f"uid{i}"] = f"Player {i}"
+        self.assertEqual(len(hash_map), 1000)
+        self.assertLessEqual(len(hash_map), hash_map.capacity * hash_map.load_factor)
+        for i in range(1, 1500, 2):
+            self.assertEqual(hash_map[f"uid{i}"].name, f"Player {i}")
+
+    def test_update(self):
+        # Bulk updates rename existing players and fill the slots left by deleted ones
+        del self.hash_map['67890']
+        self.hash_map.update([('09724', 'Gregory')] + [(f"uid{i}", f"Player {i}") for i in range(100)])
+        self.assertEqual(len(self.hash_map), 104)
+        self.assertEqual(self.hash_map['09724'].name, 'Gregory')
+        self.hash_map.update({f"new{i}": f"New {i}" for i in range(100)}, assume_unique=True)
+        self.assertEqual(len(self.hash_map), 204)
+        self.assertEqual(self.hash_map['new99'].name, 'New 99')
+        self.assertEqual(self.hash_map['uid99'].name, 'Player 99')
+
+    def test_get_and_contains(self):
+        self.assertEqual(self.hash_map.get('09724').name, 'Greg')
+        self.assertEqual(self.hash_map.get('99999', 'missing'), 'missing')
+        self.assertIn('11223', self.hash_map)
+        self.assertNotIn('99999', self.hash_map)
+        self.assertEqual([player.name for player in self.hash_map.get_many(['54321', '09876'])], ['Billy', 'Bobby'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
+from unittest import mock
 from app.player import Player
+from app.player_store import PlayerStore
 
 class TestPlayerSorting(unittest.TestCase):
     def test_sort_players(self):
@@ -70,3 +72,86 @@ class TestPlayerSorting(unittest.TestCase):
 
         # The sorted list should be the same as the input list
         self.assertEqual(sorted_players, expected_order)
+
+    def test_sort_players_in_place(self):
+        players = [Player(str(uid), f"Player {uid}") for uid in range(100)]
+        for player in players:
+            player.score = int(player.uid) % 7
+        result = Player.sort_players(players)
+        self.assertIs(result, players)
+        self.assertEqual([p.score for p in players], sorted((int(p.uid) % 7 for p in players), reverse=True))
+
+    def test_sort_players_tie_break(self):
+        player1 = Player("3", "Sally")
+        player2 = Player("1", "Billy")
+        player3 = Player("2", "Bobby")
+        player4 = Player("4", "Tom")
+        player1.score = 15
+        player2.score = 15
+        player3.score = 15
+        player4.score = 20
+        players = [player1, player2, player3, player4]
+        # Players compare equal by score, so the order is checked by uid
+        by_name = Player.sorted_players(players, tie_break="name")
+        self.assertEqual([player.uid for player in by_name], ["4", "1", "2", "3"])
+        by_uid = Player.sorted_players(players, tie_break="uid")
+        self.assertEqual([player.uid for player in by_uid], ["4", "1", "2", "3"])
+        player3._player_name = "Abby"
+        by_name = Player.sorted_players(players, tie_break="name")
+        self.assertEqual([player.uid for player in by_name], ["4", "2", "1", "3"])
+        # sorted_players returns a copy and leaves the input as it was
+        self.assertEqual([player.uid for player in players], ["3", "1", "2", "4"])
+        with self.assertRaises(ValueError):
+            Player.sort_players(players, tie_break="score")
+
+    def test_top_k(self):
+        players = []
+        for uid in range(1000):
+            player = Player(str(uid), f"Player {uid}")
+            player.score = (uid * 37) % 101
+            players.append(player)
+        for tie_break in (None, "name", "uid"):
+            expected = Player.sorted_players(players, tie_break=tie_break)[:10]
+            top = Player.top_k(players, 10, tie_break=tie_break)
+            self.assertEqual([player.uid for player in top], [player.uid for player in expected])
+        self.assertEqual(Player.top_k(players, 0), [])
+        self.assertEqual(len(Player.top_k(players, 5000)), 1000)
+
+    def test_non_comparison_sorts(self):
+        # Counting and radix sorts give the same stable order as the comparison sort
+        players = []
+        for uid in range(2000):
+            player = Player(str(uid), f"Player {uid}")
+            player.score = (uid * 7919) % 70000 if uid % 3 else 42
+            players.append(player)
+        expected = [player.uid for player in Player.sorted_players(players, method="comparison")]
+        for method in ("auto", "counting", "radix"):
+            result = Player.sorted_players(players, method=method)
+            self.assertEqual([player.uid for player in result], expected)
+        with self.assertRaises(ValueError):
+            Player.sort_players(players, method="bubble")
+
+    def test_counting_sort_wide_range(self):
+        # A score range far larger than the number of players uses the radix sort rather than a bucket per score
+        players = [Player("1", "Greg"), Player("2", "Tom"), Player("3", "Simon")]
+        players[1].score = 10 ** 9
+        players[2].score = 5
+        with mock.patch.object(Player, "_counting_sort", wraps=Player._counting_sort) as counting_sort:
+            result = Player.sorted_players(players, method="counting")
+            self.assertFalse(counting_sort.called)
+            Player.sorted_players([players[0], players[2]], method="counting")
+            self.assertTrue(counting_sort.called)
+        self.assertEqual([player.uid for player in result], ["2", "3", "1"])
+
+    def test_sort_player_views(self):
+        # Player-like objects, such as the views of a PlayerStore, sort the same way as Players
+        store = PlayerStore()
+        for uid, name, score in (("1", "Greg", 10), ("2", "Tom", 30), ("3", "Billy", 10), ("4", "Bobby", 20)):
+            store.append(uid, name, score)
+        for method in Player.SORT_METHODS:
+            self.assertEqual([view.uid for view in Player.sort_players(list(store), method=method)],
+                             ["2", "4", "1", "3"])
+        self.assertEqual([view.uid for view in Player.sorted_players(store, tie_break="name")], ["2", "4", "3", "1"])
+        self.assertEqual([view.uid for view in Player.top_k(list(store), 1)], ["2"])
+        self.assertEqual([view.uid for view in Player.top_k(store, 3, tie_break="uid")], ["2", "4", "1"])
+
@@ -0,0 +1,115 @@
+import unittest
+from unittest import mock
+from app import player_store
+from app.player import Player
+from app.player_map import make_player_map
+from app.player_store import MAX_SCORE, PlayerStore
+
+class TestPlayerStore(unittest.TestCase):
+    """ Unit tests for the column store. Tests include:
+
+        test_views
+        test_add_scores
+        test_add_scores_types_and_bounds
+        test_filter_by_score
+        test_aggregates
+        test_sort_by_score
+        test_hash_map_round_trip
+    """
+    def setUp(self):
+        self.store = PlayerStore()
+        for uid, name, score in (("1", "Greg", 10), ("2", "Tom", 30), ("3", "Billy", 20), ("4", "Bobby", 10)):
+            self.store.append(uid, name, score)
+
+    def test_views(self):
+        view = self.store["2"]
+        self.assertEqual((view.uid, view.name, view.score), ("2", "Tom", 30))
+        view.score = 35
+        self.assertEqual(self.store["2"].score, 35)
+        with self.assertRaises(ValueError):
+            view.score = -1
+        with self.assertRaises(KeyError):
+            _ = self.store["99"]
+        with self.assertRaises(ValueError):
+            self.store.append("1", "Duplicate")
+        self.assertEqual([view.uid for view in self.store], ["1", "2", "3", "4"])
+        self.assertEqual(str(self.store["1"]), str(Player("1", "Greg")))
+
+    def test_add_scores(self):
+        self.store.add_scores({"1": 5, "3": -20})
+        self.store.add_scores([("4", 1), ("4", 2)])
+        self.assertEqual([view.score for view in self.store], [15, 30, 0, 13])
+        # Nothing is applied if any score would become negative
+        with self.assertRaises(ValueError):
+            self.store.add_scores({"1": 1, "3": -1})
+        self.assertEqual(self.store["1"].score, 15)
+        with self.assertRaises(KeyError):
+            self.store.add_scores({"99": 1})
+        # The store can still grow while the rejected call's error, and so its traceback, is kept
+        try:
+            self.store.add_scores({"3": -1})
+        except ValueError as error:
+            rejected = error
+        self.store.append("5", "Robby", 5)
+        self.assertIsInstance(rejected, ValueError)
+        self.assertEqual(self.store["5"].score, 5)
+
+    def test_add_scores_types_and_bounds(self):
+        class Delta:
+            """An integer type that isn't int, like NumPy's integers."""
+            def __index__(self):
+                return 3
+
+        # The NumPy and plain Python paths accept and reject the same deltas
+        for numpy in {player_store.np, None}:
+            with mock.patch.object(player_store, "np", numpy):
+                store = PlayerStore()
+                store.append("1", "Greg", 10)
+                store.append("2", "Tom", MAX_SCORE - 1)
+                store.add_scores({"1": Delta()})
+                self.assertEqual(store["1"].score, 13)
+                for deltas in ({"1": True}, {"1": 1.0}, {"1": "1"}):
+                    with self.assertRaises(ValueError):
+                        store.add_scores(deltas)
+                # Totals and resulting scores beyond 64 bits are refused rather than wrapped around
+                for deltas in ({"1": 1, "2": 2}, {"1": 2 ** 64}, [("1", MAX_SCORE), ("1", MAX_SCORE)]):
+                    with self.assertRaises(ValueError):
+                        store.add_scores(deltas)
+                self.assertEqual([view.score for view in store], [13, MAX_SCORE - 1])
+                store.add_scores({"2": 1})
+                self.assertEqual(store["2"].score, MAX_SCORE)
+
+    def test_filter_by_score(self):
+        self.assertEqual([view.uid for view in self.store.filter_by_score(min_score=15)], ["2", "3"])
+        self.assertEqual([view.uid for view in self.store.filter_by_score(max_score=10)], ["1", "4"])
+        self.assertEqual([view.uid for view in self.store.filter_by_score(11, 25)], ["3"])
+
+    def test_aggregates(self):
+        self.assertEqual(self.store.total_score(), 70)
+        self.assertEqual(self.store.mean_score(), 17.5)
+        self.assertEqual(self.store.percentile(0), 10)
+        self.assertEqual(self.store.percentile(50), 15)
+        self.assertEqual(self.store.percentile(100), 30)
+        with self.assertRaises(ValueError):
+            PlayerStore().mean_score()
+
+    def test_sort_by_score(self):
+        self.assertEqual([view.uid for view in self.store.sort_by_score()], ["2", "3", "1", "4"])
+
+    def test_hash_map_round_trip(self):
+        hash_map = self.store.to_hash_map()
+        self.assertEqual(len(hash_map), 4)
+        self.assertEqual(hash_map["2"].name, "Tom")
+        self.assertEqual(hash_map["2"].score, 30)
+        hash_map["5"] = "Simon"
+        store = PlayerStore.from_hash_map(hash_map)
+        self.assertEqual(len(store), 5)
+        self.assertEqual(store["3"].score, 20)
+        self.assertEqual(store["5"].score, 0)
+        open_map = make_player_map("open_addressing")
+        open_map["7"] = "Maddy"
+        self.assertEqual(PlayerStore.from_hash_map(open_map)["7"].name, "Maddy")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import contextlib
+import io
+import unittest
+from app.player import Player
+from app.player_unrolled_list import PlayerUnrolledList
+
+class TestPlayerUnrolledList(unittest.TestCase):
+    """ Unit tests for the unrolled player list. Tests include:
+
+        test_append_and_iterate
+        test_delete
+        test_find_and_update
+        test_display
+    """
+    def test_append_and_iterate(self):
+        player_list = PlayerUnrolledList(chunk_size=4)
+        self.assertTrue(player_list.is_empty())
+        for i in range(5, 10):
+            player_list.append_node_to_tail(Player(str(i), f"Player {i}"))
+        for i in range(4, -1, -1):
+            player_list.append_node_to_head(Player(str(i), f"Player {i}"))
+        self.assertEqual([player.uid for player in player_list], [str(i) for i in range(10)])
+        self.assertEqual([player.uid for player in reversed(player_list)], [str(i) for i in range(9, -1, -1)])
+        self.assertEqual(len(player_list), 10)
+        chunk = player_list._head
+        while chunk:
+            self.assertLessEqual(len(chunk.players), 4)
+            chunk = chunk.next_node
+
+    def test_delete(self):
+        player_list = PlayerUnrolledList(chunk_size=4)
+        for i in range(12):
+            player_list.append_node_to_tail(Player(str(i), f"Player {i}"))
+        player_list.delete_head()
+        player_list.delete_tail()
+        for uid in ("5", "6", "4", "1"):
+            player_list.delete_by_key(uid)
+        self.assertEqual([player.uid for player in player_list], ["2", "3", "7", "8", "9", "10"])
+        self.assertEqual([player.uid for player in reversed(player_list)], ["10", "9", "8", "7", "3", "2"])
+        self.assertEqual(len(player_list), 6)
+        with self.assertRaises(ValueError):
+            player_list.delete_by_key("5")
+        while not player_list.is_empty():
+            player_list.delete_tail()
+        self.assertIsNone(player_list._tail)
+        with self.assertRaises(IndexError):
+            player_list.delete_head()
+
+    def test_find_and_update(self):
+        player_list = PlayerUnrolledList()
+        self.assertTrue(player_list.add_or_update_player(Player("1", "Greg")))
+        self.assertFalse(player_list.add_or_update_player(Player("1", "Tom")))
+        self.assertEqual(player_list.get_player_by_uid("1").name, "Tom")
+        self.assertIsNone(player_list.find_player_by_uid("2"))
+        with self.assertRaises(KeyError):
+            player_list.get_player_by_uid("2")
+
+    def test_display(self):
+        player_list = PlayerUnrolledList(chunk_size=2)
+        for i in range(3):
+            player_list.append_node_to_tail(Player(str(i), f"Player {i}"))
+        expected = [
+            "  [Player: uid=0, name=Player 0, Player: uid=1, name=Player 1]   (linked node-->)   "
+            "[Player: uid=2, name=Player 2]",
+            "  [Player: uid=2, name=Player 2]   (linked node-->)   "
+            "[Player: uid=1, name=Player 1, Player: uid=0, name=Player 0]",
+            "  (No players)",
+        ]
+        for forward, lines in ((True, expected[0]), (False, expected[1])):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                player_list.display(forward=forward)
+            self.assertEqual(output.getvalue(), lines + "\n")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            PlayerUnrolledList().display()
+        self.assertEqual(output.getvalue(), expected[2] + "\n")
+
+
+if __name__ == '__main__':
+    unittest.main()